@@ -0,0 +1,58 @@
+"""
+Benchmark: one UPDATE per add() against write-combined increments.
+
+Every add() used to run its own UPDATE and COMMIT. With combine_window
+the increments of hot counters are summed in memory and written as one
+UPDATE per record.
+
+Usage:
+    python benchmarks/bench_add.py [increments]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+PAGES = 50
+
+
+def run(path: str, increments: int, **options) -> float:
+    """Return the time of increments random add() calls and the final flush() in milliseconds."""
+    db = Database(f"sqlite:///{path}", **options)
+    db.execute("UPDATE pages SET views = 0")
+    random.seed(0)
+    
+    with db:
+        start = time.perf_counter()
+        for _ in range(increments):
+            db.add('pages', {'id': random.randint(1, PAGES)}, 1, column='views')
+        db.flush()
+        elapsed = (time.perf_counter() - start) * 1000
+    
+    assert db.aggregate('pages', {'total': ('sum', 'views')})['total'] == increments
+    return elapsed
+
+
+def main(increments: int = 20000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        db = Database(f"sqlite:///{path}")
+        db.create_table('pages', {'id': 'INTEGER', 'views': 'INTEGER'})
+        db.set_many('pages', [{'views': 0} for _ in range(PAGES)])
+        
+        direct = run(path, increments)
+        combined = run(path, increments, combine_window=0.1, combine_size=5000)
+    
+    print(f"{increments} increments over {PAGES} counters")
+    print(f"  add():           {direct:8.2f} ms")
+    print(f"  combined add():  {combined:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
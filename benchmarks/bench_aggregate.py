@@ -0,0 +1,53 @@
+"""
+Benchmark: grouping get_all() rows in Python against aggregate().
+
+Reporting code used to fetch every row and sum it per group in Python.
+aggregate() sends one GROUP BY statement and only fetches the groups.
+
+Usage:
+    python benchmarks/bench_aggregate.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+from easedb import Database, logger
+
+REPEAT = 5
+
+
+def main(rows: int = 200000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('orders', {'id': 'INTEGER', 'country': 'TEXT', 'amount': 'INTEGER'})
+        db.set_many('orders', ({'country': f'C{i % 20:02}', 'amount': i % 1000} for i in range(rows)), 
+                    chunk_size=10000)
+        
+        with db:
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                totals = defaultdict(lambda: [0, 0])
+                for order in db.get_all('orders', row_format='tuple'):
+                    totals[order[1]][0] += order[2]
+                    totals[order[1]][1] += 1
+            in_python = (time.perf_counter() - start) / REPEAT * 1000
+            
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                pushed = db.aggregate('orders', {'total': ('sum', 'amount'), 'n': ('count', '*')}, 
+                                      group_by='country', row_format='tuple')
+            in_sql = (time.perf_counter() - start) / REPEAT * 1000
+    
+    assert sorted((country, total, n) for country, (total, n) in totals.items()) == pushed
+    print(f"Sum and count of {rows} rows per country")
+    print(f"  get_all() + Python: {in_python:8.2f} ms")
+    print(f"  aggregate():        {in_sql:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,54 @@
+"""
+Benchmark: concurrent single-key get() calls with and without coalescing.
+
+Simulates request handlers that each await one get() in the same event
+loop iteration. With batch_window set they share one IN query per batch.
+
+Usage:
+    python benchmarks/bench_batched_get.py [concurrency]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from easedb import AsyncDatabase, logger
+
+ROUNDS = 20
+
+
+async def bench(db: AsyncDatabase, concurrency: int) -> float:
+    """Return the mean time of one round of concurrent gets in milliseconds."""
+    start = time.perf_counter()
+    for round_number in range(ROUNDS):
+        # A tenth of the handlers ask for a key another handler also asks for
+        ids = [(round_number * concurrency + i % (concurrency - concurrency // 10)) % 10000 + 1 
+               for i in range(concurrency)]
+        await asyncio.gather(*(db.get('users', {'id': user_id}) for user_id in ids))
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+async def main(concurrency: int = 500) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        plain = AsyncDatabase(f"sqlite:///{path}")
+        await plain.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        await plain.set_many('users', ({'name': f'user{i}', 'age': i % 90} for i in range(10000)))
+        batched = AsyncDatabase(f"sqlite:///{path}", batch_window=0)
+        
+        async with plain, batched:
+            one_by_one = await bench(plain, concurrency)
+            coalesced = await bench(batched, concurrency)
+        
+        stats = batched.batcher.stats()
+        print(f"{concurrency} concurrent get() calls per round")
+        print(f"  no batching   {one_by_one:8.2f} ms/round")
+        print(f"  batch_window  {coalesced:8.2f} ms/round  ({stats['batches']} queries, {stats['shared']} shared)")
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
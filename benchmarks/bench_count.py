@@ -0,0 +1,53 @@
+"""
+Benchmark: len(get_all()) against count(), approximate counts and exists().
+
+Before count() existed on every driver, counting meant fetching and
+building every record. count() lets the database count, approximate=True
+reads the ANALYZE statistics and exists() stops at the first match.
+
+Usage:
+    python benchmarks/bench_count.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+REPEAT = 10
+
+
+def timed(function) -> float:
+    """Return the mean time of function() in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main(rows: int = 200000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('events', {'id': 'INTEGER', 'kind': 'TEXT', 'created_at': 'INTEGER'})
+        db.set_many('events', ({'kind': f'kind{i % 10}', 'created_at': i} for i in range(rows)), chunk_size=10000)
+        db.execute("ANALYZE")
+        
+        with db:
+            fetched = timed(lambda: len(db.get_all('events')))
+            counted = timed(lambda: db.count('events'))
+            estimated = timed(lambda: db.count('events', approximate=True))
+            existing = timed(lambda: db.exists('events', {'kind': 'kind3'}))
+    
+    print(f"{rows} rows")
+    print(f"  len(get_all()):            {fetched:8.3f} ms")
+    print(f"  count():                   {counted:8.3f} ms")
+    print(f"  count(approximate=True):   {estimated:8.3f} ms")
+    print(f"  exists():                  {existing:8.3f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,62 @@
+"""
+Benchmark: get_all() and writing a CSV file against the streaming export().
+
+Dumping a table used to mean loading every row into a list of dicts and
+writing them out afterwards, holding the whole result in memory. export()
+writes the rows of a streaming cursor batch by batch.
+
+Usage:
+    python benchmarks/bench_export.py [rows]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from easedb import Database, logger
+
+
+def measure(function) -> tuple:
+    """Return the milliseconds and the peak traced memory in MiB of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = (time.perf_counter() - start) * 1000
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(rows: int = 100000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        
+        with db:
+            db.set_many('users', [{'id': i, 'name': f'user{i}', 'age': i % 90} for i in range(rows)])
+            
+            def load_and_write() -> None:
+                records = db.get_all('users')
+                with open(os.path.join(tmp, 'loaded.csv'), 'w', newline='', encoding='utf-8') as file:
+                    writer = csv.DictWriter(file, fieldnames=list(records[0]))
+                    writer.writeheader()
+                    writer.writerows(records)
+            
+            loaded, loaded_peak = measure(load_and_write)
+            exported = []
+            streamed, streamed_peak = measure(
+                lambda: exported.append(db.export('users', os.path.join(tmp, 'users.csv'))))
+    
+    assert exported == [rows]
+    print(f"Export of {rows} rows to CSV")
+    print(f"  get_all() + csv: {loaded:8.2f} ms, peak {loaded_peak:6.1f} MiB")
+    print(f"  export():        {streamed:8.2f} ms, peak {streamed_peak:6.1f} MiB")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
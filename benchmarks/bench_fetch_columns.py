@@ -0,0 +1,61 @@
+"""
+Benchmark: get_all() and building NumPy arrays against fetch_columns().
+
+Analytics code used to fetch a list of dicts and convert it to arrays
+afterwards, paying for a dict per row and for the conversion.
+fetch_columns() turns each fetched batch straight into typed arrays.
+
+Usage:
+    python benchmarks/bench_fetch_columns.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from easedb import Database, logger
+
+
+def main(rows: int = 200000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('orders', {'id': 'INTEGER', 'amount': 'REAL', 'quantity': 'INTEGER'})
+        
+        with db:
+            db.set_many('orders', [{'id': i, 'amount': i * 0.5, 'quantity': i % 7} for i in range(rows)])
+            
+            start = time.perf_counter()
+            records = db.get_all('orders')
+            arrays = {column: numpy.array([record[column] for record in records]) for column in records[0]}
+            via_dicts = (time.perf_counter() - start) * 1000
+            
+            start = time.perf_counter()
+            columns = db.fetch_columns('orders')
+            columnar = (time.perf_counter() - start) * 1000
+            
+            arrow = None
+            if pyarrow is not None:
+                start = time.perf_counter()
+                db.fetch_columns('orders', format='arrow')
+                arrow = (time.perf_counter() - start) * 1000
+    
+    assert numpy.array_equal(arrays['amount'], columns['amount'])
+    print(f"Columns of {rows} rows")
+    print(f"  get_all() + numpy.array:  {via_dicts:8.2f} ms")
+    print(f"  fetch_columns():          {columnar:8.2f} ms")
+    if arrow is not None:
+        print(f"  fetch_columns('arrow'):   {arrow:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
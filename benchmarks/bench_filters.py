@@ -0,0 +1,57 @@
+"""
+Benchmark: range filter in SQL against filtering a full get_all() in Python.
+
+Before operator conditions, a range or IN filter meant reading the whole
+table and filtering in Python. With an index on the filtered column the
+database only reads the matching rows.
+
+Usage:
+    python benchmarks/bench_filters.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+REPEAT = 20
+
+
+def main(rows: int = 100000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('events', {'id': 'INTEGER', 'kind': 'TEXT', 'created_at': 'INTEGER'})
+        db.set_many('events', ({'kind': f'kind{i % 10}', 'created_at': i} for i in range(rows)), chunk_size=10000)
+        db.execute("CREATE INDEX events_created_at ON events (created_at)")
+        since = rows - rows // 100
+        ids = list(range(1, rows, rows // 2000))
+        
+        with db:
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                recent = [row for row in db.get_all('events') if row['created_at'] >= since]
+            in_python = (time.perf_counter() - start) / REPEAT * 1000
+            
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                pushed = db.get_all('events', {'created_at__gte': since})
+            in_sql = (time.perf_counter() - start) / REPEAT * 1000
+            
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                by_id = db.get_all('events', {'id__in': ids})
+            split_in = (time.perf_counter() - start) / REPEAT * 1000
+    
+    assert recent == pushed
+    print(f"{rows} rows, newest 1% by an indexed column")
+    print(f"  get_all() + filter in Python: {in_python:8.2f} ms")
+    print(f"  created_at__gte:              {in_sql:8.2f} ms")
+    print(f"  id__in with {len(by_id)} ids (split): {split_in:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,50 @@
+"""
+Benchmark: one get() per key against a single get_many() call.
+
+Resolving the ids of a result to records one get() at a time costs a
+statement execution, and on MySQL a round trip, per id. get_many() looks
+them up with one IN query per chunk of ids.
+
+Usage:
+    python benchmarks/bench_get_many.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+REPEAT = 20
+LOOKUPS = 500
+
+
+def main(rows: int = 100000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        db.set_many('users', ({'name': f'user{i}', 'age': i % 90} for i in range(rows)), chunk_size=10000)
+        ids = list(range(1, rows, rows // LOOKUPS))[:LOOKUPS]
+        
+        with db:
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                one_by_one = {user_id: db.get('users', {'id': user_id}) for user_id in ids}
+            per_key = (time.perf_counter() - start) / REPEAT * 1000
+            
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                batched = db.get_many('users', ids)
+            in_batches = (time.perf_counter() - start) / REPEAT * 1000
+    
+    assert one_by_one == batched
+    print(f"{LOOKUPS} lookups by primary key in {rows} rows")
+    print(f"  get() per key: {per_key:8.2f} ms")
+    print(f"  get_many():    {in_batches:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,48 @@
+"""
+Benchmark: import time of easedb and of its first SQLite use, in fresh interpreters.
+
+Backend packages are imported on first use of their scheme and mode, so a
+SQLite-only program no longer loads aiosqlite, mysql.connector and
+aiomysql. The eager row imports every backend, as importing the driver
+packages used to.
+
+Usage:
+    python benchmarks/bench_import.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPTS = {
+    'python -c pass':        "pass",
+    'import easedb':         "import easedb",
+    'first SQLite use':      "import easedb; easedb.Database('sqlite:///:memory:').execute('SELECT 1')",
+    'eager, all backends':   ("import easedb; import easedb.drivers.sqlite.sync, easedb.drivers.sqlite.aio, "
+                              "easedb.drivers.mysql.sync, easedb.drivers.mysql.aio"),
+}
+
+
+def timed(script: str, env: dict) -> float:
+    """Return the milliseconds a fresh interpreter takes to run a script."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', script], check=True, env=env, 
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(runs: int = 15) -> None:
+    source_root = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    env = dict(os.environ, PYTHONPATH=source_root)
+    
+    print(f"Median wall time of {runs} fresh interpreters")
+    for label, script in SCRIPTS.items():
+        timed(script, env)
+        median = statistics.median(timed(script, env) for _ in range(runs))
+        print(f"  {label + ':':22s} {median:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 15)
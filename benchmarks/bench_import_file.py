@@ -0,0 +1,55 @@
+"""
+Benchmark: parsing a CSV file and calling set() per row against import_file().
+
+Seeding a table from a dump used to mean parsing it in application code
+and inserting every row with its own statement and commit. import_file()
+streams the file and inserts it in chunked executemany transactions.
+
+Usage:
+    python benchmarks/bench_import_file.py [rows]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+
+def main(rows: int = 20000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'users.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['name', 'age'])
+            writer.writerows([f'user{i}', i % 90] for i in range(rows))
+        
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        
+        with db:
+            start = time.perf_counter()
+            with open(path, newline='', encoding='utf-8') as file:
+                for row in csv.DictReader(file):
+                    db.set('users', row)
+            per_row = (time.perf_counter() - start) * 1000
+            
+            db.execute("DELETE FROM users")
+            reports = []
+            start = time.perf_counter()
+            imported = db.import_file('users', path, chunk_size=5000, 
+                                      progress=lambda done, rate: reports.append(rate))
+            streamed = (time.perf_counter() - start) * 1000
+    
+    assert imported == rows
+    print(f"Import of {rows} CSV rows")
+    print(f"  csv + set() per row: {per_row:8.2f} ms")
+    print(f"  import_file():       {streamed:8.2f} ms ({reports[-1]:.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,50 @@
+"""
+Benchmark: LIMIT/OFFSET pages against keyset pages at increasing depth.
+
+OFFSET has to step over every skipped row, so its cost grows with the page
+number; get_page seeks on the primary key and stays flat.
+
+Usage:
+    python benchmarks/bench_keyset_pagination.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+PAGE_SIZE = 100
+REPEAT = 20
+
+
+def main(rows: int = 200000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        db.set_many('users', ({'name': f'user{i}', 'age': i % 90} for i in range(rows)), chunk_size=10000)
+        
+        print(f"{rows} rows, {PAGE_SIZE} per page")
+        print(f"  {'page':>8} {'OFFSET ms':>10} {'keyset ms':>10}")
+        with db:
+            for page in (1, 10, 100, 1000, rows // PAGE_SIZE - 1):
+                offset = (page - 1) * PAGE_SIZE
+                
+                start = time.perf_counter()
+                for _ in range(REPEAT):
+                    db.execute("SELECT * FROM users ORDER BY id LIMIT ? OFFSET ?", (PAGE_SIZE, offset))
+                by_offset = (time.perf_counter() - start) / REPEAT * 1000
+                
+                start = time.perf_counter()
+                for _ in range(REPEAT):
+                    db.get_page('users', order_by='id', after={'id': offset}, limit=PAGE_SIZE)
+                by_keyset = (time.perf_counter() - start) / REPEAT * 1000
+                
+                print(f"  {page:8} {by_offset:10.3f} {by_keyset:10.3f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,64 @@
+"""
+Benchmark: cost of hot-path logging when the messages are filtered out.
+
+Compares an eager f-string `logger.info()` against the lazy `hot_logger`
+surface and quiet hot path mode while the only handler is at WARNING, then
+measures the effect on a full `db.get()` inside a session.
+
+Usage:
+    python benchmarks/bench_logging.py [iterations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger, quiet_hot_path
+from easedb.logger import hot_logger
+
+
+def per_call(func, iterations: int) -> float:
+    """Return the mean latency of func() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int = 100000) -> None:
+    logger.remove()
+    logger.add(lambda message: None, level='WARNING')
+    
+    sql = "INSERT INTO `users` (`c0`, `c1`, ...) VALUES (?, ?, ...)"
+    row = {f'column_{i}': f'value number {i}' for i in range(20)}
+    
+    print("Filtered message:")
+    eager = per_call(lambda: logger.info(f"Executing SQL: {sql} | Data: {row}"), iterations)
+    lazy = per_call(lambda: hot_logger.info("Executing SQL: {} | Data: {}", sql, row), iterations)
+    quiet_hot_path()
+    quiet = per_call(lambda: hot_logger.info("Executing SQL: {} | Data: {}", sql, row), iterations)
+    quiet_hot_path(False)
+    print(f"  eager f-string {eager:7.3f} us")
+    print(f"  hot_logger     {lazy:7.3f} us")
+    print(f"  quiet mode     {quiet:7.3f} us")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        with db:
+            db.set_many('users', ({'name': f'user{i}', 'age': i} for i in range(100)))
+            get = lambda: db.get('users', {'id': 42})
+            iterations_db = max(iterations // 10, 1)
+            filtered = per_call(get, iterations_db)
+            quiet_hot_path()
+            quiet = per_call(get, iterations_db)
+            quiet_hot_path(False)
+        
+        print("db.get() in a session:")
+        print(f"  WARNING level  {filtered:7.2f} us")
+        print(f"  quiet mode     {quiet:7.2f} us")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,56 @@
+"""
+Benchmark: SELECT * against column projection and LIMIT pushdown.
+
+The table carries a 2 KB TEXT column. Fetching it with get_all() and
+sorting in Python is compared to asking for two columns with order_by
+and limit.
+
+Usage:
+    python benchmarks/bench_projection.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+REPEAT = 10
+
+
+def main(rows: int = 20000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('documents', {'id': 'INTEGER', 'title': 'TEXT', 'score': 'INTEGER', 'body': 'TEXT'})
+        db.set_many('documents', ({'title': f'doc{i}', 'score': (i * 7919) % rows, 'body': 'x' * 2048}
+                                  for i in range(rows)), chunk_size=5000)
+        
+        with db:
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                top = sorted(db.get_all('documents'), key=lambda row: row['score'], reverse=True)[:10]
+                top = [{'id': row['id'], 'title': row['title']} for row in top]
+            in_python = (time.perf_counter() - start) / REPEAT * 1000
+            
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                pushed = db.get_all('documents', columns=['id', 'title'], order_by='score DESC', limit=10)
+            in_sql = (time.perf_counter() - start) / REPEAT * 1000
+            
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                db.get_all('documents', columns=['id', 'title'])
+            projected = (time.perf_counter() - start) / REPEAT * 1000
+    
+    assert top == pushed
+    print(f"{rows} rows with a 2 KB body column, top 10 by score")
+    print(f"  SELECT * + sort in Python:  {in_python:8.2f} ms")
+    print(f"  columns + order_by + limit: {in_sql:8.2f} ms")
+    print(f"  all rows, two columns:      {projected:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
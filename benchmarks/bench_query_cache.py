@@ -0,0 +1,44 @@
+"""
+Benchmark: repeated get() of hot keys with and without the query cache.
+
+Usage:
+    python benchmarks/bench_query_cache.py [iterations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+
+def bench(db: Database, iterations: int) -> float:
+    """Return the mean latency of db.get() over 100 hot keys in microseconds."""
+    start = time.perf_counter()
+    for i in range(iterations):
+        db.get('users', {'id': i % 100 + 1})
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int = 20000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        plain = Database(f"sqlite:///{path}")
+        plain.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        plain.set_many('users', ({'name': f'user{i}', 'age': i} for i in range(1000)))
+        cached = Database(f"sqlite:///{path}", cache_size=1024, cache_ttl=60)
+        
+        with plain, cached:
+            uncached_latency = bench(plain, iterations)
+            cached_latency = bench(cached, iterations)
+        
+        print(f"get() of 100 hot keys, {iterations} calls")
+        print(f"  no cache   {uncached_latency:8.2f} us/call")
+        print(f"  cache      {cached_latency:8.2f} us/call  (hit rate {cached.cache.stats()['hit_rate']:.1%})")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,38 @@
+"""
+Benchmark: get_all() throughput per row format.
+
+Usage:
+    python benchmarks/bench_row_format.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+
+def main(rows: int = 200000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('events', {'id': 'INTEGER', 'name': 'TEXT', 'value': 'REAL', 'kind': 'TEXT'})
+        
+        with db:
+            db.set_many('events', ({'name': f'event{i}', 'value': i * 0.5, 'kind': 'click'} 
+                                   for i in range(rows)), chunk_size=10000)
+            
+            print(f"get_all() of {rows} rows")
+            for row_format in ('dict', 'namedtuple', 'tuple', 'columnar'):
+                elapsed = float('inf')
+                for _ in range(3):
+                    start = time.perf_counter()
+                    db.get_all('events', row_format=row_format)
+                    elapsed = min(elapsed, time.perf_counter() - start)
+                print(f"  {row_format:10} {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,48 @@
+"""
+Benchmark: per-call latency with and without a persistent session.
+
+Compares connect-per-call (the default outside a `with` block) against
+session mode, where every operation reuses the live connection.
+
+Usage:
+    python benchmarks/bench_session.py [iterations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+
+def bench(db: Database, iterations: int) -> float:
+    """Return the mean latency of db.get() in microseconds."""
+    start = time.perf_counter()
+    for i in range(iterations):
+        db.get('users', {'id': i % 100 + 1})
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int = 10000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        with db:
+            for i in range(100):
+                db.set('users', {'name': f'user{i}', 'age': i})
+        
+        per_call = bench(db, iterations)
+        with db:
+            session = bench(db, iterations)
+    
+    print(f"get() x {iterations}")
+    print(f"  connect-per-call: {per_call:8.1f} us/op")
+    print(f"  session:          {session:8.1f} us/op")
+    print(f"  speedup:          {per_call / session:8.1f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,44 @@
+"""
+Benchmark: row-by-row set() against chunked set_many().
+
+set() commits once per row, set_many() once per chunk, which on SQLite
+is the difference between one fsync per row and one per chunk.
+
+Usage:
+    python benchmarks/bench_set_many.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+
+def main(rows: int = 5000) -> None:
+    logger.remove()
+    data = [{'name': f'user{i}', 'age': i % 90} for i in range(rows)]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        
+        with db:
+            start = time.perf_counter()
+            for row in data:
+                db.set('users', row)
+            single = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            db.set_many('users', data, chunk_size=1000)
+            bulk = time.perf_counter() - start
+    
+    print(f"{rows} rows")
+    print(f"  set() per row: {rows / single:10.0f} rows/s")
+    print(f"  set_many():    {rows / bulk:10.0f} rows/s")
+    print(f"  speedup:       {single / bulk:10.1f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
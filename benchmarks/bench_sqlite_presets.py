@@ -0,0 +1,59 @@
+"""
+Benchmark: SQLite write and read throughput per pragma preset.
+
+Each preset gets its own database file. Writes use set() with one commit
+per row, which is dominated by fsync cost, and set_many() in chunks;
+reads use get() by primary key.
+
+Usage:
+    python benchmarks/bench_sqlite_presets.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+PRESETS = (None, 'durable', 'fast', 'bulk_load')
+
+
+def run(path: str, preset, rows: int) -> tuple:
+    url = f"sqlite:///{path}" + (f"?preset={preset}" if preset else '')
+    db = Database(url)
+    db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+    data = [{'name': f'user{i}', 'age': i % 90} for i in range(rows)]
+    
+    with db:
+        start = time.perf_counter()
+        for row in data[:rows // 10]:
+            db.set('users', row)
+        single = (rows // 10) / (time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        db.set_many('users', data, chunk_size=1000)
+        bulk = rows / (time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        for i in range(1, rows + 1):
+            db.get('users', {'id': i})
+        reads = rows / (time.perf_counter() - start)
+    
+    return single, bulk, reads
+
+
+def main(rows: int = 5000) -> None:
+    logger.remove()
+    
+    print(f"{rows} rows ({rows // 10} for set() per row)")
+    print(f"  {'preset':10} {'set() rows/s':>14} {'set_many rows/s':>16} {'get rows/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for preset in PRESETS:
+            path = os.path.join(tmp, f"{preset or 'default'}.db")
+            single, bulk, reads = run(path, preset, rows)
+            print(f"  {preset or 'default':10} {single:14.0f} {bulk:16.0f} {reads:12.0f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
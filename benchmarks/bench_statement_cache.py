@@ -0,0 +1,33 @@
+"""
+Benchmark: cost of building CRUD SQL with and without the statement cache.
+
+Usage:
+    python benchmarks/bench_statement_cache.py [iterations]
+"""
+
+import sys
+import timeit
+
+from easedb.drivers.statements import compile_statement
+
+
+def main(iterations: int = 200000) -> None:
+    query = {'id': 1, 'tenant_id': 7}
+    data = {'name': 'Alice', 'age': 30, 'email': 'alice@example.com'}
+    build = compile_statement.__wrapped__
+    
+    def uncached() -> None:
+        statement = build('mysql', 'update', 'users', tuple(query), tuple(data))
+        statement.params(data, query)
+    
+    def cached() -> None:
+        statement = compile_statement('mysql', 'update', 'users', tuple(query), tuple(data))
+        statement.params(data, query)
+    
+    for name, func in (('uncached', uncached), ('cached', cached)):
+        seconds = timeit.timeit(func, number=iterations)
+        print(f"  {name:9} {seconds / iterations * 1e6:6.2f} us/statement")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
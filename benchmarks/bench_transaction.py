@@ -0,0 +1,44 @@
+"""
+Benchmark: commit-per-operation writes versus one transaction.
+
+Inserts the same rows with individual set() calls, each committing on its
+own, and inside `with db.transaction():`, which commits once.
+
+Usage:
+    python benchmarks/bench_transaction.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+
+def main(rows: int = 2000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        
+        with db:
+            start = time.perf_counter()
+            for i in range(rows):
+                db.set('users', {'name': f'user{i}', 'age': i})
+            autocommit = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            with db.transaction():
+                for i in range(rows):
+                    db.set('users', {'name': f'user{i}', 'age': i})
+            grouped = time.perf_counter() - start
+    
+    print(f"{rows} inserts")
+    print(f"  commit per set() {rows / autocommit:10.0f} rows/s")
+    print(f"  db.transaction() {rows / grouped:10.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,55 @@
+"""
+Benchmark: one update()/delete() per row against update_many()/delete_many().
+
+Every update() and delete() is its own statement and commit. The bulk
+variants send the rows with executemany or chunked IN lists and commit
+once.
+
+Usage:
+    python benchmarks/bench_update_many.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+
+def main(rows: int = 5000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        db.set_many('users', ({'name': f'user{i}', 'age': 20} for i in range(rows * 2)))
+        first = [{'id': i + 1, 'age': i % 90} for i in range(rows)]
+        second = [{'id': rows + i + 1, 'age': i % 90} for i in range(rows)]
+        
+        with db:
+            start = time.perf_counter()
+            for row in first:
+                db.update('users', row)
+            per_row_update = (time.perf_counter() - start) * 1000
+            
+            start = time.perf_counter()
+            db.update_many('users', second)
+            bulk_update = (time.perf_counter() - start) * 1000
+            
+            start = time.perf_counter()
+            for row in first:
+                db.delete('users', {'id': row['id']})
+            per_row_delete = (time.perf_counter() - start) * 1000
+            
+            start = time.perf_counter()
+            db.delete_many('users', [row['id'] for row in second])
+            bulk_delete = (time.perf_counter() - start) * 1000
+        
+        print(f"{rows} rows")
+        print(f"  update() per row: {per_row_update:8.2f} ms   update_many(): {bulk_update:8.2f} ms")
+        print(f"  delete() per row: {per_row_delete:8.2f} ms   delete_many(): {bulk_delete:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
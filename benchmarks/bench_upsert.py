@@ -0,0 +1,50 @@
+"""
+Benchmark: get() followed by set() or update() against upsert_many().
+
+Syncing a feed into a table used to take a read and a write per row, each
+with its own statement and commit. upsert_many() sends one INSERT ... ON
+CONFLICT DO UPDATE per row through executemany and commits per chunk.
+
+Usage:
+    python benchmarks/bench_upsert.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from easedb import Database, logger
+
+
+def main(rows: int = 5000) -> None:
+    logger.remove()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+        db.set_many('users', ({'name': f'user{i}', 'age': i % 90} for i in range(rows // 2)))
+        # Half of the feed updates existing users, the other half is new
+        feed = [{'id': i + 1, 'name': f'user{i}', 'age': i % 90 + 1} for i in range(rows)]
+        
+        with db:
+            start = time.perf_counter()
+            for row in feed:
+                if db.get('users', {'id': row['id']}) is None:
+                    db.set('users', row)
+                else:
+                    db.update('users', {'id': row['id'], 'age': row['age']})
+            read_then_write = (time.perf_counter() - start) * 1000
+            
+            db.execute("DELETE FROM users WHERE id > ?", (rows // 2,))
+            start = time.perf_counter()
+            db.upsert_many('users', feed)
+            upserted = (time.perf_counter() - start) * 1000
+        
+        print(f"Syncing {rows} rows, half of them new")
+        print(f"  get() + set()/update(): {read_then_write:8.2f} ms")
+        print(f"  upsert_many():          {upserted:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
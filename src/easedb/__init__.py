@@ -1,5 +1,33 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base import Database
-from .async_base import AsyncDatabase
-from .logger.logger import logger, logger_config
+from .cache import QueryCache
+from .combining import WriteCombiner
+from .logger.logger import logger, logger_config, quiet_hot_path
+from .drivers.statements import statement_cache_info, clear_statement_cache
+from .drivers.transaction import TransactionError
+from .drivers.rows import ColumnarResult
+from .drivers.pagination import Page
+
+if TYPE_CHECKING:
+    from .async_base import AsyncDatabase
+    from .batching import BatchLoader
+
+# Names imported on first access, so synchronous use skips the async facade
+_LAZY = {
+    'AsyncDatabase': '.async_base',
+    'BatchLoader': '.batching',
+}
+
+__all__ = ['Database', 'AsyncDatabase', 'QueryCache', 'BatchLoader', 'WriteCombiner', 'logger', 'logger_config', 'quiet_hot_path',
+           'statement_cache_info', 'clear_statement_cache', 'TransactionError',
+           'ColumnarResult', 'Page']
 
-__all__ = ['Database', 'AsyncDatabase', 'logger', 'logger_config']
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Import the module of a lazily exported name on first access."""
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import contextvars
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from itertools import chain
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from .batching import BatchLoader, Group
+from .cache import MISSING, QueryCache
+from .combining import WriteCombiner, check_increment
+from .drivers.columns import ColumnBuilder, column_format
+from .drivers.files import (EXPORT_FORMATS, FileWriter, check_file, file_format, progress_reporter,
+                            require_pyarrow)
+from .drivers.pagination import Page
+from .drivers.rows import check_row_format
+from .drivers.statements import aggregate_options, upsert_options
 
 class AsyncDatabaseDriver(ABC):
     """Base class for all async database drivers."""
@@ -36,7 +51,7 @@ class AsyncDatabaseDriver(ABC):
     
     @abstractmethod
     async def set(self, table: str, data: Dict[str, Any]) -> bool:
-        """Insert or update a record in the database."""
+        """Insert a record into the database."""
         pass
     
     @abstractmethod
@@ -61,29 +76,69 @@ class AsyncDatabaseDriver(ABC):
         pass
 
 class AsyncDatabase:
-    """Main database interface for asynchronous operations."""
+    """
+    Main database interface for asynchronous operations.
+    
+    :param connection_string: Database URL, e.g. 'sqlite:///app.db'
+    :param cache_size: Number of get/get_all results kept in an in-process
+        read-through cache, 0 disables it. Writes made through this instance
+        invalidate the cached results of the table they touch.
+    :param cache_ttl: Seconds a cached result stays valid
+    :param batch_window: Opt-in coalescing of get() calls looking up a single
+        key: calls on the same table and column made within this many seconds
+        are answered by one IN query, and concurrent lookups of the same
+        value share one result. 0 batches the calls of one event loop
+        iteration, None disables it.
+    :param batch_size: Maximum number of values per coalesced query
+    :param combine_window: Opt-in write-combining of add() and sub(): increments
+        are summed per record and column in memory and written as one
+        UPDATE per record this many seconds after the first of them, or as
+        soon as combine_size increments are buffered. Buffered increments
+        are also written by flush() and disconnect(). None disables it.
+    :param combine_size: Number of buffered increments that triggers a flush
+    """
     
-    def __init__(self, connection_string: str):
+    def __init__(self, connection_string: str, cache_size: int = 0, cache_ttl: float = 60.0, 
+                 batch_window: Optional[float] = None, batch_size: int = 500, 
+                 combine_window: Optional[float] = None, combine_size: int = 1000):
         self.connection_string = connection_string
         self.driver = self._init_driver()
+        # True while a session is open (after connect() or inside an async with block);
+        # every operation then reuses the live connection instead of reconnecting.
+        self.keep_connection_open = False
+        self.cache = QueryCache(cache_size, cache_ttl) if cache_size else None
+        self.batcher = BatchLoader(self._load_many, batch_window, batch_size) if batch_window is not None else None
+        self.combiner = WriteCombiner(combine_window, combine_size) if combine_window is not None else None
+        # Timer flushing the combiner once its window has passed, and the flushes it started
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set['asyncio.Task[int]'] = set()
+        # Reads inside a transaction must see its uncommitted writes, so they are never batched,
+        # and increments inside one must commit or roll back with it, so they are never combined
+        self._in_transaction = contextvars.ContextVar(f'easedb_in_transaction_{id(self)}', default=False)
     
     def _init_driver(self) -> AsyncDatabaseDriver:
         """Initialize the appropriate async database driver based on the connection string."""
         if self.connection_string.startswith('sqlite'):
-            from .drivers.sqlite import AsyncSQLiteDriver
+            from .drivers.sqlite.aio import AsyncSQLiteDriver
             return AsyncSQLiteDriver(self.connection_string)
         elif self.connection_string.startswith(('mysql', 'mariadb')):
-            from .drivers.mysql import AsyncMySQLDriver
+            from .drivers.mysql.aio import AsyncMySQLDriver
             return AsyncMySQLDriver(self.connection_string)
         else:
             raise ValueError(f"Unsupported database type in connection string: {self.connection_string}")
     
     async def connect(self) -> None:
-        """Explicit async connection method"""
-        await self.driver.connect()
+        """Explicit async connection method, keeps the connection open until disconnect()"""
+        self.keep_connection_open = bool(await self.driver.connect())
     
     async def disconnect(self) -> None:
-        """Explicit async disconnection method"""
+        """Explicit async disconnection method, ends the session opened by connect()"""
+        if self.batcher is not None:
+            await self.batcher.flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self.flush()
+        self.keep_connection_open = False
         await self.driver.disconnect()
     
     async def __aenter__(self):
@@ -98,30 +153,379 @@ class AsyncDatabase:
             if exc_type is None:
                 raise  # Only re-raise if there wasn't already an exception
     
-    async def get(self, table: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        return await self.driver.get(table, query)
+    async def _cached(self, operation: str, table: str, query: Optional[Dict[str, Any]], 
+                      fetch: Callable[[], Awaitable[Any]], *extra: Any) -> Any:
+        """Serve a read from the query cache, calling fetch() and storing its result on a miss."""
+        if self.cache is None:
+            return await fetch()
+        key = self.cache.make_key(operation, table, query, *extra)
+        if key is None:
+            return await fetch()
+        value = self.cache.get(key)
+        if value is MISSING:
+            generation = self.cache.generation(table)
+            value = await fetch()
+            self.cache.put(key, table, value, generation)
+        return value
+    
+    def _invalidated(self, table: str, result: Any) -> Any:
+        """Drop the cached reads of a table after a write and pass the write's result through."""
+        if self.cache is not None:
+            self.cache.invalidate(table)
+        if self.batcher is not None:
+            self.batcher.forget(table)
+        return result
+    
+    async def _load_many(self, group: Group, values: List[Any]) -> Dict[Any, Any]:
+        """
+        Run one coalesced batch of get() lookups with get_many().
+        
+        get_many() keys records by the value the database returns, which
+        differs from the requested one when the database converts types or
+        compares case-insensitively ('42' finding 42, 'ALICE' finding
+        'Alice'). Values missing from its result are therefore looked up
+        like an unbatched get(), so a batched lookup finds the same record.
+        """
+        table, key, columns, row_format = group
+        columns = list(columns) if columns else None
+        records = await self.driver.get_many(table, values, key, columns, row_format, 
+                                             self.batcher.max_batch_size, 
+                                             keep_connection_open=self.keep_connection_open)
+        missing = [value for value in dict.fromkeys(values) if value not in records]
+        if missing:
+            found = await asyncio.gather(*(self.driver.get(table, {key: value}, row_format, columns, 
+                                                           keep_connection_open=self.keep_connection_open) 
+                                           for value in missing))
+            records.update((value, record) for value, record in zip(missing, found) if record is not None)
+        return records
+    
+    async def get(self, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+                  columns: Optional[List[str]] = None, 
+                  order_by: Union[None, str, List[str]] = None) -> Optional[Any]:
+        """
+        Retrieve a single record asynchronously.
+        
+        :param table: Name of the table
+        :param query: Dictionary of conditions identifying the record
+        :param row_format: 'dict', 'tuple' or 'namedtuple'
+        :param columns: Columns to return, all of them if omitted
+        :param order_by: Column or columns, each optionally followed by ASC or DESC,
+                         deciding which record is returned when several match
+        :return: The record in the given row format, or None if not found
+        """
+        check_row_format(row_format, single=True)
+        lookup = self.batcher.key_of(query) if self.batcher is not None and order_by is None else None
+        if lookup is not None and not self._in_transaction.get():
+            group = (table, lookup[0], tuple(columns) if columns else None, row_format)
+            fetch = lambda: self.batcher.load(group, lookup[1])
+        else:
+            fetch = lambda: self.driver.get(table, query, row_format, columns, order_by, 
+                                            keep_connection_open=self.keep_connection_open)
+        return await self._cached('get', table, query, fetch, row_format, columns, order_by)
+    
+    async def get_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                       columns: Optional[List[str]] = None, row_format: str = 'dict', 
+                       chunk_size: int = 500) -> Dict[Any, Any]:
+        """
+        Retrieve many records by key asynchronously, with one IN query per chunk of values.
+        
+        Replaces one get() call per value. Duplicate values are looked up
+        once; on SQLite a chunk never exceeds 999 values.
+        
+        :param table: Name of the table
+        :param values: Values of the key column to look up
+        :param key: Column to look the values up in, normally the primary key
+        :param columns: Columns to return, all of them if omitted
+        :param row_format: 'dict', 'tuple' or 'namedtuple'
+        :param chunk_size: Maximum number of values per query
+        :return: Dictionary of key value to record; values without a record are absent
+        """
+        check_row_format(row_format, single=True)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return await self.driver.get_many(table, values, key, columns, row_format, chunk_size, 
+                                          keep_connection_open=self.keep_connection_open)
     
     async def get_all(
         self, 
         table: str, 
         query: Optional[Dict[str, Any]] = None, 
         page: Optional[int] = None, 
-        page_size: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+        page_size: Optional[int] = None,
+        row_format: str = 'dict',
+        columns: Optional[List[str]] = None,
+        order_by: Union[None, str, List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Any:
         """
         Retrieve multiple records from the database with optional pagination.
         
+        'tuple' and 'namedtuple' skip building a dictionary per row, 'columnar'
+        returns a ColumnarResult holding one tuple of values per column.
+        columns, order_by and limit are sent to the database as the SELECT
+        list, ORDER BY and LIMIT, with quoted identifiers.
+        
         :param table: Name of the table to retrieve records from
         :param query: Optional dictionary of conditions to filter records
         :param page: Optional page number for pagination (1-indexed)
         :param page_size: Optional number of records per page
-        :return: List of records matching the query
+        :param row_format: 'dict', 'tuple', 'namedtuple' or 'columnar'
+        :param columns: Columns to return, all of them if omitted
+        :param order_by: Column or columns to sort by, each optionally followed by ASC or DESC
+        :param limit: Maximum number of records to return, not combined with page
+        :return: List of records matching the query, or a ColumnarResult
         """
-        return await self.driver.get_all(table, query, page, page_size)
+        check_row_format(row_format)
+        if limit is not None and page is not None:
+            raise ValueError("Use either limit or page and page_size, not both")
+        return await self._cached('get_all', table, query, 
+                                  lambda: self.driver.get_all(table, query, page, page_size, row_format, 
+                                                              columns, order_by, limit, 
+                                                              keep_connection_open=self.keep_connection_open), 
+                                  page, page_size, row_format, columns, order_by, limit)
+    
+    async def get_page(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                       order_by: Union[str, List[str]] = 'id', 
+                       after: Union[None, str, Dict[str, Any]] = None, limit: int = 100, 
+                       row_format: str = 'dict') -> Page:
+        """
+        Retrieve one page of records using keyset pagination asynchronously.
         
-            
+        Instead of skipping rows with OFFSET, each page continues with
+        WHERE (order_by columns) > (values of the previous page's last record),
+        so with an index on the order_by columns a deep page costs the same
+        as the first one. The order_by columns must identify a record
+        uniquely, e.g. by ending with the primary key.
+        
+        :param table: Name of the table
+        :param query: Optional dictionary of conditions to filter records
+        :param order_by: Column or columns to page by, each optionally followed by ASC or DESC
+        :param after: Continuation token or dictionary of order_by values to continue after
+        :param limit: Maximum number of records on the page
+        :param row_format: 'dict', 'tuple', 'namedtuple' or 'columnar'
+        :return: Page with the records, the next page's after values and its token
+        """
+        check_row_format(row_format)
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        return await self.driver.get_page(table, query, order_by, after, limit, row_format, 
+                                          keep_connection_open=self.keep_connection_open)
+    
+    async def iter_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                       batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over records asynchronously without loading the whole result into memory.
+        
+        Rows are fetched batch_size at a time (fetchmany on SQLite, a
+        server-side SSCursor on MySQL). The connection is held until the
+        iteration finishes or the generator is closed with aclose().
+        
+        :param table: Name of the table to retrieve records from
+        :param query: Optional dictionary of conditions to filter records
+        :param batch_size: Number of rows fetched per round
+        :return: Async generator of records matching the query
+        """
+        async for record in self.driver.iter_all(table, query, batch_size, 
+                                                 keep_connection_open=self.keep_connection_open):
+            yield record
+    
+    async def export(self, source: str, path: str, format: Optional[str] = None, 
+                     query: Optional[Dict[str, Any]] = None, 
+                     params: Optional[Union[tuple, Dict[str, Any]]] = None, batch_size: int = 1000) -> int:
+        """
+        Stream a table or the result of a SELECT statement into a file asynchronously.
+        
+        Rows are fetched batch_size at a time on a streaming cursor, and
+        each batch is written in a worker thread while the next one is
+        fetched, so the event loop never blocks on file I/O and memory use
+        stays bounded to two batches. CSV files start with a header line,
+        JSON Lines files hold one object per line and Parquet files, which
+        require pyarrow, take their column types from the data, promoted
+        across batches. A failed export removes the partial file.
+        
+        :param source: Name of a table, or a SELECT statement (anything containing whitespace)
+        :param path: Path of the file to create or overwrite
+        :param format: 'csv', 'jsonl' or 'parquet', taken from the file extension if omitted
+        :param query: Optional dictionary of conditions filtering a table
+        :param params: Parameters bound to a SELECT statement
+        :param batch_size: Number of rows fetched and written per round
+        :return: Number of rows exported
+        """
+        format = file_format(path, format, EXPORT_FORMATS)
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if format == 'parquet':
+            require_pyarrow()
+        loop = asyncio.get_running_loop()
+        writer = FileWriter(path, format)
+        batches = self.driver.iter_batches(source, query, params, batch_size, 
+                                           keep_connection_open=self.keep_connection_open)
+        pending: Optional['asyncio.Future[None]'] = None
+        failed = True
+        try:
+            async for columns, rows in batches:
+                # The previous batch was being written while this one was fetched
+                if pending is not None:
+                    await pending
+                pending = loop.run_in_executor(None, writer.write, columns, rows)
+            if pending is not None:
+                await pending
+            failed = False
+        finally:
+            if pending is not None and not pending.done():
+                await asyncio.gather(pending, return_exceptions=True)
+            await batches.aclose()
+            # A failed export removes its partial file
+            await loop.run_in_executor(None, writer.abort if failed else writer.close)
+        return writer.rows
+    
+    async def fetch_columns(self, source: str, query: Optional[Dict[str, Any]] = None, 
+                            params: Optional[Union[tuple, Dict[str, Any]]] = None, format: str = 'numpy', 
+                            batch_size: int = 10000) -> Any:
+        """
+        Fetch a table or the result of a SELECT statement column by column asynchronously.
+        
+        Rows are fetched batch_size at a time on a streaming cursor and each
+        batch is converted straight into typed column arrays, without
+        creating a dict per row. Requires numpy for 'numpy' and pyarrow for
+        'arrow'.
+        
+        :param source: Name of a table, or a SELECT statement (anything containing whitespace)
+        :param query: Optional dictionary of conditions filtering a table
+        :param params: Parameters bound to a SELECT statement
+        :param format: 'numpy' for a dict of column name -> NumPy array, 'arrow' for a pyarrow.Table
+        :param batch_size: Number of rows fetched and converted per round
+        :return: The columns of the result, in select order
+        """
+        format = column_format(format)
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        builder = ColumnBuilder(format)
+        batches = self.driver.iter_batches(source, query, params, batch_size, 
+                                           keep_connection_open=self.keep_connection_open)
+        try:
+            async for columns, rows in batches:
+                builder.append(columns, rows)
+        finally:
+            await batches.aclose()
+        return builder.result()
+    
+    async def count(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                    approximate: bool = False) -> int:
+        """
+        Count the records matching a query asynchronously, without fetching them.
+        
+        :param table: Name of the table
+        :param query: Dictionary of conditions, every record if omitted
+        :param approximate: Estimate the size of the whole table from the
+                            database statistics instead of scanning it: MySQL's
+                            information_schema.TABLES.TABLE_ROWS, or SQLite's
+                            sqlite_stat1 once ANALYZE has run. Exact for tables
+                            without statistics; cannot be combined with a query.
+        :return: Number of matching records
+        """
+        if approximate and query:
+            raise ValueError("approximate counts apply to the whole table, not to a query")
+        return await self._cached('count', table, query, 
+                                  lambda: self.driver.count(table, query, approximate, 
+                                                            keep_connection_open=self.keep_connection_open), 
+                                  approximate)
+    
+    async def exists(self, table: str, query: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check asynchronously whether any record matches a query, with SELECT 1 ... LIMIT 1.
+        
+        :param table: Name of the table
+        :param query: Dictionary of conditions, any record if omitted
+        :return: True if at least one record matches
+        """
+        return await self._cached('exists', table, query, 
+                                  lambda: self.driver.exists(table, query, keep_connection_open=self.keep_connection_open))
+    
+    async def aggregate(self, table: str, aggregates: Dict[str, Any], 
+                        where: Optional[Dict[str, Any]] = None, 
+                        group_by: Union[None, str, List[str]] = None, row_format: str = 'dict') -> Any:
+        """
+        Compute sums, averages, minimums, maximums and counts in the database asynchronously.
+        
+        Compiles to a single SELECT ... GROUP BY, so only the results leave
+        the database. Functions are 'count', 'sum', 'avg', 'min', 'max' and
+        'count_distinct'; only count accepts '*'.
+        
+        :param table: Name of the table
+        :param aggregates: Result name -> (function, column), e.g.
+                           {'total': ('sum', 'amount'), 'n': ('count', '*')}
+        :param where: Dictionary of conditions selecting the aggregated records
+        :param group_by: Column or columns to group by
+        :param row_format: 'dict', 'tuple' or 'namedtuple', or 'columnar' with group_by
+        :return: One record of aggregates, or with group_by a list holding the group
+                 columns and aggregates of every group, sorted by the group columns
+        """
+        aggregates, group_by = aggregate_options(aggregates, group_by)
+        check_row_format(row_format, single=not group_by)
+        return await self._cached('aggregate', table, where, 
+                                  lambda: self.driver.aggregate(table, aggregates, where, group_by, row_format, 
+                                                                keep_connection_open=self.keep_connection_open), 
+                                  aggregates, group_by, row_format)
+    
     async def set(self, table: str, data: Dict[str, Any]) -> bool:
-        return await self.driver.set(table, data)
+        return self._invalidated(table, await self.driver.set(table, data, keep_connection_open=self.keep_connection_open))
+    
+    async def set_many(self, table: str, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """
+        Insert multiple records in chunked transactions asynchronously.
+        
+        :param table: Name of the table
+        :param rows: Iterable of records with identical keys, may be a generator
+        :param chunk_size: Number of rows inserted per transaction
+        :return: Number of records inserted
+        """
+        return self._invalidated(table, await self.driver.set_many(table, rows, chunk_size, 
+                                                                   keep_connection_open=self.keep_connection_open))
+    
+    async def upsert(self, table: str, data: Dict[str, Any], 
+                     conflict_keys: Union[None, str, List[str]] = None, 
+                     update_columns: Union[None, str, List[str]] = None) -> bool:
+        """
+        Insert a record, or update the existing record it conflicts with asynchronously.
+        
+        Compiles to INSERT ... ON CONFLICT DO UPDATE on SQLite and to
+        INSERT ... ON DUPLICATE KEY UPDATE on MySQL, so the check and the
+        write are one atomic statement.
+        
+        :param table: Name of the table
+        :param data: Record to insert
+        :param conflict_keys: Columns of the unique key detecting an existing record, 'id' if
+                              omitted; MySQL reacts to any unique key of the table instead
+        :param update_columns: Columns overwritten on a conflict, every non-key column of data
+                               if omitted; an empty list keeps the existing record unchanged
+        :return: True if the record was inserted or updated, False otherwise
+        """
+        conflict_keys, update_columns = upsert_options(tuple(data), conflict_keys, update_columns)
+        return self._invalidated(table, await self.driver.upsert(table, data, conflict_keys, update_columns, 
+                                                                 keep_connection_open=self.keep_connection_open))
+    
+    async def upsert_many(self, table: str, rows: Iterable[Dict[str, Any]], 
+                          conflict_keys: Union[None, str, List[str]] = None, 
+                          update_columns: Union[None, str, List[str]] = None, chunk_size: int = 1000) -> int:
+        """
+        Insert or update multiple records in chunked transactions asynchronously, see upsert().
+        
+        :param table: Name of the table
+        :param rows: Iterable of records with identical keys, may be a generator
+        :param conflict_keys: Columns of the unique key detecting an existing record, 'id' if omitted
+        :param update_columns: Columns overwritten on a conflict, every non-key column if omitted
+        :param chunk_size: Number of rows upserted per statement batch and transaction
+        :return: Number of records inserted or updated
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return 0
+        conflict_keys, update_columns = upsert_options(tuple(first), conflict_keys, update_columns)
+        return self._invalidated(table, await self.driver.upsert_many(table, chain([first], rows), conflict_keys, 
+                                                                      update_columns, chunk_size, 
+                                                                      keep_connection_open=self.keep_connection_open))
     
     async def update(self, table: str, *args, **kwargs) -> bool:
         """
@@ -148,12 +552,14 @@ class AsyncDatabase:
             table = kwargs['table']
             query = kwargs['query']
             data = kwargs['data']
-            return await self.driver.update(table, query, data)
+            return self._invalidated(table, await self.driver.update(table, query, data, 
+                                                                     keep_connection_open=self.keep_connection_open))
         
         # Handle two positional arguments (query, data)
         if len(args) == 2 and isinstance(args[0], dict) and isinstance(args[1], dict):
             query, data = args
-            return await self.driver.update(table, query, data)
+            return self._invalidated(table, await self.driver.update(table, query, data, 
+                                                                     keep_connection_open=self.keep_connection_open))
         
         # Handle single dictionary style
         if len(args) == 1 and isinstance(args[0], dict):
@@ -168,13 +574,15 @@ class AsyncDatabase:
             # Remove the query key from update data
             update_data = {k: v for k, v in data.items() if k != query_key}
             
-            return await self.driver.update(table, {query_key: query_value}, update_data)
+            return self._invalidated(table, await self.driver.update(table, {query_key: query_value}, update_data, 
+                                                                     keep_connection_open=self.keep_connection_open))
         
         # Handle keyword arguments query and data
         if kwargs.get('query') and kwargs.get('data'):
             query = kwargs['query']
             data = kwargs['data']
-            return await self.driver.update(table, query, data)
+            return self._invalidated(table, await self.driver.update(table, query, data, 
+                                                                     keep_connection_open=self.keep_connection_open))
         
         # Fallback for legacy behavior
         if args or kwargs:
@@ -199,17 +607,196 @@ class AsyncDatabase:
             if not query and update_data:
                 query = {k: v for k, v in update_data.items()}
             
-            return await self.driver.update(table, query, update_data)
+            return self._invalidated(table, await self.driver.update(table, query, update_data, 
+                                                                     keep_connection_open=self.keep_connection_open))
         
         raise ValueError("Invalid arguments for update method")
 
 
     async def delete(self, table: str, query: Dict[str, Any]) -> bool:
-        return await self.driver.delete(table, query)
+        return self._invalidated(table, await self.driver.delete(table, query, keep_connection_open=self.keep_connection_open))
     
-    async def execute(self, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None) -> Any:
-        """Execute a raw SQL query asynchronously."""
-        return await self.driver.execute(query, params)
+    async def update_many(self, table: str, rows: Iterable[Dict[str, Any]], key: str = 'id', 
+                          chunk_size: int = 1000) -> int:
+        """
+        Update multiple records asynchronously, each row setting its own values.
+        
+        Every row holds the key identifying its record and the columns to
+        set. SQLite sends rows setting the same columns with executemany,
+        MySQL as one UPDATE ... CASE statement per chunk; all rows are
+        committed as one transaction.
+        
+        :param table: Name of the table
+        :param rows: Iterable of records, e.g. {'id': 7, 'age': 31}, may be a generator
+        :param key: Column identifying the record of each row
+        :param chunk_size: Number of rows sent per statement batch
+        :return: Number of records updated, 0 if the transaction was rolled back
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return self._invalidated(table, await self.driver.update_many(table, rows, key, chunk_size, 
+                                                                      keep_connection_open=self.keep_connection_open))
+    
+    async def delete_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                          chunk_size: int = 1000) -> int:
+        """
+        Delete the records whose key matches any of the values asynchronously.
+        
+        Values are deleted with one IN query per chunk, all committed as
+        one transaction; on SQLite a chunk never exceeds 999 values.
+        
+        :param table: Name of the table
+        :param values: Values of the key column to delete
+        :param key: Column the values are looked up in
+        :param chunk_size: Maximum number of values per query
+        :return: Number of records deleted, 0 if the transaction was rolled back
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return self._invalidated(table, await self.driver.delete_many(table, values, key, chunk_size, 
+                                                                      keep_connection_open=self.keep_connection_open))
+    
+    async def import_file(self, table: str, path: str, format: Optional[str] = None, chunk_size: int = 1000, 
+                          columns: Optional[List[str]] = None, 
+                          progress: Optional[Callable[[int, float], Any]] = None, 
+                          null: Optional[str] = '') -> int:
+        """
+        Stream a CSV or JSON Lines file into a table asynchronously.
+        
+        The file is read one record at a time and inserted with executemany,
+        one transaction per chunk, so memory use does not grow with its
+        size. On MySQL, CSV files are loaded with LOAD DATA LOCAL INFILE
+        when both the client and the server allow it. CSV files must start
+        with a header line naming the columns.
+        
+        :param table: Name of the table
+        :param path: Path of the file
+        :param format: 'csv' or 'jsonl', taken from the file extension if omitted
+        :param chunk_size: Number of records inserted per transaction
+        :param columns: Columns to import, every column of the file if omitted
+        :param progress: Called after each chunk with the number of records
+            imported so far and the records per second since the start
+        :param null: CSV field imported as NULL, by default the empty field
+            export() writes for NULL; None imports every field as a string
+        :return: Number of records imported; a failing chunk stops the import
+            after the chunks already committed
+        """
+        format = file_format(path, format)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        check_file(path, format, columns)
+        return self._invalidated(table, await self.driver.import_file(table, path, format, chunk_size, columns, 
+                                                                      progress_reporter(progress), null, 
+                                                                      keep_connection_open=self.keep_connection_open))
+    
+    async def add(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+                  column: str = 'value') -> bool:
+        """
+        Atomically add a value to a numeric column of the matching records asynchronously.
+        
+        The database computes column = column + value, so concurrent
+        increments are never lost. With write-combining enabled the
+        increment is buffered and True only means it was accepted.
+        
+        :param table: Name of the table
+        :param query: Dictionary specifying which record(s) to update
+        :param value: Numeric value to add to the existing value
+        :param column: Name of the column to update (default: 'value')
+        :return: True if update was successful, False otherwise
+        """
+        check_increment(query, value)
+        if self.combiner is not None and not self._in_transaction.get() and self.combiner.key_of(query) is not None:
+            if self.combiner.add(table, query, column, value):
+                await self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = asyncio.get_running_loop().call_later(self.combiner.window, self._flush_due)
+            return True
+        return self._invalidated(table, await self.driver.add(table, query, value, column, 
+                                                              keep_connection_open=self.keep_connection_open))
+    
+    async def sub(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+                  column: str = 'value') -> bool:
+        """
+        Atomically subtract a value from a numeric column of the matching records asynchronously.
+        
+        :param table: Name of the table
+        :param query: Dictionary specifying which record(s) to update
+        :param value: Numeric value to subtract from the existing value
+        :param column: Name of the column to update (default: 'value')
+        :return: True if update was successful, False otherwise
+        """
+        check_increment(query, value)
+        return await self.add(table, query, -value, column)
+    
+    def _flush_due(self) -> None:
+        """Start flushing the combiner once its window has passed."""
+        self._flush_timer = None
+        task = asyncio.ensure_future(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def flush(self) -> int:
+        """
+        Write the add() and sub() increments buffered by write-combining asynchronously.
+        
+        Each table's increments are written as one transaction, one UPDATE
+        per record and set of columns. The increments of a table whose
+        transaction is rolled back stay buffered and are retried after the
+        combine window.
+        
+        :return: Number of records updated
+        """
+        if self.combiner is None:
+            return 0
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        updated = 0
+        for table, increments in self.combiner.take().items():
+            result = await self.driver.add_many(table, increments, keep_connection_open=self.keep_connection_open)
+            if result is None:
+                # Rolled back: keep the increments for the next flush instead of losing them
+                self.combiner.restore(table, increments)
+                continue
+            updated += self._invalidated(table, result)
+        if len(self.combiner) and self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(self.combiner.window, self._flush_due)
+        return updated
+    
+    async def execute(self, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                      row_format: str = 'dict') -> Any:
+        """Execute a raw SQL query asynchronously, returning SELECT results in the given row format."""
+        check_row_format(row_format)
+        result = await self.driver.execute(query, params, row_format, keep_connection_open=self.keep_connection_open)
+        if self.cache is not None:
+            self.cache.invalidate_sql(query)
+        if self.batcher is not None:
+            self.batcher.forget_sql(query)
+        return result
+    
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """
+        Group the operations of an async with block into a single transaction.
+        
+        Per-operation commits are deferred and one COMMIT is issued when the
+        block exits. The transaction is rolled back if the block raises, or
+        with TransactionError if an operation inside it failed. Nested
+        transaction() blocks use savepoints.
+        
+        :return: Async context manager wrapping the transaction
+        """
+        token = self._in_transaction.set(True)
+        try:
+            async with self.driver.transaction(keep_connection_open=self.keep_connection_open):
+                yield
+        except BaseException:
+            # Reads inside the block may have cached rows that were rolled back
+            if self.cache is not None:
+                self.cache.clear()
+            raise
+        finally:
+            self._in_transaction.reset(token)
 
     async def create_table(self, table_name: str, columns: Dict[str, str], 
                             primary_key: str = 'id', 
@@ -228,4 +815,5 @@ class AsyncDatabase:
         return await self.driver.create_table(table_name, columns, 
                                               primary_key, 
                                               auto_increment, 
-                                              if_not_exists)
+                                              if_not_exists, 
+                                              keep_connection_open=self.keep_connection_open)
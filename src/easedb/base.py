@@ -1,5 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+import contextvars
+from contextlib import contextmanager
+from decimal import Decimal
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+import weakref
+
+from .cache import MISSING, QueryCache
+from .combining import WriteCombiner, check_increment
+from .drivers.columns import ColumnBuilder, column_format
+from .drivers.files import (EXPORT_FORMATS, FileWriter, check_file, file_format, progress_reporter,
+                            require_pyarrow)
+from .drivers.pagination import Page
+from .drivers.rows import check_row_format
+from .drivers.statements import aggregate_options, upsert_options
 
 class DatabaseDriver(ABC):
     """Base class for all database drivers."""
@@ -26,7 +40,7 @@ class DatabaseDriver(ABC):
     
     @abstractmethod
     def set(self, table: str, data: Dict[str, Any]) -> bool:
-        """Insert or update a record in the database."""
+        """Insert a record into the database."""
         pass
     
     @abstractmethod
@@ -50,30 +64,80 @@ class DatabaseDriver(ABC):
         """Create a table with specified columns."""
         pass
 
+def _write_combined(combiner: WriteCombiner, driver: DatabaseDriver, 
+                    keep_connection_open: bool = False) -> Dict[str, int]:
+    """
+    Write the increments buffered by a combiner, one add_many() transaction per table.
+    
+    The increments of a table whose transaction is rolled back are put
+    back into the combiner. Takes no Database, so it can also run as the
+    finalizer of one that is being garbage-collected.
+    
+    :return: Number of records updated per table written
+    """
+    written = {}
+    for table, increments in combiner.take().items():
+        result = driver.add_many(table, increments, keep_connection_open=keep_connection_open)
+        if result is None:
+            # Rolled back: keep the increments for the next flush instead of losing them
+            combiner.restore(table, increments)
+            continue
+        written[table] = result
+    return written
+
 class Database:
-    """Main database interface for synchronous operations."""
+    """
+    Main database interface for synchronous operations.
     
-    def __init__(self, connection_string: str):
+    :param connection_string: Database URL, e.g. 'sqlite:///app.db'
+    :param cache_size: Number of get/get_all results kept in an in-process
+        read-through cache, 0 disables it. Writes made through this instance
+        invalidate the cached results of the table they touch.
+    :param cache_ttl: Seconds a cached result stays valid
+    :param combine_window: Opt-in write-combining of add() and sub(): increments
+        are summed per record and column in memory and written as one
+        UPDATE per record once the oldest is this many seconds old, checked
+        on every add(), or combine_size increments are buffered. There is no
+        background timer: buffered increments are otherwise only written by
+        flush(), disconnect(), and when the Database is garbage-collected or
+        the interpreter exits. None disables it.
+    :param combine_size: Number of buffered increments that triggers a flush
+    """
+    
+    def __init__(self, connection_string: str, cache_size: int = 0, cache_ttl: float = 60.0, 
+                 combine_window: Optional[float] = None, combine_size: int = 1000):
         self.connection_string = connection_string
         self.driver = self._init_driver()
+        # True while a session is open (after connect() or inside a with block);
+        # every operation then reuses the live connection instead of reconnecting.
+        self.keep_connection_open = False
+        self.cache = QueryCache(cache_size, cache_ttl) if cache_size else None
+        self.combiner = WriteCombiner(combine_window, combine_size) if combine_window is not None else None
+        if self.combiner is not None:
+            # Writes what is still buffered when this instance is collected or the interpreter exits
+            self._finalizer = weakref.finalize(self, _write_combined, self.combiner, self.driver)
+        # Increments inside a transaction must commit or roll back with it, so they are never combined
+        self._in_transaction = contextvars.ContextVar(f'easedb_in_transaction_{id(self)}', default=False)
     
     def _init_driver(self) -> DatabaseDriver:
         """Initialize the appropriate database driver based on the connection string."""
         if self.connection_string.startswith('sqlite'):
-            from .drivers.sqlite import SQLiteDriver
+            from .drivers.sqlite.sync import SQLiteDriver
             return SQLiteDriver(self.connection_string)
         elif self.connection_string.startswith(('mysql', 'mariadb')):
-            from .drivers.mysql import MySQLDriver
+            from .drivers.mysql.sync import MySQLDriver
             return MySQLDriver(self.connection_string)
         else:
             raise ValueError(f"Unsupported database type in connection string: {self.connection_string}")
     
     def connect(self) -> None:
-        """Explicit connection method"""
-        self.driver.connect()
+        """Explicit connection method, keeps the connection open until disconnect()"""
+        self.keep_connection_open = bool(self.driver.connect())
     
     def disconnect(self) -> None:
-        """Explicit disconnection method"""
+        """Explicit disconnection method, ends the session opened by connect()"""
+        self.flush()
+        self.keep_connection_open = False
         self.driver.disconnect()
     
     def __enter__(self):
@@ -88,14 +152,322 @@ class Database:
             if exc_type is None:
                 raise  # Only re-raise if there wasn't already an exception
     
-    def get(self, table: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        return self.driver.get(table, query)
+    def _cached(self, operation: str, table: str, query: Optional[Dict[str, Any]], 
+                fetch: Callable[[], Any], *extra: Any) -> Any:
+        """Serve a read from the query cache, calling fetch() and storing its result on a miss."""
+        if self.cache is None:
+            return fetch()
+        key = self.cache.make_key(operation, table, query, *extra)
+        if key is None:
+            return fetch()
+        value = self.cache.get(key)
+        if value is MISSING:
+            generation = self.cache.generation(table)
+            value = fetch()
+            self.cache.put(key, table, value, generation)
+        return value
     
-    def get_all(self, table: str, query: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        return self.driver.get_all(table, query)
+    def _invalidated(self, table: str, result: Any) -> Any:
+        """Drop the cached reads of a table after a write and pass the write's result through."""
+        if self.cache is not None:
+            self.cache.invalidate(table)
+        return result
+    
+    def get(self, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+            columns: Optional[List[str]] = None, 
+            order_by: Union[None, str, List[str]] = None) -> Optional[Any]:
+        """
+        Retrieve a single record.
+        
+        :param table: Name of the table
+        :param query: Dictionary of conditions identifying the record
+        :param row_format: 'dict', 'tuple' or 'namedtuple'
+        :param columns: Columns to return, all of them if omitted
+        :param order_by: Column or columns, each optionally followed by ASC or DESC,
+                         deciding which record is returned when several match
+        :return: The record in the given row format, or None if not found
+        """
+        check_row_format(row_format, single=True)
+        return self._cached('get', table, query, 
+                            lambda: self.driver.get(table, query, row_format, columns, order_by, 
+                                                    keep_connection_open=self.keep_connection_open), 
+                            row_format, columns, order_by)
+    
+    def get_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                 columns: Optional[List[str]] = None, row_format: str = 'dict', 
+                 chunk_size: int = 500) -> Dict[Any, Any]:
+        """
+        Retrieve many records by key, with one IN query per chunk of values.
+        
+        Replaces one get() call per value. Duplicate values are looked up
+        once; on SQLite a chunk never exceeds 999 values.
+        
+        :param table: Name of the table
+        :param values: Values of the key column to look up
+        :param key: Column to look the values up in, normally the primary key
+        :param columns: Columns to return, all of them if omitted
+        :param row_format: 'dict', 'tuple' or 'namedtuple'
+        :param chunk_size: Maximum number of values per query
+        :return: Dictionary of key value to record; values without a record are absent
+        """
+        check_row_format(row_format, single=True)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return self.driver.get_many(table, values, key, columns, row_format, chunk_size, 
+                                    keep_connection_open=self.keep_connection_open)
+    
+    def get_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                row_format: str = 'dict', columns: Optional[List[str]] = None, 
+                order_by: Union[None, str, List[str]] = None, limit: Optional[int] = None) -> Any:
+        """
+        Retrieve multiple records.
+        
+        'tuple' and 'namedtuple' skip building a dictionary per row, 'columnar'
+        returns a ColumnarResult holding one tuple of values per column.
+        columns, order_by and limit are sent to the database as the SELECT
+        list, ORDER BY and LIMIT, with quoted identifiers.
+        
+        :param table: Name of the table
+        :param query: Optional dictionary of conditions to filter records
+        :param row_format: 'dict', 'tuple', 'namedtuple' or 'columnar'
+        :param columns: Columns to return, all of them if omitted
+        :param order_by: Column or columns to sort by, each optionally followed by ASC or DESC
+        :param limit: Maximum number of records to return
+        :return: List of records in the given row format, or a ColumnarResult
+        """
+        check_row_format(row_format)
+        return self._cached('get_all', table, query, 
+                            lambda: self.driver.get_all(table, query, row_format, columns, order_by, limit, 
+                                                        keep_connection_open=self.keep_connection_open), 
+                            row_format, columns, order_by, limit)
+    
+    def get_page(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                 order_by: Union[str, List[str]] = 'id', 
+                 after: Union[None, str, Dict[str, Any]] = None, limit: int = 100, 
+                 row_format: str = 'dict') -> Page:
+        """
+        Retrieve one page of records using keyset pagination.
+        
+        Instead of skipping rows with OFFSET, each page continues with
+        WHERE (order_by columns) > (values of the previous page's last record),
+        so with an index on the order_by columns a deep page costs the same
+        as the first one. The order_by columns must identify a record
+        uniquely, e.g. by ending with the primary key.
+        
+        :param table: Name of the table
+        :param query: Optional dictionary of conditions to filter records
+        :param order_by: Column or columns to page by, each optionally followed by ASC or DESC
+        :param after: Continuation token or dictionary of order_by values to continue after
+        :param limit: Maximum number of records on the page
+        :param row_format: 'dict', 'tuple', 'namedtuple' or 'columnar'
+        :return: Page with the records, the next page's after values and its token
+        """
+        check_row_format(row_format)
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        return self.driver.get_page(table, query, order_by, after, limit, row_format, 
+                                    keep_connection_open=self.keep_connection_open)
+    
+    def iter_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                 batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over records without loading the whole result into memory.
+        
+        Rows are fetched batch_size at a time (fetchmany on SQLite, an
+        unbuffered server-side cursor on MySQL). The connection is held until
+        the iteration finishes or the generator is closed.
+        
+        :param table: Name of the table to retrieve records from
+        :param query: Optional dictionary of conditions to filter records
+        :param batch_size: Number of rows fetched per round
+        :return: Generator of records matching the query
+        """
+        yield from self.driver.iter_all(table, query, batch_size, 
+                                        keep_connection_open=self.keep_connection_open)
+    
+    def export(self, source: str, path: str, format: Optional[str] = None, 
+               query: Optional[Dict[str, Any]] = None, 
+               params: Optional[Union[tuple, Dict[str, Any]]] = None, batch_size: int = 1000) -> int:
+        """
+        Stream a table or the result of a SELECT statement into a file.
+        
+        Rows are fetched and written batch_size at a time on a streaming
+        cursor, so memory use does not grow with the size of the result.
+        CSV files start with a header line, JSON Lines files hold one object
+        per line and Parquet files, which require pyarrow, take their
+        column types from the data, promoted across batches. A failed
+        export removes the partial file.
+        
+        :param source: Name of a table, or a SELECT statement (anything containing whitespace)
+        :param path: Path of the file to create or overwrite
+        :param format: 'csv', 'jsonl' or 'parquet', taken from the file extension if omitted
+        :param query: Optional dictionary of conditions filtering a table
+        :param params: Parameters bound to a SELECT statement
+        :param batch_size: Number of rows fetched and written per round
+        :return: Number of rows exported
+        """
+        format = file_format(path, format, EXPORT_FORMATS)
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if format == 'parquet':
+            require_pyarrow()
+        batches = self.driver.iter_batches(source, query, params, batch_size, 
+                                           keep_connection_open=self.keep_connection_open)
+        try:
+            with FileWriter(path, format) as writer:
+                for columns, rows in batches:
+                    writer.write(columns, rows)
+        finally:
+            batches.close()
+        return writer.rows
+    
+    def fetch_columns(self, source: str, query: Optional[Dict[str, Any]] = None, 
+                      params: Optional[Union[tuple, Dict[str, Any]]] = None, format: str = 'numpy', 
+                      batch_size: int = 10000) -> Any:
+        """
+        Fetch a table or the result of a SELECT statement column by column.
+        
+        Rows are fetched batch_size at a time on a streaming cursor and each
+        batch is converted straight into typed column arrays, without
+        creating a dict per row. Requires numpy for 'numpy' and pyarrow for
+        'arrow'.
+        
+        :param source: Name of a table, or a SELECT statement (anything containing whitespace)
+        :param query: Optional dictionary of conditions filtering a table
+        :param params: Parameters bound to a SELECT statement
+        :param format: 'numpy' for a dict of column name -> NumPy array, 'arrow' for a pyarrow.Table
+        :param batch_size: Number of rows fetched and converted per round
+        :return: The columns of the result, in select order
+        """
+        format = column_format(format)
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        builder = ColumnBuilder(format)
+        batches = self.driver.iter_batches(source, query, params, batch_size, 
+                                           keep_connection_open=self.keep_connection_open)
+        try:
+            for columns, rows in batches:
+                builder.append(columns, rows)
+        finally:
+            batches.close()
+        return builder.result()
+    
+    def count(self, table: str, query: Optional[Dict[str, Any]] = None, 
+              approximate: bool = False) -> int:
+        """
+        Count the records matching a query, without fetching them.
+        
+        :param table: Name of the table
+        :param query: Dictionary of conditions, every record if omitted
+        :param approximate: Estimate the size of the whole table from the
+                            database statistics instead of scanning it: MySQL's
+                            information_schema.TABLES.TABLE_ROWS, or SQLite's
+                            sqlite_stat1 once ANALYZE has run. Exact for tables
+                            without statistics; cannot be combined with a query.
+        :return: Number of matching records
+        """
+        if approximate and query:
+            raise ValueError("approximate counts apply to the whole table, not to a query")
+        return self._cached('count', table, query, 
+                            lambda: self.driver.count(table, query, approximate, 
+                                                      keep_connection_open=self.keep_connection_open), 
+                            approximate)
+    
+    def exists(self, table: str, query: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether any record matches a query, with SELECT 1 ... LIMIT 1.
+        
+        :param table: Name of the table
+        :param query: Dictionary of conditions, any record if omitted
+        :return: True if at least one record matches
+        """
+        return self._cached('exists', table, query, 
+                            lambda: self.driver.exists(table, query, keep_connection_open=self.keep_connection_open))
+    
+    def aggregate(self, table: str, aggregates: Dict[str, Any], 
+                  where: Optional[Dict[str, Any]] = None, 
+                  group_by: Union[None, str, List[str]] = None, row_format: str = 'dict') -> Any:
+        """
+        Compute sums, averages, minimums, maximums and counts in the database.
+        
+        Compiles to a single SELECT ... GROUP BY, so only the results leave
+        the database. Functions are 'count', 'sum', 'avg', 'min', 'max' and
+        'count_distinct'; only count accepts '*'.
+        
+        :param table: Name of the table
+        :param aggregates: Result name -> (function, column), e.g.
+                           {'total': ('sum', 'amount'), 'n': ('count', '*')}
+        :param where: Dictionary of conditions selecting the aggregated records
+        :param group_by: Column or columns to group by
+        :param row_format: 'dict', 'tuple' or 'namedtuple', or 'columnar' with group_by
+        :return: One record of aggregates, or with group_by a list holding the group
+                 columns and aggregates of every group, sorted by the group columns
+        """
+        aggregates, group_by = aggregate_options(aggregates, group_by)
+        check_row_format(row_format, single=not group_by)
+        return self._cached('aggregate', table, where, 
+                            lambda: self.driver.aggregate(table, aggregates, where, group_by, row_format, 
+                                                          keep_connection_open=self.keep_connection_open), 
+                            aggregates, group_by, row_format)
     
     def set(self, table: str, data: Dict[str, Any]) -> bool:
-        return self.driver.set(table, data)
+        return self._invalidated(table, self.driver.set(table, data, keep_connection_open=self.keep_connection_open))
+    
+    def set_many(self, table: str, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """
+        Insert multiple records in chunked transactions.
+        
+        :param table: Name of the table
+        :param rows: Iterable of records with identical keys, may be a generator
+        :param chunk_size: Number of rows inserted per transaction
+        :return: Number of records inserted
+        """
+        return self._invalidated(table, self.driver.set_many(table, rows, chunk_size, 
+                                                             keep_connection_open=self.keep_connection_open))
+    
+    def upsert(self, table: str, data: Dict[str, Any], 
+               conflict_keys: Union[None, str, List[str]] = None, 
+               update_columns: Union[None, str, List[str]] = None) -> bool:
+        """
+        Insert a record, or update the existing record it conflicts with.
+        
+        Compiles to INSERT ... ON CONFLICT DO UPDATE on SQLite and to
+        INSERT ... ON DUPLICATE KEY UPDATE on MySQL, so the check and the
+        write are one atomic statement.
+        
+        :param table: Name of the table
+        :param data: Record to insert
+        :param conflict_keys: Columns of the unique key detecting an existing record, 'id' if
+                              omitted; MySQL reacts to any unique key of the table instead
+        :param update_columns: Columns overwritten on a conflict, every non-key column of data
+                               if omitted; an empty list keeps the existing record unchanged
+        :return: True if the record was inserted or updated, False otherwise
+        """
+        conflict_keys, update_columns = upsert_options(tuple(data), conflict_keys, update_columns)
+        return self._invalidated(table, self.driver.upsert(table, data, conflict_keys, update_columns, 
+                                                           keep_connection_open=self.keep_connection_open))
+    
+    def upsert_many(self, table: str, rows: Iterable[Dict[str, Any]], 
+                    conflict_keys: Union[None, str, List[str]] = None, 
+                    update_columns: Union[None, str, List[str]] = None, chunk_size: int = 1000) -> int:
+        """
+        Insert or update multiple records in chunked transactions, see upsert().
+        
+        :param table: Name of the table
+        :param rows: Iterable of records with identical keys, may be a generator
+        :param conflict_keys: Columns of the unique key detecting an existing record, 'id' if omitted
+        :param update_columns: Columns overwritten on a conflict, every non-key column if omitted
+        :param chunk_size: Number of rows upserted per statement batch and transaction
+        :return: Number of records inserted or updated
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return 0
+        conflict_keys, update_columns = upsert_options(tuple(first), conflict_keys, update_columns)
+        return self._invalidated(table, self.driver.upsert_many(table, chain([first], rows), conflict_keys, 
+                                                                update_columns, chunk_size, 
+                                                                keep_connection_open=self.keep_connection_open))
     
     def update(self, table: str, data: Union[Dict[str, Any], Any] = None, **kwargs) -> bool:
         """
@@ -130,14 +502,169 @@ class Database:
         if not query and update_data:
             query = {k: v for k, v in update_data.items()}
         
-        return self.driver.update(table, query, update_data)
+        return self._invalidated(table, self.driver.update(table, query, update_data, 
+                                                           keep_connection_open=self.keep_connection_open))
     
     def delete(self, table: str, query: Dict[str, Any]) -> bool:
-        return self.driver.delete(table, query)
+        return self._invalidated(table, self.driver.delete(table, query, keep_connection_open=self.keep_connection_open))
     
-    def execute(self, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None) -> Any:
-        """Execute a raw SQL query."""
-        return self.driver.execute(query, params)
+    def update_many(self, table: str, rows: Iterable[Dict[str, Any]], key: str = 'id', 
+                    chunk_size: int = 1000) -> int:
+        """
+        Update multiple records, each row setting its own values.
+        
+        Every row holds the key identifying its record and the columns to
+        set. SQLite sends rows setting the same columns with executemany,
+        MySQL as one UPDATE ... CASE statement per chunk; all rows are
+        committed as one transaction.
+        
+        :param table: Name of the table
+        :param rows: Iterable of records, e.g. {'id': 7, 'age': 31}, may be a generator
+        :param key: Column identifying the record of each row
+        :param chunk_size: Number of rows sent per statement batch
+        :return: Number of records updated, 0 if the transaction was rolled back
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return self._invalidated(table, self.driver.update_many(table, rows, key, chunk_size, 
+                                                                keep_connection_open=self.keep_connection_open))
+    
+    def delete_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                    chunk_size: int = 1000) -> int:
+        """
+        Delete the records whose key matches any of the values.
+        
+        Values are deleted with one IN query per chunk, all committed as
+        one transaction; on SQLite a chunk never exceeds 999 values.
+        
+        :param table: Name of the table
+        :param values: Values of the key column to delete
+        :param key: Column the values are looked up in
+        :param chunk_size: Maximum number of values per query
+        :return: Number of records deleted, 0 if the transaction was rolled back
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return self._invalidated(table, self.driver.delete_many(table, values, key, chunk_size, 
+                                                                keep_connection_open=self.keep_connection_open))
+    
+    def import_file(self, table: str, path: str, format: Optional[str] = None, chunk_size: int = 1000, 
+                    columns: Optional[List[str]] = None, 
+                    progress: Optional[Callable[[int, float], Any]] = None, 
+                    null: Optional[str] = '') -> int:
+        """
+        Stream a CSV or JSON Lines file into a table.
+        
+        The file is read one record at a time and inserted with executemany,
+        one transaction per chunk, so memory use does not grow with its
+        size. On MySQL, CSV files are loaded with LOAD DATA LOCAL INFILE
+        when both the client and the server allow it. CSV files must start
+        with a header line naming the columns.
+        
+        :param table: Name of the table
+        :param path: Path of the file
+        :param format: 'csv' or 'jsonl', taken from the file extension if omitted
+        :param chunk_size: Number of records inserted per transaction
+        :param columns: Columns to import, every column of the file if omitted
+        :param progress: Called after each chunk with the number of records
+            imported so far and the records per second since the start
+        :param null: CSV field imported as NULL, by default the empty field
+            export() writes for NULL; None imports every field as a string
+        :return: Number of records imported; a failing chunk stops the import
+            after the chunks already committed
+        """
+        format = file_format(path, format)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        check_file(path, format, columns)
+        return self._invalidated(table, self.driver.import_file(table, path, format, chunk_size, columns, 
+                                                                progress_reporter(progress), null, 
+                                                                keep_connection_open=self.keep_connection_open))
+    
+    def add(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+            column: str = 'value') -> bool:
+        """
+        Atomically add a value to a numeric column of the matching records.
+        
+        The database computes column = column + value, so concurrent
+        increments are never lost. With write-combining enabled the
+        increment is buffered and True only means it was accepted.
+        
+        :param table: Name of the table
+        :param query: Dictionary specifying which record(s) to update
+        :param value: Numeric value to add to the existing value
+        :param column: Name of the column to update (default: 'value')
+        :return: True if update was successful, False otherwise
+        """
+        check_increment(query, value)
+        if self.combiner is not None and not self._in_transaction.get() and self.combiner.key_of(query) is not None:
+            if self.combiner.add(table, query, column, value):
+                self.flush()
+            return True
+        return self._invalidated(table, self.driver.add(table, query, value, column, 
+                                                        keep_connection_open=self.keep_connection_open))
+    
+    def sub(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+            column: str = 'value') -> bool:
+        """
+        Atomically subtract a value from a numeric column of the matching records.
+        
+        :param table: Name of the table
+        :param query: Dictionary specifying which record(s) to update
+        :param value: Numeric value to subtract from the existing value
+        :param column: Name of the column to update (default: 'value')
+        :return: True if update was successful, False otherwise
+        """
+        check_increment(query, value)
+        return self.add(table, query, -value, column)
+    
+    def flush(self) -> int:
+        """
+        Write the add() and sub() increments buffered by write-combining.
+        
+        Each table's increments are written as one transaction, one UPDATE
+        per record and set of columns. The increments of a table whose
+        transaction is rolled back stay buffered for the next flush.
+        
+        :return: Number of records updated
+        """
+        if self.combiner is None:
+            return 0
+        written = _write_combined(self.combiner, self.driver, self.keep_connection_open)
+        return sum(self._invalidated(table, updated) for table, updated in written.items())
+    
+    def execute(self, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                row_format: str = 'dict') -> Any:
+        """Execute a raw SQL query, returning SELECT results in the given row format."""
+        check_row_format(row_format)
+        result = self.driver.execute(query, params, row_format, keep_connection_open=self.keep_connection_open)
+        if self.cache is not None:
+            self.cache.invalidate_sql(query)
+        return result
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group the operations of a with block into a single transaction.
+        
+        Per-operation commits are deferred and one COMMIT is issued when the
+        block exits. The transaction is rolled back if the block raises, or
+        with TransactionError if an operation inside it failed. Nested
+        transaction() blocks use savepoints.
+        
+        :return: Context manager wrapping the transaction
+        """
+        token = self._in_transaction.set(True)
+        try:
+            with self.driver.transaction(keep_connection_open=self.keep_connection_open):
+                yield
+        except BaseException:
+            # Reads inside the block may have cached rows that were rolled back
+            if self.cache is not None:
+                self.cache.clear()
+            raise
+        finally:
+            self._in_transaction.reset(token)
 
     def create_table(self, table_name: str, columns: Dict[str, str], 
                    primary_key: str = 'id', 
@@ -156,4 +683,5 @@ class Database:
         return self.driver.create_table(table_name, columns, 
                                         primary_key, 
                                         auto_increment, 
-                                        if_not_exists)
+                                        if_not_exists, 
+                                        keep_connection_open=self.keep_connection_open)
@@ -0,0 +1,144 @@
+"""Coalescing of concurrent single-key reads into batched lookups."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from .cache import copy_result, normalize_table, written_tables
+from .drivers.filters import is_plain
+
+# (table, key column, columns, row_format): reads of one group can share a query
+Group = Tuple[str, str, Optional[Tuple[str, ...]], str]
+
+# Loads the records of a group's values, as returned by get_many()
+LoadMany = Callable[[Group, List[Any]], Awaitable[Dict[Any, Any]]]
+
+class BatchLoader:
+    """
+    DataLoader-style batching of single-key get() calls.
+
+    Lookups of the same table, column, projection and row format made
+    within window seconds are answered by one IN query. Concurrent lookups
+    of the same value, pending or already in flight, share one result.
+
+    :param load_many: Coroutine function loading a group's values in one call
+    :param window: Seconds to collect lookups; 0 collects those of one event loop iteration
+    :param max_batch_size: A batch is dispatched at once when it reaches this many values
+    """
+
+    def __init__(self, load_many: LoadMany, window: float = 0.0, max_batch_size: int = 500):
+        if window < 0:
+            raise ValueError("Batch window must not be negative")
+        if max_batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+
+        self.load_many = load_many
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        # (group, value) -> future of its record, until the batch holding it resolves
+        self._futures: Dict[Tuple[Group, Hashable], 'asyncio.Future[Any]'] = {}
+        # group -> (values waiting for dispatch, timer dispatching them)
+        self._pending: Dict[Group, Tuple[List[Any], asyncio.Handle]] = {}
+        # Strong references to running batches, which the event loop only keeps weakly
+        self._tasks: Set['asyncio.Task[None]'] = set()
+        self.loads = 0
+        self.batches = 0
+        self.shared = 0
+
+    @staticmethod
+    def key_of(query: Optional[Dict[str, Any]]) -> Optional[Tuple[str, Hashable]]:
+        """Return (column, value) of a query looking up a single key, or None if it cannot be batched."""
+        if not query or len(query) != 1 or not is_plain(query):
+            return None
+        column, value = next(iter(query.items()))
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        return column, value
+
+    async def load(self, group: Group, value: Hashable) -> Any:
+        """Return the record of a value, or None, once the batch holding it has run."""
+        self.loads += 1
+        future = self._futures.get((group, value))
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[(group, value)] = loop.create_future()
+            if group in self._pending:
+                values = self._pending[group][0]
+            else:
+                values = []
+                timer = (loop.call_later(self.window, self._dispatch, group) if self.window
+                         else loop.call_soon(self._dispatch, group))
+                self._pending[group] = (values, timer)
+            values.append(value)
+            if len(values) >= self.max_batch_size:
+                self._dispatch(group)
+        else:
+            self.shared += 1
+        # Shielded so a cancelled caller does not cancel the lookup of the others sharing it
+        return copy_result(await asyncio.shield(future))
+
+    def _dispatch(self, group: Group) -> None:
+        """Start the query of a group's pending values."""
+        values, timer = self._pending.pop(group)
+        timer.cancel()
+        self.batches += 1
+        futures = [self._futures[(group, value)] for value in values]
+        task = asyncio.ensure_future(self._run(group, values, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, group: Group, values: List[Any], futures: List['asyncio.Future[Any]']) -> None:
+        """Load a batch and resolve the future of each of its values."""
+        try:
+            records = await self.load_many(group, values)
+        except BaseException as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            for value, future in zip(values, futures):
+                if not future.done():
+                    future.set_result(records.get(value))
+        finally:
+            for value, future in zip(values, futures):
+                # forget() may already have replaced the entry with a newer lookup
+                if self._futures.get((group, value)) is future:
+                    del self._futures[(group, value)]
+
+    def forget(self, table: Optional[str] = None) -> None:
+        """Stop sharing the in-flight lookups of a table, or of every table, so reads after a write query again."""
+        table = normalize_table(table) if table is not None else None
+        for group, value in [entry for entry in self._futures
+                             if table is None or normalize_table(entry[0][0]) == table]:
+            # Pending lookups have not queried yet, so they already see the write
+            if group not in self._pending or value not in self._pending[group][0]:
+                del self._futures[(group, value)]
+
+    def forget_sql(self, sql: str) -> None:
+        """Stop sharing the in-flight lookups of the tables a raw SQL statement may write to."""
+        tables = written_tables(sql)
+        if tables is None:
+            self.forget()
+            return
+        for table in tables:
+            self.forget(table)
+
+    async def flush(self) -> None:
+        """Dispatch every pending batch now and wait for all running batches."""
+        for group in list(self._pending):
+            self._dispatch(group)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of lookups, of queries run for them and of lookups that shared a result."""
+        return {
+            'loads': self.loads,
+            'batches': self.batches,
+            'shared': self.shared,
+            'pending': sum(len(values) for values, _ in self._pending.values()),
+        }
@@ -0,0 +1,176 @@
+"""In-process read-through cache for query results."""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+# Statements that change the table named right after the keyword
+_WRITE_TABLE_PATTERN = re.compile(
+    r'\b(?:INSERT(?:\s+OR\s+\w+)?(?:\s+IGNORE)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+IGNORE)?|'
+    r'DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?|DROP\s+TABLE(?:\s+IF\s+EXISTS)?|ALTER\s+TABLE)\s+([`"\[\]\w.]+)',
+    re.IGNORECASE
+)
+
+# Returned by QueryCache.get() when a key is not cached
+MISSING = object()
+
+def copy_result(value: Any) -> Any:
+    """Copy the mutable parts of a result so callers cannot modify a cached value."""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return [dict(row) if isinstance(row, dict) else row for row in value]
+    return value
+
+def normalize_table(table: str) -> str:
+    """Reduce a table reference to its bare, lower-case name for invalidation."""
+    return table.split('.')[-1].strip('`"[]').lower()
+
+def written_tables(sql: str) -> Optional[Set[str]]:
+    """
+    Return the tables a raw SQL statement writes to.
+
+    Returns an empty set for SELECT statements and None when the statement
+    writes but its tables cannot be determined, meaning everything is stale.
+    """
+    tables = {normalize_table(match) for match in _WRITE_TABLE_PATTERN.findall(sql)}
+    if tables or sql.lstrip().upper().startswith(('SELECT', 'WITH', 'PRAGMA', 'SHOW', 'EXPLAIN', 'DESCRIBE')):
+        return tables
+    return None
+
+class QueryCache:
+    """
+    Bounded LRU cache with per-entry TTL and table-level invalidation.
+
+    :param maxsize: Maximum number of cached results
+    :param ttl: Seconds a result stays valid (0 disables expiry)
+    :param max_result_rows: Multi-row results longer than this are not cached
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, max_result_rows: int = 1000):
+        if maxsize < 1:
+            raise ValueError("Cache maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_result_rows = max_result_rows
+
+        # key -> (table, expires_at, value), least recently used first
+        self._entries: 'OrderedDict[Hashable, Tuple[str, float, Any]]' = OrderedDict()
+        self._tables: Dict[str, Set[Hashable]] = {}
+        # Bumped on every invalidation, so reads that raced a write are not stored
+        self._generations: Dict[str, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(operation: str, table: str, query: Optional[Dict[str, Any]], *extra: Any) -> Optional[Hashable]:
+        """Build the cache key of a read, or None if the query is not hashable."""
+        try:
+            # Column and order_by lists are the only unhashable options callers pass
+            extra = tuple(tuple(value) if isinstance(value, list) else value for value in extra)
+            key = (operation, normalize_table(table),
+                   tuple(sorted(query.items())) if query else (), extra)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> Any:
+        """Return a copy of the cached value for key, or MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self.ttl or entry[1] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy_result(entry[2])
+                self._remove(key)
+            self.misses += 1
+            return MISSING
+
+    def generation(self, table: str) -> Tuple[int, int]:
+        """Return a token that changes whenever table or the whole cache is invalidated."""
+        with self._lock:
+            return self._generation, self._generations.get(normalize_table(table), 0)
+
+    def put(self, key: Hashable, table: str, value: Any, generation: Tuple[int, int]) -> None:
+        """
+        Store a result read at the given generation token.
+
+        Empty results, None and results longer than max_result_rows are not
+        stored, since a failed read is indistinguishable from them. The least
+        recently used entries above maxsize are evicted.
+        """
+        if not value or (isinstance(value, list) and len(value) > self.max_result_rows):
+            return
+
+        table = normalize_table(table)
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        value = copy_result(value)
+        with self._lock:
+            if generation != (self._generation, self._generations.get(table, 0)):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (table, expires_at, value)
+            self._tables.setdefault(table, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, table: str) -> None:
+        """Drop every cached result read from table."""
+        with self._lock:
+            table = normalize_table(table)
+            self._generations[table] = self._generations.get(table, 0) + 1
+            keys = self._tables.pop(table, ())
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += 1
+
+    def invalidate_sql(self, sql: str) -> None:
+        """Drop the results a raw SQL statement may have made stale."""
+        tables = written_tables(sql)
+        if tables is None:
+            self.clear()
+            return
+        for table in tables:
+            self.invalidate(table)
+
+    def clear(self) -> None:
+        """Drop every cached result, keeping the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._tables.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, the hit rate and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and its table index reference, with the lock held."""
+        table = self._entries.pop(key)[0]
+        keys = self._tables.get(table)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._tables[table]
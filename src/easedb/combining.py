@@ -0,0 +1,134 @@
+"""Write-combining of add()/sub() increments into batched updates."""
+
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# (query, column -> amount) pairs, as taken by the drivers' add_many()
+Increments = List[Tuple[Dict[str, Any], Dict[str, Any]]]
+
+def check_increment(query: Dict[str, Any], value: Any) -> None:
+    """Raise ValueError for an increment without a query or with a non-numeric value."""
+    if not query:
+        raise ValueError("add and sub require a query to identify records")
+    if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+        raise ValueError(f"Invalid value type. Must be int, float or Decimal, got {type(value)}")
+
+class WriteCombiner:
+    """
+    In-memory buffer merging add() and sub() increments.
+
+    Increments of the same table, record and column are summed, so a burst
+    of increments to a hot counter reaches the database as one
+    column = column + ? statement per record when the buffer is flushed.
+    The combiner only holds the increments; the database facade flushing
+    it decides when, using due() and the flag returned by add().
+
+    :param window: Seconds an increment may wait in the buffer before a flush is due
+    :param max_pending: A flush is due once this many increments are buffered
+    """
+
+    def __init__(self, window: float = 0.05, max_pending: int = 1000):
+        if window < 0:
+            raise ValueError("Combine window must not be negative")
+        if max_pending < 1:
+            raise ValueError("Combine size must be at least 1")
+
+        self.window = window
+        self.max_pending = max_pending
+
+        # table -> record key -> (query, column -> summed amount), in arrival order
+        self._pending: Dict[str, Dict[Hashable, Tuple[Dict[str, Any], Dict[str, Any]]]] = {}
+        self._count = 0
+        # time.monotonic() of the oldest buffered increment
+        self._since = 0.0
+        self._lock = threading.Lock()
+        self.adds = 0
+        self.flushes = 0
+        self.records = 0
+
+    @staticmethod
+    def key_of(query: Dict[str, Any]) -> Optional[Hashable]:
+        """Return the hashable key of the records a query selects, or None if it cannot be buffered."""
+        try:
+            key = tuple(sorted(query.items()))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def add(self, table: str, query: Dict[str, Any], column: str, amount: Any) -> bool:
+        """
+        Buffer an increment of a column of the records a query selects.
+
+        :param query: Query with hashable values, see key_of()
+        :return: Whether a flush is now due
+        """
+        key = self.key_of(query)
+        if key is None:
+            raise ValueError(f"Increments of unhashable queries cannot be combined: {query!r}")
+        with self._lock:
+            records = self._pending.setdefault(table, {})
+            if key not in records:
+                records[key] = (dict(query), {})
+            amounts = records[key][1]
+            amounts[column] = amounts.get(column, 0) + amount
+            if not self._count:
+                self._since = time.monotonic()
+            self._count += 1
+            self.adds += 1
+            return self._is_due()
+
+    def due(self) -> bool:
+        """Whether the buffer holds max_pending increments or one older than window seconds."""
+        with self._lock:
+            return self._is_due()
+
+    def _is_due(self) -> bool:
+        """due() with the lock held."""
+        return bool(self._count) and (self._count >= self.max_pending
+                                      or time.monotonic() - self._since >= self.window)
+
+    def take(self) -> Dict[str, Increments]:
+        """Empty the buffer and return its merged increments per table, for add_many()."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._count = 0
+            if pending:
+                self.flushes += 1
+                self.records += sum(len(records) for records in pending.values())
+        return {table: list(records.values()) for table, records in pending.items()}
+
+    def restore(self, table: str, increments: Increments) -> None:
+        """
+        Put increments taken by take() back into the buffer, e.g. after add_many() failed.
+
+        They are merged with increments buffered since, so the next flush writes both.
+        """
+        with self._lock:
+            records = self._pending.setdefault(table, {})
+            if not self._count:
+                self._since = time.monotonic()
+            for query, amounts in increments:
+                key = self.key_of(query)
+                if key not in records:
+                    records[key] = (query, {})
+                pending = records[key][1]
+                for column, amount in amounts.items():
+                    pending[column] = pending.get(column, 0) + amount
+                self._count += len(amounts)
+            self.records -= len(increments)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of increments, of flushes and of record updates written for them."""
+        with self._lock:
+            return {
+                'adds': self.adds,
+                'flushes': self.flushes,
+                'records': self.records,
+                'pending': self._count,
+            }
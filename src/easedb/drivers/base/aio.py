@@ -1,7 +1,8 @@
 """Base asynchronous database driver interface."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from decimal import Decimal
+from typing import Any, AsyncContextManager, Callable, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 
 class AsyncDatabaseDriver(ABC):
     """Abstract base class for asynchronous database drivers."""
@@ -17,15 +18,62 @@ class AsyncDatabaseDriver(ABC):
         pass
     
     @abstractmethod
-    async def get(self, table: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def get(self, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+                  columns: Optional[List[str]] = None, 
+                  order_by: Union[None, str, List[str]] = None) -> Optional[Any]:
         """Get a record from the database asynchronously."""
         pass
     
+    @abstractmethod
+    async def get_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                       columns: Optional[List[str]] = None, row_format: str = 'dict', 
+                       chunk_size: int = 500) -> Dict[Any, Any]:
+        """Retrieve the records whose key is in values asynchronously, keyed by that value."""
+        pass
+    
+    @abstractmethod
+    async def iter_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                       batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over records from the database asynchronously with bounded memory."""
+        pass
+    
+    @abstractmethod
+    async def iter_batches(self, source: str, query: Optional[Dict[str, Any]] = None, 
+                           params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                           batch_size: int = 1000) -> AsyncIterator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]]:
+        """Iterate over the rows of a table or SELECT statement in (columns, rows) batches."""
+        pass
+    
+    @abstractmethod
+    async def get_page(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                       order_by: Union[str, List[str]] = 'id', 
+                       after: Union[None, str, Dict[str, Any]] = None, limit: int = 100, 
+                       row_format: str = 'dict') -> Any:
+        """Retrieve one keyset-paginated page of records asynchronously."""
+        pass
+    
     @abstractmethod
     async def set(self, table: str, data: Dict[str, Any]) -> bool:
         """Insert a record into the database asynchronously."""
         pass
     
+    @abstractmethod
+    async def set_many(self, table: str, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """Insert multiple records into the database asynchronously."""
+        pass
+    
+    @abstractmethod
+    async def upsert(self, table: str, data: Dict[str, Any], conflict_keys: Tuple[str, ...], 
+                     update_columns: Tuple[str, ...]) -> bool:
+        """Insert a record, or update the record it conflicts with."""
+        pass
+    
+    @abstractmethod
+    async def upsert_many(self, table: str, rows: Iterable[Dict[str, Any]], conflict_keys: Tuple[str, ...], 
+                          update_columns: Tuple[str, ...], chunk_size: int = 1000) -> int:
+        """Insert or update multiple records in the database."""
+        pass
+    
     @abstractmethod
     async def update(self, table: str, data: Dict[str, Any]) -> bool:
         """Update a record in the database asynchronously."""
@@ -37,7 +85,67 @@ class AsyncDatabaseDriver(ABC):
         pass
     
     @abstractmethod
-    async def execute(self, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None) -> Any:
+    async def update_many(self, table: str, rows: Iterable[Dict[str, Any]], key: str = 'id', 
+                          chunk_size: int = 1000) -> int:
+        """Update multiple records, each identified by its key column."""
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                          chunk_size: int = 1000) -> int:
+        """Delete the records whose key column matches any of the values."""
+        pass
+    
+    @abstractmethod
+    async def import_file(self, table: str, path: str, format: str, chunk_size: int = 1000, 
+                          columns: Optional[List[str]] = None, 
+                          progress: Optional[Callable[[int], None]] = None, 
+                          null: Optional[str] = '') -> int:
+        """Stream a CSV or JSON Lines file into a table."""
+        pass
+    
+    @abstractmethod
+    async def add(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+                  column: str = 'value') -> bool:
+        """Add a value to a numeric column of the matching records."""
+        pass
+    
+    @abstractmethod
+    async def sub(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+                  column: str = 'value') -> bool:
+        """Subtract a value from a numeric column of the matching records."""
+        pass
+    
+    @abstractmethod
+    async def add_many(self, table: str, increments: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Optional[int]:
+        """Add (query, column -> amount) increments to many records in one transaction."""
+        pass
+    
+    @abstractmethod
+    async def execute(self, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                      row_format: str = 'dict') -> Any:
         """Execute a raw SQL query asynchronously."""
         pass
+    
+    @abstractmethod
+    async def count(self, table: str, query: Optional[Dict[str, Any]] = None, approximate: bool = False) -> int:
+        """Count the records matching a query, or estimate the size of the whole table."""
+        pass
+    
+    @abstractmethod
+    async def exists(self, table: str, query: Optional[Dict[str, Any]] = None) -> bool:
+        """Check whether any record matches a query."""
+        pass
+    
+    @abstractmethod
+    async def aggregate(self, table: str, aggregates: Tuple[Tuple[str, str, str], ...], 
+                        query: Optional[Dict[str, Any]] = None, group_by: Tuple[str, ...] = (), 
+                        row_format: str = 'dict') -> Any:
+        """Compute aggregates over the matching records, per group if group_by is given."""
+        pass
+    
+    @abstractmethod
+    def transaction(self) -> AsyncContextManager[None]:
+        """Run the operations of an async with block in a single transaction."""
+        pass
     
\ No newline at end of file
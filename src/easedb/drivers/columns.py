@@ -0,0 +1,76 @@
+"""Column-wise builders of NumPy arrays and Arrow tables from fetched batches, shared by all drivers."""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .files import arrow_type, require_pyarrow
+
+# Results fetch_columns() can build
+COLUMN_FORMATS = ('numpy', 'arrow')
+
+def require_numpy() -> Any:
+    """Import numpy, an optional dependency, raising ImportError with installation advice if it is missing."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy column support requires numpy: pip install numpy") from None
+    return numpy
+
+def column_format(format: str) -> str:
+    """Normalize a fetch_columns() format, importing the library it needs."""
+    format = format.lower()
+    if format not in COLUMN_FORMATS:
+        raise ValueError(f"Unsupported column format: {format!r}, expected one of {COLUMN_FORMATS}")
+    if format == 'numpy':
+        require_numpy()
+    else:
+        require_pyarrow()
+    return format
+
+class ColumnBuilder:
+    """
+    Incremental builder of a columnar result from batches of row tuples.
+
+    Each batch is transposed and converted to one typed array per column
+    right away, so no per-row dicts are created and the Python row tuples
+    of a batch can be freed before the next one is fetched. NumPy arrays
+    take their dtype from the data and are concatenated with NumPy's type
+    promotion; a column holding NULLs becomes an object array. Arrow chunks
+    are cast to the type all non-null chunks of their column promote to,
+    see arrow_type(), and keep NULLs as nulls.
+
+    :param format: One of COLUMN_FORMATS
+    """
+
+    def __init__(self, format: str):
+        self.format = format
+        self.columns: Optional[Tuple[str, ...]] = None
+        self.rows = 0
+        # One list of per-batch arrays per column
+        self._chunks: List[List[Any]] = []
+        self._library = require_numpy() if format == 'numpy' else require_pyarrow()
+
+    def append(self, columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+        """Convert a batch of rows, the first batch fixing the columns."""
+        if self.columns is None:
+            self.columns = tuple(columns)
+            self._chunks = [[] for _ in self.columns]
+        if not rows:
+            return
+        self.rows += len(rows)
+        for chunks, values in zip(self._chunks, zip(*rows)):
+            chunks.append(self._library.array(values))
+
+    def result(self) -> Any:
+        """Return a dict of column name -> NumPy array, or a pyarrow.Table."""
+        columns = self.columns or ()
+        if self.format == 'numpy':
+            numpy = self._library
+            return {name: numpy.concatenate(chunks) if chunks else numpy.array([])
+                    for name, chunks in zip(columns, self._chunks)}
+
+        pyarrow = self._library
+        arrays = []
+        for chunks in self._chunks:
+            column_type = arrow_type(pyarrow, [chunk.type for chunk in chunks])
+            arrays.append(pyarrow.chunked_array([chunk.cast(column_type) for chunk in chunks], column_type))
+        return pyarrow.Table.from_arrays(arrays, names=list(columns))
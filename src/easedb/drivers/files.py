@@ -0,0 +1,257 @@
+"""Streaming readers of the CSV and JSON Lines files import_file() loads, shared by all drivers."""
+
+import csv
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Formats accepted by import_file() and export(), and the file extensions implying them
+FILE_FORMATS = ('csv', 'jsonl')
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet')
+FORMAT_EXTENSIONS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.parquet': 'parquet',
+}
+
+def file_format(path: str, format: Optional[str] = None, formats: Sequence[str] = FILE_FORMATS) -> str:
+    """Return the format of a file, from the format argument or else from its extension."""
+    if format is None:
+        format = FORMAT_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"Cannot tell the format of {path!r} from its extension, pass format=")
+    format = format.lower()
+    if format not in formats:
+        raise ValueError(f"Unsupported file format: {format!r}, expected one of {tuple(formats)}")
+    return format
+
+def require_pyarrow() -> Any:
+    """Import pyarrow, an optional dependency, raising ImportError with installation advice if it is missing."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet and Arrow support requires pyarrow: pip install pyarrow") from None
+    return pyarrow
+
+def arrow_type(pyarrow: Any, types: Sequence[Any]) -> Any:
+    """
+    Return the Arrow type chunks of the given types can all be cast to.
+
+    NULL types are skipped and the rest are promoted, so a SQLite column
+    holding 1 in one batch and 1.5 in a later one becomes double. Types
+    without a common one keep the first.
+    """
+    types = [type for type in types if not pyarrow.types.is_null(type)]
+    if not types:
+        return pyarrow.null()
+    try:
+        return pyarrow.unify_schemas([pyarrow.schema([('value', type)]) for type in types], 
+                                     promote_options='permissive').field('value').type
+    except (TypeError, pyarrow.ArrowException):
+        # pyarrow < 14 cannot promote, or the types have no common one
+        pass
+    if all(pyarrow.types.is_integer(type) or pyarrow.types.is_floating(type) for type in types):
+        return pyarrow.float64() if any(pyarrow.types.is_floating(type) for type in types) else types[0]
+    return types[0]
+
+def csv_header(path: str) -> Tuple[List[str], str]:
+    """Return the column names in the first line of a CSV file and the line terminator it uses."""
+    with open(path, 'rb') as raw:
+        terminator = '\r\n' if raw.readline().endswith(b'\r\n') else '\n'
+    with open(path, newline='', encoding='utf-8') as file:
+        header = next(csv.reader(file), [])
+    return header, terminator
+
+def check_file(path: str, format: str, columns: Optional[Sequence[str]] = None) -> None:
+    """Raise FileNotFoundError for a missing file, or ValueError if a CSV file lacks any of the requested columns."""
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No such file to import: {path!r}")
+    if columns and format == 'csv':
+        header = csv_header(path)[0]
+        missing = [column for column in columns if column not in header]
+        if missing:
+            raise ValueError(f"Columns missing from the header of {path!r}: {missing}")
+
+def read_rows(path: str, format: str, columns: Optional[Sequence[str]] = None, 
+              null: Optional[str] = '') -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a CSV or JSON Lines file one at a time.
+
+    CSV files must start with a header line and their values are strings,
+    converted by the database to the column types, except fields equal to
+    null, which are None; export() writes NULL as an empty field. JSON Lines files hold
+    one object per line; blank lines are skipped, keys missing from an
+    object are None and nested values are stored as JSON text.
+
+    :param columns: Columns to keep, every column of the header or of the
+                    first JSON object if omitted
+    :param null: CSV field read as None, None to keep every field a string
+    """
+    with open(path, newline='', encoding='utf-8') as file:
+        if format == 'csv':
+            reader = csv.reader(file)
+            header = next(reader, [])
+            indexes = [header.index(column) for column in columns] if columns else range(len(header))
+            names = [header[index] for index in indexes]
+            for row in reader:
+                if row:
+                    yield {name: None if row[index] == null else row[index] 
+                           for name, index in zip(names, indexes)}
+            return
+
+        names = list(columns) if columns else None
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                if names is None:
+                    names = list(record)
+                # Nested objects and lists are stored as JSON text
+                yield {name: json.dumps(value) if isinstance(value, (dict, list)) else value
+                       for name, value in ((name, record.get(name)) for name in names)}
+
+def progress_reporter(progress: Optional[Callable[[int, float], Any]]) -> Optional[Callable[[int], None]]:
+    """Wrap a progress(records, records_per_second) callback into the progress(records) the drivers call."""
+    if progress is None:
+        return None
+    start = time.perf_counter()
+
+    def report(imported: int) -> None:
+        progress(imported, imported / max(time.perf_counter() - start, 1e-9))
+    return report
+
+def json_value(value: Any) -> Any:
+    """Convert the values json cannot serialize: bytes to text, everything else to str."""
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', 'replace')
+    return str(value)
+
+class FileWriter:
+    """
+    Incremental writer of exported rows in CSV, JSON Lines or Parquet format.
+
+    Rows are written batch by batch, so memory use is bounded by the batch
+    size. CSV files start with a header line and write None as an empty
+    field. Parquet takes its column types from the data: batches are held
+    back while a column has only been NULL so far, and written as soon as
+    every column has a type. A later batch needing a wider type, e.g. 1.5
+    in a column written as int64 so far, rewrites the file written so far
+    with the promoted types, see arrow_type(). A writer left through an
+    exception removes its partial file.
+
+    :param path: Path of the file to create or overwrite
+    :param format: One of EXPORT_FORMATS
+    """
+
+    def __init__(self, path: str, format: str):
+        self.path = path
+        self.format = format
+        self.columns: Optional[Tuple[str, ...]] = None
+        self.rows = 0
+        self._file: Any = None
+        self._writer: Any = None
+        # Parquet batches waiting until every column has a type
+        self._held: List[Any] = []
+
+    def write(self, columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+        """Append a batch of rows, the first batch fixing the columns."""
+        if self.columns is None:
+            self.columns = tuple(columns)
+            if self.format != 'parquet':
+                self._file = open(self.path, 'w', newline='', encoding='utf-8')
+                if self.format == 'csv':
+                    self._writer = csv.writer(self._file)
+                    self._writer.writerow(self.columns)
+        self.rows += len(rows)
+
+        if self.format == 'csv':
+            self._writer.writerows(rows)
+        elif self.format == 'jsonl':
+            self._file.writelines(json.dumps(dict(zip(self.columns, row)), default=json_value) + '\n' 
+                                  for row in rows)
+        elif rows:
+            self._write_parquet(rows)
+
+    def _write_parquet(self, rows: Optional[Sequence[Sequence[Any]]]) -> None:
+        """Convert rows to an Arrow table and write it, or hold it back while a column has no type yet."""
+        pyarrow = require_pyarrow()
+        import pyarrow.parquet
+
+        if rows is not None:
+            table = pyarrow.Table.from_arrays([pyarrow.array(list(values)) for values in zip(*rows)], 
+                                              names=list(self.columns))
+            if self._writer is not None:
+                schema = self._writer.schema
+                promoted = pyarrow.schema([field.with_type(arrow_type(pyarrow, [field.type, column.type])) 
+                                           for field, column in zip(schema, table.schema)])
+                if not promoted.equals(schema):
+                    self._rewrite_parquet(promoted)
+                self._writer.write_table(table.cast(self._writer.schema))
+                return
+            self._held.append(table)
+
+        schema = pyarrow.schema([pyarrow.field(name, arrow_type(pyarrow, [table.schema.field(index).type 
+                                                                          for table in self._held]))
+                                 for index, name in enumerate(self.columns)])
+        fields = list(schema)
+        # Closing (rows is None) writes whatever is held, keeping all-NULL columns untyped
+        if rows is not None and any(pyarrow.types.is_null(field.type) for field in fields):
+            return
+        self._writer = pyarrow.parquet.ParquetWriter(self.path, schema)
+        for table in self._held:
+            self._writer.write_table(table.cast(schema))
+        self._held = []
+
+    def _rewrite_parquet(self, schema: Any) -> None:
+        """Reopen the Parquet file with a wider schema, copying the row groups written so far batch by batch."""
+        pyarrow = require_pyarrow()
+        import pyarrow.parquet
+
+        self._writer.close()
+        self._writer = None
+        written = self.path + '.widening'
+        os.replace(self.path, written)
+        try:
+            self._writer = pyarrow.parquet.ParquetWriter(self.path, schema)
+            for batch in pyarrow.parquet.ParquetFile(written).iter_batches():
+                self._writer.write_table(pyarrow.Table.from_batches([batch]).cast(schema))
+        finally:
+            os.remove(written)
+
+    def close(self) -> None:
+        """Finish the file; a result without rows still gets its header or Parquet schema."""
+        if self.format == 'parquet':
+            if self.columns is not None and self._writer is None:
+                if not self._held:
+                    pyarrow = require_pyarrow()
+                    self._held.append(pyarrow.Table.from_arrays([pyarrow.array([], pyarrow.null()) 
+                                                                 for _ in self.columns], 
+                                                                names=list(self.columns)))
+                self._write_parquet(None)
+            if self._writer is not None:
+                self._writer.close()
+        elif self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> 'FileWriter':
+        return self
+
+    def abort(self) -> None:
+        """Close the file without finishing it and remove it."""
+        try:
+            if self._writer is not None and self.format == 'parquet':
+                self._writer.close()
+            elif self._file is not None:
+                self._file.close()
+        finally:
+            self._writer = None
+            self._file = None
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
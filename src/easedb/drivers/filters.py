@@ -0,0 +1,205 @@
+"""Filter operators of query dictionaries, shared by all drivers."""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Operator name -> SQL operator; 'in' and 'not_in' take a list of values
+OPERATORS = {
+    'eq': '=',
+    'ne': '!=',
+    'lt': '<',
+    'lte': '<=',
+    'gt': '>',
+    'gte': '>=',
+    'like': 'LIKE',
+    'not_like': 'NOT LIKE',
+    'in': 'IN',
+    'not_in': 'NOT IN',
+    'is_null': 'IS NULL',
+    'not_null': 'IS NOT NULL',
+}
+
+# Symbols accepted in ('>=', 18) tuples and {'>=': 18} dictionaries
+SYMBOLS = {
+    '=': 'eq', '==': 'eq', '!=': 'ne', '<>': 'ne',
+    '<': 'lt', '<=': 'lte', '>': 'gt', '>=': 'gte',
+    'not like': 'not_like', 'not in': 'not_in',
+    'is null': 'is_null', 'is not null': 'not_null',
+}
+
+# A plain column name for equality, or (column, operator, number of values)
+Condition = Union[str, Tuple[str, str, int]]
+
+def operator_name(operator: str) -> str:
+    """Normalize '>=', 'GTE' or 'gte' to the operator name, raising ValueError if unknown."""
+    name = operator.strip().lower()
+    name = SYMBOLS.get(name, name)
+    if name not in OPERATORS:
+        raise ValueError(f"Unknown filter operator: {operator!r}")
+    return name
+
+def iter_conditions(query: Dict[str, Any]) -> Iterator[Tuple[str, str, Any]]:
+    """
+    Yield (column, operator, value) for every condition of a query dictionary.
+
+    Accepted forms, freely mixed:
+    - {'age': 18} and {'deleted_at': None} for = and IS NULL
+    - {'age__gte': 18}, {'id__in': [1, 2]}, {'deleted_at__is_null': True}
+    - {'age': ('>=', 18)}
+    - {'age': {'>=': 18, '<': 65}} for several conditions on one column
+    """
+    for key, value in query.items():
+        column, _, suffix = key.rpartition('__')
+        if column and suffix.lower() in OPERATORS:
+            operator = suffix.lower()
+        elif isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], str):
+            column, operator, value = key, operator_name(value[0]), value[1]
+        elif isinstance(value, dict):
+            for operator, operand in value.items():
+                yield from _resolve(key, operator_name(operator), operand)
+            continue
+        else:
+            column, operator = key, 'eq'
+        yield from _resolve(column, operator, value)
+
+def _resolve(column: str, operator: str, value: Any) -> Iterator[Tuple[str, str, Any]]:
+    """Turn comparisons with None and the boolean is_null forms into IS [NOT] NULL."""
+    if value is None and operator in ('eq', 'ne'):
+        operator = 'is_null' if operator == 'eq' else 'not_null'
+    elif operator in ('is_null', 'not_null'):
+        if not value:
+            operator = 'not_null' if operator == 'is_null' else 'is_null'
+        value = None
+    elif operator in ('in', 'not_in'):
+        if isinstance(value, (str, bytes)) or not hasattr(value, '__iter__'):
+            raise ValueError(f"The {operator} operator of {column!r} requires a list of values")
+        value = list(value)
+    yield column, operator, value
+
+def is_plain(query: Optional[Dict[str, Any]]) -> bool:
+    """Whether a query only holds column = value conditions, the common fast path."""
+    if not query:
+        return True
+    for key, value in query.items():
+        if '__' in key or value is None or isinstance(value, (tuple, dict)):
+            return False
+    return True
+
+def query_shape(query: Optional[Dict[str, Any]]) -> Tuple[Condition, ...]:
+    """
+    Return the statement shape of a query, the cache key part of its WHERE clause.
+
+    Plain equality queries map to their keys, so they share statements with
+    the pre-operator format; other conditions record their operator and the
+    length of IN lists.
+    """
+    if is_plain(query):
+        return tuple(query or ())
+    shape: List[Condition] = []
+    for column, operator, value in iter_conditions(query):
+        if operator == 'eq':
+            shape.append(column)
+        else:
+            shape.append((column, operator, len(value) if operator in ('in', 'not_in') else 0))
+    return tuple(shape)
+
+def query_values(query: Optional[Dict[str, Any]]) -> List[Any]:
+    """Return the values bound by a query's WHERE clause, in query_shape order."""
+    if is_plain(query):
+        return list(query.values()) if query else []
+    values: List[Any] = []
+    for _, operator, value in iter_conditions(query):
+        if operator in ('in', 'not_in'):
+            values.extend(value)
+        elif operator not in ('is_null', 'not_null'):
+            values.append(value)
+    return values
+
+def render_condition(condition: Condition, quoted_column: str, placeholder: str) -> str:
+    """Render one query_shape entry as SQL."""
+    if isinstance(condition, str):
+        return f"{quoted_column} = {placeholder}"
+    _, operator, count = condition
+    if operator in ('is_null', 'not_null'):
+        return f"{quoted_column} {OPERATORS[operator]}"
+    if operator in ('in', 'not_in'):
+        if not count:
+            # x IN () is invalid SQL: nothing matches an empty IN, everything an empty NOT IN
+            return '1 = 0' if operator == 'in' else '1 = 1'
+        return f"{quoted_column} {OPERATORS[operator]} ({', '.join([placeholder] * count)})"
+    return f"{quoted_column} {OPERATORS[operator]} {placeholder}"
+
+def condition_column(condition: Condition) -> str:
+    """Return the column of a query_shape entry."""
+    return condition if isinstance(condition, str) else condition[0]
+
+def chunk_query(query: Optional[Dict[str, Any]], max_variables: int,
+                reserved: int = 0) -> List[Optional[Dict[str, Any]]]:
+    """
+    Split a query so each statement binds at most max_variables values.
+
+    The longest IN list is de-duplicated and cut into chunks; every chunk
+    keeps the other conditions. Since a row matches at most one chunk, the
+    results of the chunks can simply be added up or concatenated.
+
+    :param reserved: Values bound outside the WHERE clause, e.g. by UPDATE ... SET
+    :return: [query] when it already fits, else one query per chunk
+    """
+    if is_plain(query) or len(query_values(query)) + reserved <= max_variables:
+        return [query]
+
+    conditions = list(iter_conditions(query))
+    longest = max(range(len(conditions)),
+                  key=lambda index: len(conditions[index][2]) if conditions[index][1] == 'in' else -1)
+    column, operator, values = conditions[longest]
+    values = list(dict.fromkeys(values))
+    room = max_variables - reserved - (len(query_values(query)) - len(conditions[longest][2]))
+    if operator != 'in' or room < 1:
+        raise ValueError(f"Query binds more than {max_variables} values and has no IN list to split")
+
+    parts: List[Optional[Dict[str, Any]]] = []
+    for start in range(0, len(values), room):
+        # Rebuilt in the {'column': {'operator': value}} form, grouping conditions per column
+        part: Dict[str, Any] = {}
+        for index, (name, name_operator, value) in enumerate(conditions):
+            if index == longest:
+                value = values[start:start + room]
+            elif name_operator in ('is_null', 'not_null'):
+                value = True
+            part.setdefault(name, {})[name_operator] = value
+        parts.append(part)
+    return parts
+
+def extend_projection(columns: Tuple[str, ...], order_by: Sequence[Tuple[str, bool]]) -> Tuple[str, ...]:
+    """Add the order_by columns merge_rows() needs to a projection, which is kept first."""
+    if not columns:
+        return columns
+    return columns + tuple(dict.fromkeys(column for column, _ in order_by if column not in columns))
+
+def merge_rows(rows: List[Sequence[Any]], columns: Sequence[str], order_by: Sequence[Tuple[str, bool]],
+               limit: Optional[int] = None, width: Optional[int] = None) -> List[Sequence[Any]]:
+    """
+    Sort and cut the concatenated rows of chunk_query() parts as one statement would have.
+
+    :param width: Number of leading columns to keep, dropping those added by extend_projection()
+    """
+    # Stable sorts from the last order_by column to the first, NULLs first like SQLite
+    for column, descending in reversed(order_by):
+        index = columns.index(column)
+        rows.sort(key=lambda row: (row[index] is not None, row[index]), reverse=descending)
+    rows = rows[:limit] if limit is not None else rows
+    return [row[:width] for row in rows] if width else rows
+
+def in_chunks(values: Sequence[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Yield de-duplicated values in IN lists of at most chunk_size values.
+
+    A short last chunk is padded with its last value up to the next power
+    of two, so lookups of any length reuse a handful of cached statements.
+    """
+    values = list(dict.fromkeys(values))
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        size = 1
+        while size < len(chunk):
+            size *= 2
+        yield chunk + chunk[-1:] * (min(size, chunk_size) - len(chunk))
@@ -1,6 +1,23 @@
 """MySQL database driver implementation."""
 
-from .sync import MySQLDriver
-from .aio import AsyncMySQLDriver
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .sync import MySQLDriver
+    from .aio import AsyncMySQLDriver
+
+# Driver class -> submodule defining it, imported on first access
+# so each mode only loads its own client library
+_DRIVERS = {
+    'MySQLDriver': '.sync',
+    'AsyncMySQLDriver': '.aio',
+}
 
 __all__ = ['MySQLDriver', 'AsyncMySQLDriver']
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule of a driver class on first access."""
+    if name in _DRIVERS:
+        return getattr(import_module(_DRIVERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
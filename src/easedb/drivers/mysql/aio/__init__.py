@@ -1,187 +1,356 @@
 """Asynchronous MySQL driver implementation."""
 
+import asyncio
+import contextvars
 import aiomysql
-from typing import Any, Dict, Optional, Union, List
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ...base import AsyncDatabaseDriver
-from ..utils import parse_connection_string
+from ...files import read_rows
+from ...pagination import Page, parse_order_by, resolve_after
+from ...statements import Aggregates, select_options, source_statement
+from ...transaction import Transaction, AsyncTransactionConnection
+from ..utils import parse_connection_string, split_pool_options
 from .get import get_record
 from .get_all import get_all_records
+from .iter_all import iter_all_records
+from .iter_batches import iter_query_batches
+from .get_page import get_page_records
+from .get_many import get_many_records
 from .set import set_record
+from .set_many import set_many_records
+from .upsert import upsert_record
+from .upsert_many import upsert_many_records
 from .update import update_record
+from .update_many import update_many_records
 from .delete import delete_record
+from .delete_many import delete_many_records
+from .count import count_records, estimate_records
+from .exists import record_exists
+from .aggregate import aggregate_records
 from .execute import execute_query
 from .create_table import create_table
+from .transaction import begin_transaction, execute_savepoint
 from .add import add_record
 from .sub import sub_record
-from ....logger import logger
+from .add_many import add_many_records
+from .load_data import load_data_file
+from ....logger import logger, hot_logger
 
 class AsyncMySQLDriver(AsyncDatabaseDriver):
-    """Asynchronous MySQL database driver."""
+    """
+    Asynchronous MySQL database driver.
+    
+    Backed by an aiomysql connection pool, so concurrent coroutines run
+    their queries on separate connections in parallel. The pool size is
+    configured with the same `pool_*` connection string parameters as the
+    synchronous driver's pool.
+    """
     
     def __init__(self, connection_string: str):
         """Initialize async MySQL driver."""
-        self.connection_params = parse_connection_string(connection_string)
-        self.connection = None
+        self.connection_params, pool_options = split_pool_options(
+            parse_connection_string(connection_string)
+        )
+        self.pool_options = pool_options or {}
+        
+        # Reads must not leave a transaction open, aiomysql closes connections
+        # that are returned to the pool mid-transaction
+        self.connection_params.setdefault('autocommit', True)
+        
+        if 'max_lifetime' in self.pool_options:
+            logger.warning("pool_max_lifetime is not supported by aiomysql, use pool_idle_timeout instead")
+        
+        self.pool = None
         self.connected = False
+        self._active = 0
+        self._connect_lock = None
+        # Transaction opened by transaction() in the current task, if any
+        self._transaction = contextvars.ContextVar(f'easedb_transaction_{id(self)}', default=None)
     
     async def connect(self) -> bool:
-        """Establish connection to MySQL database asynchronously."""
+        """Create the connection pool asynchronously."""
         try:
-            if not self.connected:
-                self.connection = await aiomysql.connect(**self.connection_params)
-                self.connected = True
-                logger.info("Successfully connected to the MySQL database.")
+            if self._connect_lock is None:
+                self._connect_lock = asyncio.Lock()
+            
+            async with self._connect_lock:
+                if not self.connected:
+                    self.pool = await aiomysql.create_pool(
+                        minsize=self.pool_options.get('min_size', 1),
+                        maxsize=self.pool_options.get('max_size', 10),
+                        pool_recycle=self.pool_options.get('idle_timeout', -1),
+                        **self.connection_params
+                    )
+                    self.connected = True
+                    hot_logger.info("Successfully connected to the MySQL database.")
             return True
         except Exception as e:
             logger.error(f"Error connecting to the MySQL database: {e}")
             return False
     
     async def disconnect(self) -> bool:
-        """Close MySQL database connection asynchronously."""
+        """Close the connection pool asynchronously."""
         try:
-            if self.connected and self.connection:
-                self.connection.close()
+            if self.connected and self.pool:
                 self.connected = False
-                logger.info("Successfully disconnected from the MySQL database.")
+                pool, self.pool = self.pool, None
+                pool.close()
+                await pool.wait_closed()
+                hot_logger.info("Successfully disconnected from the MySQL database.")
             return True
         except Exception as e:
             logger.error(f"Error disconnecting from the MySQL database: {e}")
             return False
     
-    async def get(self, table: str, query: Dict[str, Any], 
-                keep_connection_open: bool = False) -> Optional[Dict[str, Any]]:
-        """Get a record from MySQL database asynchronously."""
+    @asynccontextmanager
+    async def _connection(self, keep_connection_open: bool = False) -> AsyncIterator[Any]:
+        """
+        Check out a pooled connection for the duration of a block asynchronously.
+        
+        Creates the pool first if needed and, unless keep_connection_open is
+        set, closes it again once no other operation is using it. Honours
+        pool_timeout and pool_pre_ping.
+        """
+        transaction = self._transaction.get()
+        if transaction is not None:
+            yield transaction.proxy
+            return
+        
+        self._active += 1
         try:
             if not self.connected:
                 await self.connect()
             
-            result = await get_record(self.connection, table, query)
-            
-            if not keep_connection_open:
+            connection = await asyncio.wait_for(self.pool.acquire(), self.pool_options.get('timeout'))
+            try:
+                # On by default like the synchronous pool; ping() reconnects a connection the server dropped
+                if self.pool_options.get('pre_ping', True):
+                    await connection.ping()
+                yield connection
+            finally:
+                self.pool.release(connection)
+        finally:
+            self._active -= 1
+            if not keep_connection_open and not self._active:
                 await self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return None
     
-    async def get_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
-                   keep_connection_open: bool = False) -> List[Dict[str, Any]]:
-        """Get all records from MySQL database asynchronously."""
+    async def _run(self, operation: Callable[..., Awaitable[Any]], *args: Any,
+                   keep_connection_open: bool = False, default: Any = None, **kwargs: Any) -> Any:
+        """Run an operation on a pooled connection, returning default if it raises."""
         try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await get_all_records(self.connection, table, query)
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return []
+            async with self._connection(keep_connection_open) as connection:
+                return await operation(connection, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error in {operation.__name__}: {e}")
+            return default
+    
+    @asynccontextmanager
+    async def transaction(self, keep_connection_open: bool = False) -> AsyncIterator[None]:
+        """
+        Run the operations of a block in a single transaction asynchronously.
+        
+        Per-operation commits are deferred and one COMMIT is issued when the
+        block exits, or ROLLBACK if it raises or an operation inside it
+        failed (TransactionError). Nested blocks use savepoints.
+        """
+        transaction = self._transaction.get()
+        if transaction is not None:
+            name = transaction.savepoint()
+            await execute_savepoint(transaction.connection, f"SAVEPOINT {name}")
+            try:
+                yield
+                transaction.raise_if_failed()
+            except BaseException:
+                transaction.failed = False
+                await execute_savepoint(transaction.connection, f"ROLLBACK TO SAVEPOINT {name}")
+                raise
+            finally:
+                transaction.depth -= 1
+                await execute_savepoint(transaction.connection, f"RELEASE SAVEPOINT {name}")
+            return
+        
+        async with self._connection(keep_connection_open) as connection:
+            await begin_transaction(connection)
+            transaction = Transaction(connection, AsyncTransactionConnection)
+            token = self._transaction.set(transaction)
+            try:
+                yield
+                transaction.raise_if_failed()
+                await connection.commit()
+            except BaseException:
+                await connection.rollback()
+                raise
+            finally:
+                self._transaction.reset(token)
+    
+    async def get(self, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+                  columns: Optional[List[str]] = None, order_by: Union[None, str, List[str]] = None, 
+                  keep_connection_open: bool = False) -> Optional[Any]:
+        """Get a record from MySQL database asynchronously."""
+        columns, order = select_options(columns, order_by)
+        return await self._run(get_record, table, query, row_format, columns, order, 
+                               keep_connection_open=keep_connection_open)
+    
+    async def get_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                       columns: Optional[List[str]] = None, row_format: str = 'dict', 
+                       chunk_size: int = 500, keep_connection_open: bool = False) -> Dict[Any, Any]:
+        """Get the records of MySQL database whose key is in values asynchronously, keyed by that value."""
+        columns, _ = select_options(columns)
+        return await self._run(get_many_records, table, key, values, columns, row_format, chunk_size, 
+                               keep_connection_open=keep_connection_open, default={})
+    
+    async def get_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                      page: Optional[int] = None, page_size: Optional[int] = None, 
+                      row_format: str = 'dict', columns: Optional[List[str]] = None, 
+                      order_by: Union[None, str, List[str]] = None, limit: Optional[int] = None, 
+                      keep_connection_open: bool = False) -> Any:
+        """Get all records from MySQL database asynchronously with optional pagination."""
+        columns, order = select_options(columns, order_by, limit)
+        return await self._run(get_all_records, table, query, page, page_size, row_format, 
+                               columns, order, limit, 
+                               keep_connection_open=keep_connection_open, default=[])
+    
+    async def iter_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                       batch_size: int = 1000, 
+                       keep_connection_open: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over records from MySQL database asynchronously without loading them all into memory."""
+        async with self._connection(keep_connection_open) as connection:
+            async for record in iter_all_records(connection, table, query, batch_size):
+                yield record
+    
+    async def iter_batches(self, source: str, query: Optional[Dict[str, Any]] = None, 
+                           params: Optional[Union[tuple, Dict[str, Any]]] = None, batch_size: int = 1000, 
+                           keep_connection_open: bool = False
+                           ) -> AsyncIterator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]]:
+        """Iterate over the rows of a table or SELECT statement of MySQL database asynchronously in (columns, rows) batches."""
+        sql, params = source_statement('mysql', source, query, params)
+        async with self._connection(keep_connection_open) as connection:
+            async for batch in iter_query_batches(connection, sql, params, batch_size):
+                yield batch
+    
+    async def get_page(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                       order_by: Union[str, List[str]] = 'id', 
+                       after: Union[None, str, Dict[str, Any]] = None, limit: int = 100, 
+                       row_format: str = 'dict', keep_connection_open: bool = False) -> Page:
+        """Get one keyset-paginated page of records from MySQL database asynchronously."""
+        order = parse_order_by(order_by)
+        return await self._run(get_page_records, table, query, order, resolve_after(after, order), 
+                               limit, row_format, 
+                               keep_connection_open=keep_connection_open, default=Page([], None))
     
     async def set(self, table: str, data: Dict[str, Any], 
                 keep_connection_open: bool = False) -> bool:
         """Insert a record into MySQL database asynchronously."""
-        try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await set_record(self.connection, table, data)
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return False
+        return await self._run(set_record, table, data, 
+                               keep_connection_open=keep_connection_open, default=False)
+    
+    async def set_many(self, table: str, rows: Iterable[Dict[str, Any]], 
+                       chunk_size: int = 1000, keep_connection_open: bool = False) -> int:
+        """Insert multiple records into MySQL database asynchronously, one transaction per chunk."""
+        return await self._run(set_many_records, table, rows, chunk_size, 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def upsert(self, table: str, data: Dict[str, Any], conflict_keys: Tuple[str, ...], 
+                     update_columns: Tuple[str, ...], keep_connection_open: bool = False) -> bool:
+        """Insert a record into MySQL database asynchronously, or update the record it conflicts with."""
+        return await self._run(upsert_record, table, data, conflict_keys, update_columns, 
+                               keep_connection_open=keep_connection_open, default=False)
+    
+    async def upsert_many(self, table: str, rows: Iterable[Dict[str, Any]], conflict_keys: Tuple[str, ...], 
+                          update_columns: Tuple[str, ...], chunk_size: int = 1000, 
+                          keep_connection_open: bool = False) -> int:
+        """Insert or update multiple records in MySQL database asynchronously, one transaction per chunk."""
+        return await self._run(upsert_many_records, table, rows, conflict_keys, update_columns, chunk_size, 
+                               keep_connection_open=keep_connection_open, default=0)
     
     async def update(self, table: str, query: Dict[str, Any], data: Dict[str, Any], 
                       keep_connection_open: bool = False) -> bool:
         """Update a record in MySQL database asynchronously."""
-        try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await update_record(self.connection, table, query, data)
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return False
+        return await self._run(update_record, table, query, data, 
+                               keep_connection_open=keep_connection_open, default=False)
     
     async def delete(self, table: str, query: Dict[str, Any], 
                       keep_connection_open: bool = False) -> bool:
         """Delete a record from MySQL database asynchronously."""
-        try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await delete_record(self.connection, table, query)
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return False
+        return await self._run(delete_record, table, query, 
+                               keep_connection_open=keep_connection_open, default=False)
+    
+    async def update_many(self, table: str, rows: Iterable[Dict[str, Any]], key: str = 'id', 
+                          chunk_size: int = 1000, keep_connection_open: bool = False) -> int:
+        """Update multiple records of MySQL database asynchronously by key with CASE statements, in one transaction."""
+        return await self._run(update_many_records, table, rows, key, chunk_size, 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def delete_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                          chunk_size: int = 1000, keep_connection_open: bool = False) -> int:
+        """Delete the records of MySQL database asynchronously whose key is in values, in one transaction."""
+        return await self._run(delete_many_records, table, values, key, chunk_size, 
+                               keep_connection_open=keep_connection_open, default=0)
     
     async def execute(self, query: str, 
                     params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                    row_format: str = 'dict', 
                     keep_connection_open: bool = False) -> Any:
         """Execute a raw SQL query asynchronously."""
-        try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await execute_query(self.connection, query, params)
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return None
+        return await self._run(execute_query, query, params, row_format, 
+                               keep_connection_open=keep_connection_open)
 
+    async def count(self, table: str, query: Optional[Dict[str, Any]] = None, approximate: bool = False, 
+                    keep_connection_open: bool = False) -> int:
+        """Count records in MySQL database asynchronously, or estimate the size of the whole table."""
+        return await self._run(estimate_records if approximate else count_records, table, 
+                               *(() if approximate else (query,)), 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def exists(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                     keep_connection_open: bool = False) -> bool:
+        """Check whether any record of MySQL database matches a query asynchronously."""
+        return await self._run(record_exists, table, query, 
+                               keep_connection_open=keep_connection_open, default=False)
+    
+    async def aggregate(self, table: str, aggregates: Aggregates, query: Optional[Dict[str, Any]] = None, 
+                        group_by: Tuple[str, ...] = (), row_format: str = 'dict', 
+                        keep_connection_open: bool = False) -> Any:
+        """Compute aggregates over records of MySQL database asynchronously, per group if group_by is given."""
+        return await self._run(aggregate_records, table, aggregates, query, group_by, row_format, 
+                               keep_connection_open=keep_connection_open, default=[] if group_by else None)
+    
     async def create_table(self, table: str, schema: Dict[str, str], 
                            primary_key: str = 'id', 
                            auto_increment: bool = True,
                            if_not_exists: bool = True,
                            keep_connection_open: bool = False) -> bool:
         """Create a table in MySQL database asynchronously."""
-        try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await create_table(self.connection, table, schema, 
-                                        primary_key, auto_increment, if_not_exists)
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return False
+        return await self._run(create_table, table, schema, 
+                               primary_key, auto_increment, if_not_exists, 
+                               keep_connection_open=keep_connection_open, default=False)
 
-    async def add(self, table: str, query: Dict[str, Any], value: Union[int, float], 
-                column: str = 'value', keep_connection_open: bool = False) -> bool:
+    async def import_file(self, table: str, path: str, format: str, chunk_size: int = 1000, 
+                          columns: Optional[List[str]] = None, progress: Optional[Callable[[int], None]] = None, 
+                          null: Optional[str] = '', keep_connection_open: bool = False) -> int:
+        """
+        Stream a CSV or JSON Lines file into MySQL database asynchronously.
+        
+        CSV files are loaded by the server with LOAD DATA LOCAL INFILE when
+        the connection string sets local_infile=true and the server's
+        local_infile is ON. Otherwise, and for JSON Lines, the rows are
+        inserted with executemany, committing each chunk.
+        """
+        if format == 'csv' and self.connection_params.get('local_infile'):
+            loaded = await self._run(load_data_file, table, path, columns, null, 
+                                     keep_connection_open=keep_connection_open)
+            if loaded is not None:
+                if progress is not None:
+                    progress(loaded)
+                return loaded
+        return await self._run(set_many_records, table, read_rows(path, format, columns, null), chunk_size, progress, 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def add(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+                  column: str = 'value', keep_connection_open: bool = False) -> bool:
         """
         Add a specified value to an existing numeric column in the database.
         
@@ -192,24 +361,11 @@ class AsyncMySQLDriver(AsyncDatabaseDriver):
         :param keep_connection_open: Whether to keep the connection open after operation
         :return: True if update was successful, False otherwise
         """
-        try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await add_record(self.connection, table, query, value, column)
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception as e:
-            logger.error(f"Error in add method: {e}")
-            if not keep_connection_open:
-                await self.disconnect()
-            return False
+        return await self._run(add_record, table, query, value, column, 
+                               keep_connection_open=keep_connection_open, default=False)
 
-    async def sub(self, table: str, query: Dict[str, Any], value: Union[int, float], 
-                column: str = 'value', keep_connection_open: bool = False) -> bool:
+    async def sub(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+                  column: str = 'value', keep_connection_open: bool = False) -> bool:
         """
         Subtract a specified value from an existing numeric column in the database.
         
@@ -220,18 +376,11 @@ class AsyncMySQLDriver(AsyncDatabaseDriver):
         :param keep_connection_open: Whether to keep the connection open after operation
         :return: True if update was successful, False otherwise
         """
-        try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await sub_record(self.connection, table, query, value, column)
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception as e:
-            logger.error(f"Error in sub method: {e}")
-            if not keep_connection_open:
-                await self.disconnect()
-            return False
+        return await self._run(sub_record, table, query, value, column, 
+                               keep_connection_open=keep_connection_open, default=False)
+
+    async def add_many(self, table: str, increments: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]], 
+                       keep_connection_open: bool = False) -> Optional[int]:
+        """Add (query, column -> amount) increments to records of MySQL database asynchronously, in one transaction."""
+        return await self._run(add_many_records, table, increments, 
+                               keep_connection_open=keep_connection_open, default=None)
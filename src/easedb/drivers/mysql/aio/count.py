@@ -0,0 +1,70 @@
+"""Asynchronous MySQL count operations."""
+
+from typing import Any, Dict, Optional
+
+from ..utils import ESTIMATE_SQL
+from ...filters import query_shape
+from ...statements import compile_statement
+
+from ....logger import logger, hot_logger
+
+
+async def count_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Count the records of a MySQL table matching a query asynchronously.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to count records in
+    :param query: Optional dictionary of conditions to filter records
+    :return: Number of records matching the query
+    """
+    cursor = None
+    try:
+        cursor = await connection.cursor()
+        statement = compile_statement('mysql', 'count', table, query_shape(query))
+        sql, params = statement.sql, statement.params(query=query)
+        
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
+        
+        await cursor.execute(sql, params)
+        count = (await cursor.fetchone())[0]
+        
+        hot_logger.info("Counted {} record(s) in {}", count, table)
+        return count
+        
+    except Exception as e:
+        logger.error(f"Error counting records in table {table}: {e}")
+        return 0
+    
+    finally:
+        if cursor:
+            await cursor.close()
+
+async def estimate_records(connection: Any, table: str) -> int:
+    """
+    Estimate the number of records of a MySQL table from information_schema.TABLES asynchronously.
+    
+    TABLE_ROWS is exact for MyISAM and an estimate, possibly off by tens of
+    percent, for InnoDB. Tables without an estimate, such as views, are
+    counted exactly.
+    
+    :param connection: Active database connection
+    :param table: Name of the table, optionally prefixed by its schema
+    :return: Estimated number of records
+    """
+    cursor = None
+    try:
+        schema, _, name = table.rpartition('.')
+        cursor = await connection.cursor()
+        await cursor.execute(ESTIMATE_SQL, (schema or None, name))
+        row = await cursor.fetchone()
+    except Exception as e:
+        logger.error(f"Error estimating records in table {table}: {e}")
+        row = None
+    finally:
+        if cursor:
+            await cursor.close()
+    if row is None or row[0] is None:
+        return await count_records(connection, table)
+    hot_logger.info("Estimated {} record(s) in {}", row[0], table)
+    return int(row[0])
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ....logger import logger, hot_logger
 
 async def create_table(connection: Any, table: str, schema: Dict[str, str], 
                        primary_key: str = 'id', 
@@ -44,12 +44,12 @@ async def create_table(connection: Any, table: str, schema: Dict[str, str],
             else:
                 sql = f"CREATE TABLE `{table}` ({columns_str})"
             
-            logger.info(f"Attempting to create table {table}. SQL: {sql}")
+            hot_logger.info("Attempting to create table {}. SQL: {}", table, sql)
 
             # Execute table creation
             await cursor.execute(sql)
 
-            logger.info(f"Successfully created table {table}. SQL: {sql}")
+            hot_logger.info("Successfully created table {}. SQL: {}", table, sql)
         
         return True
     
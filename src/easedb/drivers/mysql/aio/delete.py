@@ -2,22 +2,24 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ...filters import query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 async def delete_record(connection: Any, table: str, query: Dict[str, Any]) -> bool:
     """Delete a record from MySQL database asynchronously."""
     try:
         cursor = await connection.cursor()
-        where_clause = ' AND '.join([f"{k} = %s" for k in query.keys()])
-        sql = f"DELETE FROM {table} WHERE {where_clause}"
+        statement = compile_statement('mysql', 'delete', table, query_shape(query))
+        sql, params = statement.sql, statement.params(query=query)
         
-        logger.info(f"Attempting to delete record from {table}. SQL: {sql}, Parameters: {list(query.values())}")
+        hot_logger.info("Attempting to delete record from {}. SQL: {}, Parameters: {}", table, sql, params)
 
-        await cursor.execute(sql, list(query.values()))
+        await cursor.execute(sql, params)
         await connection.commit()
         await cursor.close()
         
-        logger.info(f"Successfully deleted record from {table}. SQL: {sql}, Parameters: {list(query.values())}")
+        hot_logger.info("Successfully deleted record from {}. SQL: {}, Parameters: {}", table, sql, list(query.values()))
 
         return True
         
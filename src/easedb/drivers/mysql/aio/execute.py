@@ -2,14 +2,16 @@
 
 from typing import Any, Dict, Optional, Union, List
 
-from ..utils import row_to_dict, get_columns_from_cursor
+from ..utils import get_columns_from_cursor
+from ...rows import format_rows
 
-from ....logger import logger
+from ....logger import logger, hot_logger
 
-async def execute_query(connection: Any, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None) -> Any:
-    """Execute a raw SQL query asynchronously."""
+async def execute_query(connection: Any, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                        row_format: str = 'dict') -> Any:
+    """Execute a raw SQL query asynchronously, returning SELECT results in the given row format."""
     try:
-        logger.info(f"Executing query: {query} with params: {params}")
+        hot_logger.info("Executing query: {} with params: {}", query, params)
         cursor = await connection.cursor()
         await cursor.execute(query, params or ())
         
@@ -18,14 +20,14 @@ async def execute_query(connection: Any, query: str, params: Optional[Union[tupl
             rows = await cursor.fetchall()
             await cursor.close()
 
-            logger.info(f"Query executed successfully, retrieved {len(rows)} rows")
+            hot_logger.info("Query executed successfully, retrieved {} rows", len(rows))
 
-            return [row_to_dict(row, columns) for row in rows]
+            return format_rows(rows, columns, row_format)
         else:
             await connection.commit()
             await cursor.close()
 
-            logger.info("Query executed successfully: Changes committed.")
+            hot_logger.info("Query executed successfully: Changes committed.")
 
             return True
             
@@ -1,32 +1,35 @@
 """Asynchronous MySQL get operation."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+import traceback
 
-from ..utils import row_to_dict, get_columns_from_cursor
+from ..utils import get_columns_from_cursor
+from ...rows import format_row
 
-from ....logger import logger
+from ...statements import OrderBy, select_statement
+from ....logger import logger, hot_logger
 
-async def get_record(connection: Any, table: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Get a record from MySQL database asynchronously."""
+async def get_record(connection: Any, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+                     columns: Tuple[str, ...] = (), order_by: OrderBy = ()) -> Optional[Any]:
+    """Get a record from MySQL database asynchronously in the given row format."""
     try:
         cursor = await connection.cursor()
-        where_clause = ' AND '.join([f"{k} = %s" for k in query.keys()])
-        sql = f"SELECT * FROM {table} WHERE {where_clause}"
+        sql, params = select_statement('mysql', table, query, columns, order_by, 1)
         
-        logger.info(f"Executing SQL: {sql} | Query parameters: {list(query.values())}")
+        hot_logger.info("Executing SQL: {} | Query parameters: {}", sql, params)
 
-        await cursor.execute(sql, list(query.values()))
+        await cursor.execute(sql, params)
         columns = get_columns_from_cursor(cursor)
         row = await cursor.fetchone()
 
         if row is None:
-            logger.info(f"No record found for query: {query}")
+            hot_logger.info("No record found for query: {}", query)
             return None
 
         await cursor.close()
         
-        return row_to_dict(row, columns)
+        return format_row(row, columns, row_format)
         
-    except Exception:
+    except Exception as e:
         logger.error(f"Error in get_record: {e} | Traceback: {traceback.format_exc()}")
         return None
@@ -1,40 +1,47 @@
 """Asynchronous MySQL get all records operation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import traceback
 
-from ....logger import logger
 
-async def get_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+from ..utils import get_columns_from_cursor
+from ...rows import format_rows
+from ...statements import OrderBy, select_statement
+from ....logger import logger, hot_logger
+
+async def get_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None, 
+                          page: Optional[int] = None, page_size: Optional[int] = None, 
+                          row_format: str = 'dict', columns: Tuple[str, ...] = (), 
+                          order_by: OrderBy = (), limit: Optional[int] = None) -> Any:
     """
     Retrieve all records from a MySQL database table asynchronously.
     
     :param connection: Active database connection
     :param table: Name of the table to retrieve records from
     :param query: Optional dictionary of filter conditions
-    :return: List of records matching the query
+    :param page: Optional page number for pagination (1-indexed)
+    :param page_size: Optional number of records per page
+    :param row_format: 'dict', 'tuple', 'namedtuple' or 'columnar'
+    :param columns: Columns to return, all of them if empty
+    :param order_by: Parsed (column, descending) pairs to sort by
+    :param limit: Maximum number of records to return
+    :return: List of records matching the query, or a ColumnarResult
     """
     cursor = None
     try:
-        # Create cursor with dictionary output
-        cursor = await connection.cursor(dictionary=True)
+        cursor = await connection.cursor()
         
-        # Construct base SQL query
-        sql = f"SELECT * FROM {table}"
+        # Construct SQL query, with a WHERE clause if query is provided
+        sql, params = select_statement('mysql', table, query, columns, order_by, limit)
         
-        # Add WHERE clause if query is provided
-        params = []
-        if query:
-            conditions = []
-            for key, value in query.items():
-                conditions.append(f"{key} = %s")
-                params.append(value)
-            
-            if conditions:
-                sql += " WHERE " + " AND ".join(conditions)
-
+        # Add pagination if both page and page_size are provided
+        if page is not None and page_size is not None:
+            if page < 1 or page_size < 1:
+                raise ValueError("Page and page_size must be positive integers")
+            sql += " LIMIT %s OFFSET %s"
+            params.extend([page_size, (page - 1) * page_size])
         
-        logger.debug(f"Executing SQL: {sql} | Parameters: {params}")
+        hot_logger.debug("Executing SQL: {} | Parameters: {}", sql, params)
         #         
         
         # Execute query
@@ -44,9 +51,10 @@ async def get_all_records(connection: Any, table: str, query: Optional[Dict[str,
             await cursor.execute(sql)
         
         # Fetch all records
-        records = await cursor.fetchall()
+        columns = get_columns_from_cursor(cursor)
+        records = format_rows(await cursor.fetchall(), columns, row_format)
         
-        logger.debug(f"Retrieved {len(records)} records")
+        hot_logger.debug("Retrieved {} records", len(records))
         
         return records
     
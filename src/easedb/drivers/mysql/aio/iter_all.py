@@ -0,0 +1,51 @@
+"""Asynchronous MySQL streaming get all records operation."""
+
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiomysql
+
+from ..utils import row_to_dict, get_columns_from_cursor
+from ...filters import query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+async def iter_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None, 
+                           batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over records from a MySQL database table asynchronously.
+    
+    Uses a server-side SSCursor, so the server streams the result and at
+    most batch_size rows are held in memory at a time. The connection cannot
+    run other queries until the iteration has finished.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to retrieve records from
+    :param query: Optional dictionary of filter conditions
+    :param batch_size: Number of rows fetched per round
+    :return: Async iterator over records matching the query
+    """
+    cursor = None
+    try:
+        statement = compile_statement('mysql', 'select', table, query_shape(query))
+        sql, params = statement.sql, statement.params(query=query)
+        
+        cursor = await connection.cursor(aiomysql.SSCursor)
+        
+        hot_logger.debug("Executing streaming SQL: {} | Parameters: {}", sql, params)
+        
+        await cursor.execute(sql, params)
+        columns = get_columns_from_cursor(cursor)
+        while True:
+            rows = await cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield row_to_dict(row, columns)
+    
+    except Exception as e:
+        logger.error(f"Error streaming records from {table}: {e}")
+    
+    finally:
+        # Closing an SSCursor drains any unread rows so the connection stays usable
+        if cursor:
+            await cursor.close()
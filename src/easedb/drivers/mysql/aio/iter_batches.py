@@ -0,0 +1,48 @@
+"""Asynchronous MySQL streaming query operation."""
+
+from typing import Any, AsyncIterator, List, Tuple
+
+import aiomysql
+
+from ..utils import get_columns_from_cursor
+from ....logger import logger, hot_logger
+
+async def iter_query_batches(connection: Any, sql: str, params: Any = None, 
+                             batch_size: int = 1000) -> AsyncIterator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]]:
+    """
+    Iterate over the rows of a query on MySQL database asynchronously in batches.
+    
+    Uses a server-side SSCursor, so the server streams the result and at
+    most batch_size rows are held in memory at a time. The first batch is
+    yielded even when it is empty, so the columns of an empty result are
+    known. The connection cannot run other queries until the iteration has
+    finished.
+    
+    :param connection: Active database connection
+    :param sql: SELECT statement
+    :param params: Parameters bound to the statement
+    :param batch_size: Number of rows fetched per round
+    :return: Async iterator over (columns, rows) pairs
+    """
+    cursor = None
+    try:
+        cursor = await connection.cursor(aiomysql.SSCursor)
+        
+        hot_logger.debug("Executing streaming SQL: {} | Parameters: {}", sql, params)
+        
+        await cursor.execute(sql, params)
+        columns = get_columns_from_cursor(cursor)
+        rows = await cursor.fetchmany(batch_size)
+        while True:
+            yield columns, list(rows)
+            rows = await cursor.fetchmany(batch_size)
+            if not rows:
+                break
+    
+    except Exception as e:
+        logger.error(f"Error streaming query results: {e}")
+    
+    finally:
+        # Closing an SSCursor drains any unread rows so the connection stays usable
+        if cursor:
+            await cursor.close()
@@ -0,0 +1,59 @@
+"""Asynchronous MySQL LOAD DATA LOCAL INFILE operation."""
+
+from typing import Any, Optional, Sequence
+
+from ..utils import load_data_statement
+from ...files import csv_header
+
+from ....logger import logger, hot_logger
+
+
+async def load_data_file(connection: Any, table: str, path: str, 
+                         columns: Optional[Sequence[str]] = None, 
+                         null: Optional[str] = None) -> Optional[int]:
+    """
+    Load a CSV file into MySQL database asynchronously with LOAD DATA LOCAL INFILE.
+    
+    The server parses the whole file in one statement, committed as one
+    transaction. The connection must be opened with local_infile.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to load into
+    :param path: Path of a CSV file starting with a header line
+    :param columns: Header columns to load, all of them if omitted
+    :param null: Field loaded as NULL, None to load every field as is
+    :return: Number of records loaded, None if the server's local_infile is OFF or loading failed
+    """
+    cursor = None
+    try:
+        cursor = await connection.cursor()
+        await cursor.execute("SELECT @@local_infile")
+        if not (await cursor.fetchone())[0]:
+            hot_logger.info("Server does not allow LOAD DATA LOCAL INFILE, inserting {} instead", path)
+            return None
+        
+        header, terminator = csv_header(path)
+        sql = load_data_statement(table, header, terminator, columns, null)
+        params = (path,)
+        if null is not None:
+            params += (null,) * len([name for name in header if not columns or name in columns])
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
+        
+        await connection.begin()
+        await cursor.execute(sql, params)
+        loaded = cursor.rowcount
+        await connection.commit()
+        
+        hot_logger.info("Loaded {} records into {}", loaded, table)
+        
+        return loaded
+        
+    except Exception as e:
+        if connection:
+            await connection.rollback()
+        logger.error(f"Error loading {path} into {table}: {e}")
+        return None
+    
+    finally:
+        if cursor:
+            await cursor.close()
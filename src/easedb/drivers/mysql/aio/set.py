@@ -2,23 +2,22 @@
 
 from typing import Any, Dict
 
-from ..utils import format_placeholders
+from ...statements import compile_statement
 
-from ....logger import logger
+from ....logger import logger, hot_logger
 
 
 async def set_record(connection: Any, table: str, data: Dict[str, Any]) -> bool:
     """Insert a record into MySQL database asynchronously."""
     try:
         cursor = await connection.cursor()
-        # Ensure column names are properly escaped/quoted
-        columns = ', '.join([f"`{col}`" for col in data.keys()])
-        placeholders = format_placeholders(data)
-        sql = f"INSERT INTO `{table}` ({columns}) VALUES ({placeholders})"
+        # Column names are properly escaped/quoted by the compiled statement
+        statement = compile_statement('mysql', 'insert', table, (), tuple(data))
+        sql = statement.sql
         
-        logger.info(f"Executing SQL: {sql} | Data: {data}")
+        hot_logger.info("Executing SQL: {} | Data: {}", sql, data)
 
-        await cursor.execute(sql, list(data.values()))
+        await cursor.execute(sql, statement.params(data=data))
         await connection.commit()
         await cursor.close()
         
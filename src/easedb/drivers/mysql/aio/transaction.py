@@ -0,0 +1,16 @@
+"""Asynchronous MySQL transaction operations."""
+
+from typing import Any
+
+from ....logger import hot_logger
+
+async def begin_transaction(connection: Any) -> None:
+    """Start an explicit transaction asynchronously."""
+    hot_logger.debug("Executing SQL: BEGIN")
+    await connection.begin()
+
+async def execute_savepoint(connection: Any, statement: str) -> None:
+    """Execute a SAVEPOINT, RELEASE SAVEPOINT or ROLLBACK TO SAVEPOINT statement asynchronously."""
+    hot_logger.debug("Executing SQL: {}", statement)
+    async with connection.cursor() as cursor:
+        await cursor.execute(statement)
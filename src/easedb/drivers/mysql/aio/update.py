@@ -2,7 +2,9 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ...filters import query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 async def update_record(connection: Any, table: str, query: Dict[str, Any], data: Dict[str, Any]) -> bool:
     """Update a record in MySQL database asynchronously."""
@@ -13,24 +15,18 @@ async def update_record(connection: Any, table: str, query: Dict[str, Any], data
         
         # Ha nincs adat, nem történik frissítés
         if not data:
-            logger.info(f"No data provided to update for table {table} with query: {query}")
+            hot_logger.info("No data provided to update for table {} with query: {}", table, query)
             return False
         
         cursor = await connection.cursor()
         
-        # Construct the SET clause for update values
-        set_clause = ', '.join([f"{k} = %s" for k in data.keys()])
-        
-        # Construct the WHERE clause for the query conditions
-        where_clause = ' AND '.join([f"{k} = %s" for k in query.keys()])
-        
-        # Combine the SQL statement
-        sql = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
-
-        logger.info(f"Executing SQL: {sql} | Values: {list(data.values()) + list(query.values())}")
+        # Build the SET and WHERE clauses for the update values and query conditions
+        statement = compile_statement('mysql', 'update', table, query_shape(query), tuple(data))
         
         # Combine values: first update values, then query conditions
-        values = list(data.values()) + list(query.values())
+        sql, values = statement.sql, statement.params(data, query)
+
+        hot_logger.info("Executing SQL: {} | Values: {}", sql, values)
         
         await cursor.execute(sql, values)
         await connection.commit()
@@ -0,0 +1,59 @@
+"""Asynchronous MySQL bulk update operation."""
+
+from typing import Any, Dict, Iterable
+
+from ..utils import MYSQL_MAX_PLACEHOLDERS, chunked
+from ...statements import case_update_params, compile_case_update, group_by_columns
+
+from ....logger import logger, hot_logger
+
+
+async def update_many_records(connection: Any, table: str, rows: Iterable[Dict[str, Any]], 
+                              key: str = 'id', chunk_size: int = 1000) -> int:
+    """
+    Update multiple records of MySQL database asynchronously, each identified by its key column.
+    
+    Rows setting the same columns are sent as one UPDATE ... SET column =
+    CASE key WHEN ... END WHERE key IN (...) statement, so a chunk costs one
+    round trip instead of one per row. All rows are committed as one
+    transaction.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to update
+    :param rows: Iterable of records holding the key and the columns to set, may be a generator
+    :param key: Column identifying the record of each row
+    :param chunk_size: Maximum number of rows per statement
+    :return: Number of records changed, 0 if the transaction was rolled back
+    """
+    updated = 0
+    cursor = None
+    try:
+        cursor = await connection.cursor()
+        await connection.begin()
+        for chunk in chunked(rows, chunk_size):
+            for data_keys, group in group_by_columns(chunk, key).items():
+                if not data_keys:
+                    continue
+                size = MYSQL_MAX_PLACEHOLDERS // (2 * len(data_keys) + 1)
+                for start in range(0, len(group), size):
+                    part = group[start:start + size]
+                    sql = compile_case_update('mysql', table, key, data_keys, len(part))
+                    hot_logger.info("Executing SQL: UPDATE {} SET {} for {} rows", table, data_keys, len(part))
+                    
+                    await cursor.execute(sql, case_update_params(part, key, data_keys))
+                    updated += cursor.rowcount
+        await connection.commit()
+        
+        hot_logger.info("Updated {} records in {}", updated, table)
+        
+        return updated
+        
+    except Exception as e:
+        if connection:
+            await connection.rollback()
+        logger.error(f"Error bulk updating records in {table}: {e}")
+        return 0
+    
+    finally:
+        if cursor:
+            await cursor.close()
@@ -0,0 +1,34 @@
+"""Asynchronous MySQL upsert operation."""
+
+from typing import Any, Dict, Tuple
+
+from ...statements import compile_upsert
+
+from ....logger import logger, hot_logger
+
+
+async def upsert_record(connection: Any, table: str, data: Dict[str, Any], 
+                        conflict_keys: Tuple[str, ...], update_columns: Tuple[str, ...]) -> bool:
+    """Insert a record into MySQL database asynchronously, or update the record it conflicts with."""
+    cursor = None
+    try:
+        cursor = await connection.cursor()
+        statement = compile_upsert('mysql', table, tuple(data), conflict_keys, update_columns)
+        sql = statement.sql
+        
+        hot_logger.info("Executing SQL: {} | Data: {}", sql, data)
+
+        await cursor.execute(sql, statement.params(data=data))
+        await connection.commit()
+        
+        return True
+        
+    except Exception as e:
+        if connection:
+            await connection.rollback()
+        logger.error(f"Error upserting record into {table}: {e}")
+        return False
+    
+    finally:
+        if cursor:
+            await cursor.close()
@@ -0,0 +1,56 @@
+"""Asynchronous MySQL bulk upsert operation."""
+
+from typing import Any, Dict, Iterable, Tuple
+
+from ..utils import chunked
+from ...statements import compile_upsert
+
+from ....logger import logger, hot_logger
+
+
+async def upsert_many_records(connection: Any, table: str, rows: Iterable[Dict[str, Any]], 
+                              conflict_keys: Tuple[str, ...], update_columns: Tuple[str, ...], 
+                              chunk_size: int = 1000) -> int:
+    """
+    Insert or update multiple records in MySQL database asynchronously.
+    
+    Each chunk is sent with executemany, which aiomysql rewrites into
+    multi-row INSERT ... ON DUPLICATE KEY UPDATE statements, inside one
+    explicit transaction. All rows must have the same keys as the first one.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to upsert into
+    :param rows: Iterable of records, may be a generator
+    :param conflict_keys: Columns of the unique key detecting an existing record
+    :param update_columns: Columns overwritten on a conflict
+    :param chunk_size: Number of rows upserted per transaction
+    :return: Number of records inserted or updated
+    """
+    upserted = 0
+    cursor = None
+    try:
+        cursor = await connection.cursor()
+        statement = None
+        for chunk in chunked(rows, chunk_size):
+            if statement is None:
+                statement = compile_upsert('mysql', table, tuple(chunk[0]), conflict_keys, update_columns)
+                hot_logger.info("Executing SQL: {}", statement.sql)
+            
+            await connection.begin()
+            await cursor.executemany(statement.sql, [statement.params(data=row) for row in chunk])
+            await connection.commit()
+            upserted += len(chunk)
+        
+        hot_logger.info("Upserted {} records into {}", upserted, table)
+        
+        return upserted
+        
+    except Exception as e:
+        if connection:
+            await connection.rollback()
+        logger.error(f"Error bulk upserting records into {table} after {upserted} rows: {e}")
+        return upserted
+    
+    finally:
+        if cursor:
+            await cursor.close()
@@ -0,0 +1,234 @@
+"""Thread-safe connection pool for the synchronous MySQL driver."""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from ...logger import logger
+
+class _PooledConnection:
+    """A pooled connection together with its bookkeeping timestamps."""
+
+    __slots__ = ('connection', 'created_at', 'last_used', 'generation')
+
+    def __init__(self, connection: Any, generation: int):
+        self.connection = connection
+        self.created_at = self.last_used = time.monotonic()
+        self.generation = generation
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of database connections.
+
+    :param connect: Callable that opens a new connection
+    :param min_size: Number of connections kept open even when idle
+    :param max_size: Maximum number of connections open at the same time
+    :param timeout: Seconds to wait for a free connection before raising TimeoutError
+    :param idle_timeout: Seconds after which an idle connection above min_size is closed
+    :param max_lifetime: Seconds after which a connection is replaced (0 disables)
+    :param pre_ping: Whether to check that a connection is alive before handing it out
+    """
+
+    def __init__(self, connect: Callable[[], Any],
+                 min_size: int = 1,
+                 max_size: int = 10,
+                 timeout: float = 30.0,
+                 idle_timeout: float = 300.0,
+                 max_lifetime: float = 3600.0,
+                 pre_ping: bool = True):
+        if max_size < 1:
+            raise ValueError("Pool max_size must be at least 1")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("Pool min_size must be between 0 and max_size")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.pre_ping = pre_ping
+
+        # Idle connections, least recently used on the left
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0
+        self._generation = 0
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Number of open connections, idle and checked out."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Number of idle connections waiting in the pool."""
+        return len(self._idle)
+
+    def fill(self) -> None:
+        """Open connections until the pool holds at least min_size of them."""
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+                generation = self._generation
+            entry = self._open(generation)
+            with self._condition:
+                self._idle.append(entry)
+                self._condition.notify()
+
+    def acquire(self) -> Any:
+        """Check out a connection, waiting up to `timeout` seconds for a free one."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            to_close: List[_PooledConnection] = []
+            entry: Optional[_PooledConnection] = None
+            create = False
+
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    self._evict_idle(now, to_close)
+
+                    # Prefer the most recently used connection, it is the least likely to be stale
+                    while self._idle:
+                        candidate = self._idle.pop()
+                        if self._expired(candidate, now):
+                            self._size -= 1
+                            to_close.append(candidate)
+                        else:
+                            entry = candidate
+                            break
+
+                    if entry is not None:
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                        generation = self._generation
+                        break
+
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._close_all(to_close)
+                        raise TimeoutError(
+                            f"Timed out after {self.timeout}s waiting for a pooled connection "
+                            f"(max_size={self.max_size})"
+                        )
+                    self._condition.wait(remaining)
+
+            self._close_all(to_close)
+
+            if create:
+                entry = self._open(generation)
+            elif self.pre_ping and not self._ping(entry.connection):
+                logger.warning("Discarding pooled connection that failed the pre-ping check")
+                self._discard(entry)
+                continue
+
+            with self._condition:
+                self._in_use[id(entry.connection)] = entry
+            return entry.connection
+
+    def release(self, connection: Any) -> None:
+        """Return a checked-out connection to the pool."""
+        with self._condition:
+            entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            raise ValueError("Connection does not belong to this pool")
+
+        try:
+            # Never hand out a connection with a half-finished transaction
+            if getattr(connection, 'in_transaction', False):
+                connection.rollback()
+        except Exception as e:
+            logger.warning(f"Discarding pooled connection after failed rollback: {e}")
+            self._discard(entry)
+            return
+
+        with self._condition:
+            now = time.monotonic()
+            if entry.generation == self._generation and not self._expired(entry, now):
+                entry.last_used = now
+                self._idle.append(entry)
+                self._condition.notify()
+                return
+
+        self._discard(entry)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Context manager that checks out a connection and always returns it."""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """
+        Close every idle connection.
+
+        Connections that are checked out are closed when they are released.
+        The pool stays usable and opens new connections on demand.
+        """
+        with self._condition:
+            self._generation += 1
+            to_close = list(self._idle)
+            self._idle.clear()
+            self._size -= len(to_close)
+            self._condition.notify_all()
+        self._close_all(to_close)
+
+    def _open(self, generation: int) -> _PooledConnection:
+        """Open a new connection for a slot that has already been reserved."""
+        try:
+            return _PooledConnection(self._connect(), generation)
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def _expired(self, entry: _PooledConnection, now: float) -> bool:
+        """Whether a connection has outlived max_lifetime or belongs to a closed generation."""
+        if entry.generation != self._generation:
+            return True
+        return bool(self.max_lifetime) and now - entry.created_at >= self.max_lifetime
+
+    def _evict_idle(self, now: float, to_close: List[_PooledConnection]) -> None:
+        """Move connections idle for longer than idle_timeout to to_close, keeping min_size."""
+        if not self.idle_timeout:
+            return
+        while (self._idle and self._size > self.min_size
+               and now - self._idle[0].last_used >= self.idle_timeout):
+            to_close.append(self._idle.popleft())
+            self._size -= 1
+
+    def _discard(self, entry: _PooledConnection) -> None:
+        """Close a connection and free its slot."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+        self._close_all([entry])
+
+    @staticmethod
+    def _ping(connection: Any) -> bool:
+        """Check whether a connection is still alive."""
+        try:
+            return bool(connection.is_connected())
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_all(entries: List[_PooledConnection]) -> None:
+        """Close connections, ignoring errors from already broken ones."""
+        for entry in entries:
+            try:
+                entry.connection.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled connection: {e}")
@@ -1,19 +1,44 @@
 """Synchronous MySQL driver implementation."""
 
 import mysql.connector
-from typing import Any, Dict, Optional, Union, List
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import threading
 import traceback
 
 from ...base import DatabaseDriver
-from ..utils import parse_connection_string
+from ...files import read_rows
+from ...pagination import Page, parse_order_by, resolve_after
+from ...statements import Aggregates, select_options, source_statement
+from ...transaction import Transaction, TransactionConnection
+from ..utils import parse_connection_string, split_pool_options
+from ..pool import ConnectionPool
 from .get import get_record
 from .get_all import get_all_records
+from .iter_all import iter_all_records
+from .iter_batches import iter_query_batches
+from .get_page import get_page_records
+from .get_many import get_many_records
 from .set import set_record
+from .set_many import set_many_records
+from .upsert import upsert_record
+from .upsert_many import upsert_many_records
 from .update import update_record
+from .update_many import update_many_records
 from .delete import delete_record
+from .delete_many import delete_many_records
+from .add import add_record
+from .sub import sub_record
+from .add_many import add_many_records
+from .load_data import load_data_file
+from .count import count_records, estimate_records
+from .exists import record_exists
+from .aggregate import aggregate_records
 from .execute import execute_query
 from .create_table import create_table
-from ....logger import logger
+from .transaction import begin_transaction, execute_savepoint
+from ....logger import logger, hot_logger
 
 class MySQLDriver(DatabaseDriver):
     """Synchronous MySQL database driver."""
@@ -21,7 +46,9 @@ class MySQLDriver(DatabaseDriver):
     def __init__(self, connection_string: str):
         """Initialize MySQL driver."""
         self.connection_string = connection_string
-        self.connection_params = parse_connection_string(connection_string)
+        self.connection_params, pool_options = split_pool_options(
+            parse_connection_string(connection_string)
+        )
         
         # Add additional connection parameters with more verbose error handling
         self.connection_params.update({
@@ -35,6 +62,20 @@ class MySQLDriver(DatabaseDriver):
         
         self.connection = None
         self.connected = False
+        # Blocks currently using the connection, which is only closed when the last one exits
+        self._active = 0
+        # Transaction opened by transaction() in the current thread, if any
+        self._local = threading.local()
+        
+        # With pooling enabled connections are opened on demand and shared
+        # safely between threads, so there is nothing to connect eagerly
+        self.pool = None
+        if pool_options is not None:
+            self.pool = ConnectionPool(
+                lambda: mysql.connector.connect(**self.connection_params), 
+                **pool_options
+            )
+            return
         
         # Attempt to establish connection during initialization
         try:
@@ -47,13 +88,18 @@ class MySQLDriver(DatabaseDriver):
     def connect(self) -> bool:
         """Establish connection to MySQL database."""
         try:
+            if self.pool is not None:
+                # Warm up the pool to its minimum size
+                self.pool.fill()
+                return True
+
             if not self.connected:
 
                 # Attempt to establish connection with detailed error tracking
-                logger.info("Attempting to connect with parameters:")
+                hot_logger.info("Attempting to connect with parameters:")
                 for key, value in self.connection_params.items():
                     if key not in ['password']:  # Avoid printing sensitive info
-                        logger.info(f"{key}: {value}")
+                        hot_logger.info("{}: {}", key, value)
                 
                 self.connection = mysql.connector.connect(**self.connection_params)
                 
@@ -63,7 +109,7 @@ class MySQLDriver(DatabaseDriver):
                     return False
                 
                 self.connected = True
-                logger.info("Connection established successfully")
+                hot_logger.info("Connection established successfully")
             return True
         
         except mysql.connector.Error as err:
@@ -77,142 +123,286 @@ class MySQLDriver(DatabaseDriver):
     def disconnect(self) -> bool:
         """Close MySQL database connection."""
         try:
+            if self.pool is not None:
+                self.pool.close()
+                return True
+
             if self.connected and self.connection:
                 self.connection.close()
                 self.connected = False
-                logger.info("Connection closed successfully.")
+                hot_logger.info("Connection closed successfully.")
             return True
         except Exception as e:
             logger.error(f"Error disconnecting from the MySQL database: {e}")
             return False
     
-    def get(self, table: str, query: Dict[str, Any], 
-                keep_connection_open: bool = False) -> Optional[Dict[str, Any]]:
-        """Get a record from MySQL database."""
+    @contextmanager
+    def _connection(self, keep_connection_open: bool = False) -> Iterator[Any]:
+        """
+        Provide a connection for the duration of a block.
+        
+        Connects first if needed and, unless keep_connection_open is set,
+        closes the connection again once no other block, such as a running
+        iter_all(), is using it. With pooling enabled a pooled connection is
+        checked out and returned to the pool afterwards, and
+        keep_connection_open is ignored.
+        """
+        transaction = getattr(self._local, 'transaction', None)
+        if transaction is not None:
+            yield transaction.proxy
+            return
+        
+        if self.pool is not None:
+            with self.pool.connection() as connection:
+                yield connection
+            return
+        
+        self._active += 1
         try:
             if not self.connected:
                 self.connect()
-            
-            result = get_record(self.connection, table, query)
-            
-            if not keep_connection_open:
+            yield self.connection
+        finally:
+            self._active -= 1
+            if not keep_connection_open and not self._active:
                 self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                self.disconnect()
-            return None
     
-    def get_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
-                   keep_connection_open: bool = False) -> List[Dict[str, Any]]:
-        """Get all records from MySQL database."""
+    def _run(self, operation: Callable[..., Any], *args: Any,
+             keep_connection_open: bool = False, default: Any = None, **kwargs: Any) -> Any:
+        """Run an operation on a connection, returning default if it raises."""
         try:
-            if not self.connected:
-                self.connect()
-            
-            result = get_all_records(self.connection, table, query)
-            
-            if not keep_connection_open:
-                self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                self.disconnect()
-            return []
+            with self._connection(keep_connection_open) as connection:
+                return operation(connection, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error in {operation.__name__}: {e}")
+            return default
+    
+    @contextmanager
+    def transaction(self, keep_connection_open: bool = False) -> Iterator[None]:
+        """
+        Run the operations of a block in a single transaction.
+        
+        Per-operation commits are deferred and one COMMIT is issued when the
+        block exits, or ROLLBACK if it raises or an operation inside it
+        failed (TransactionError). Nested blocks use savepoints.
+        """
+        transaction = getattr(self._local, 'transaction', None)
+        if transaction is not None:
+            name = transaction.savepoint()
+            execute_savepoint(transaction.connection, f"SAVEPOINT {name}")
+            try:
+                yield
+                transaction.raise_if_failed()
+            except BaseException:
+                transaction.failed = False
+                execute_savepoint(transaction.connection, f"ROLLBACK TO SAVEPOINT {name}")
+                raise
+            finally:
+                transaction.depth -= 1
+                execute_savepoint(transaction.connection, f"RELEASE SAVEPOINT {name}")
+            return
+        
+        with self._connection(keep_connection_open) as connection:
+            begin_transaction(connection)
+            transaction = self._local.transaction = Transaction(connection, TransactionConnection)
+            try:
+                yield
+                transaction.raise_if_failed()
+                connection.commit()
+            except BaseException:
+                connection.rollback()
+                raise
+            finally:
+                self._local.transaction = None
+    
+    def get(self, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+            columns: Optional[List[str]] = None, order_by: Union[None, str, List[str]] = None, 
+            keep_connection_open: bool = False) -> Optional[Any]:
+        """Get a record from MySQL database."""
+        columns, order = select_options(columns, order_by)
+        return self._run(get_record, table, query, row_format, columns, order, 
+                         keep_connection_open=keep_connection_open)
+    
+    def get_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                 columns: Optional[List[str]] = None, row_format: str = 'dict', 
+                 chunk_size: int = 500, keep_connection_open: bool = False) -> Dict[Any, Any]:
+        """Get the records of MySQL database whose key is in values, keyed by that value."""
+        columns, _ = select_options(columns)
+        return self._run(get_many_records, table, key, values, columns, row_format, chunk_size, 
+                         keep_connection_open=keep_connection_open, default={})
+    
+    def get_all(self, table: str, query: Optional[Dict[str, Any]] = None, row_format: str = 'dict', 
+                columns: Optional[List[str]] = None, order_by: Union[None, str, List[str]] = None, 
+                limit: Optional[int] = None, keep_connection_open: bool = False) -> Any:
+        """Get all records from MySQL database."""
+        columns, order = select_options(columns, order_by, limit)
+        return self._run(get_all_records, table, query, row_format, columns, order, limit, 
+                         keep_connection_open=keep_connection_open, default=[])
+    
+    def iter_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                 batch_size: int = 1000, keep_connection_open: bool = False) -> Iterator[Dict[str, Any]]:
+        """Iterate over records from MySQL database without loading them all into memory."""
+        with self._connection(keep_connection_open) as connection:
+            yield from iter_all_records(connection, table, query, batch_size)
+    
+    def iter_batches(self, source: str, query: Optional[Dict[str, Any]] = None, 
+                     params: Optional[Union[tuple, Dict[str, Any]]] = None, batch_size: int = 1000, 
+                     keep_connection_open: bool = False) -> Iterator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]]:
+        """Iterate over the rows of a table or SELECT statement of MySQL database in (columns, rows) batches."""
+        sql, params = source_statement('mysql', source, query, params)
+        with self._connection(keep_connection_open) as connection:
+            yield from iter_query_batches(connection, sql, params, batch_size)
+    
+    def get_page(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                 order_by: Union[str, List[str]] = 'id', 
+                 after: Union[None, str, Dict[str, Any]] = None, limit: int = 100, 
+                 row_format: str = 'dict', keep_connection_open: bool = False) -> Page:
+        """Get one keyset-paginated page of records from MySQL database."""
+        order = parse_order_by(order_by)
+        return self._run(get_page_records, table, query, order, resolve_after(after, order), 
+                         limit, row_format, 
+                         keep_connection_open=keep_connection_open, default=Page([], None))
     
     def set(self, table: str, data: Dict[str, Any], 
                 keep_connection_open: bool = False) -> bool:
         """Insert a record into MySQL database."""
-        try:
-            if not self.connected:
-                self.connect()
-            
-            result = set_record(self.connection, table, data)
-            
-            if not keep_connection_open:
-                self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                self.disconnect()
-            return False
+        return self._run(set_record, table, data, 
+                         keep_connection_open=keep_connection_open, default=False)
+    
+    def set_many(self, table: str, rows: Iterable[Dict[str, Any]], 
+                 chunk_size: int = 1000, keep_connection_open: bool = False) -> int:
+        """Insert multiple records into MySQL database, one transaction per chunk."""
+        return self._run(set_many_records, table, rows, chunk_size, 
+                         keep_connection_open=keep_connection_open, default=0)
+    
+    def upsert(self, table: str, data: Dict[str, Any], conflict_keys: Tuple[str, ...], 
+               update_columns: Tuple[str, ...], keep_connection_open: bool = False) -> bool:
+        """Insert a record into MySQL database, or update the record it conflicts with."""
+        return self._run(upsert_record, table, data, conflict_keys, update_columns, 
+                         keep_connection_open=keep_connection_open, default=False)
+    
+    def upsert_many(self, table: str, rows: Iterable[Dict[str, Any]], conflict_keys: Tuple[str, ...], 
+                    update_columns: Tuple[str, ...], chunk_size: int = 1000, 
+                    keep_connection_open: bool = False) -> int:
+        """Insert or update multiple records in MySQL database, one transaction per chunk."""
+        return self._run(upsert_many_records, table, rows, conflict_keys, update_columns, chunk_size, 
+                         keep_connection_open=keep_connection_open, default=0)
     
     def update(self, table: str, query: Dict[str, Any], data: Dict[str, Any], 
                   keep_connection_open: bool = False) -> bool:
         """Update a record in MySQL database."""
-        try:
-            if not self.connected:
-                self.connect()
-            
-            result = update_record(self.connection, table, query, data)
-            
-            if not keep_connection_open:
-                self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                self.disconnect()
-            return False
+        return self._run(update_record, table, query, data, 
+                         keep_connection_open=keep_connection_open, default=False)
     
     def delete(self, table: str, query: Dict[str, Any], 
                   keep_connection_open: bool = False) -> bool:
         """Delete a record from MySQL database."""
-        try:
-            if not self.connected:
-                self.connect()
-            
-            result = delete_record(self.connection, table, query)
-            
-            if not keep_connection_open:
-                self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                self.disconnect()
-            return False
+        return self._run(delete_record, table, query, 
+                         keep_connection_open=keep_connection_open, default=False)
+    
+    def update_many(self, table: str, rows: Iterable[Dict[str, Any]], key: str = 'id', 
+                    chunk_size: int = 1000, keep_connection_open: bool = False) -> int:
+        """Update multiple records of MySQL database by key with CASE statements, in one transaction."""
+        return self._run(update_many_records, table, rows, key, chunk_size, 
+                         keep_connection_open=keep_connection_open, default=0)
+    
+    def delete_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                    chunk_size: int = 1000, keep_connection_open: bool = False) -> int:
+        """Delete the records of MySQL database whose key is in values, in one transaction."""
+        return self._run(delete_many_records, table, values, key, chunk_size, 
+                         keep_connection_open=keep_connection_open, default=0)
+    
+    def import_file(self, table: str, path: str, format: str, chunk_size: int = 1000, 
+                    columns: Optional[List[str]] = None, progress: Optional[Callable[[int], None]] = None, 
+                    null: Optional[str] = '', keep_connection_open: bool = False) -> int:
+        """
+        Stream a CSV or JSON Lines file into MySQL database.
+        
+        CSV files are loaded by the server with LOAD DATA LOCAL INFILE when
+        the connection string sets allow_local_infile=true and the server's
+        local_infile is ON. Otherwise, and for JSON Lines, the rows are
+        inserted with executemany, committing each chunk.
+        """
+        if format == 'csv' and self.connection_params.get('allow_local_infile'):
+            loaded = self._run(load_data_file, table, path, columns, null, 
+                               keep_connection_open=keep_connection_open)
+            if loaded is not None:
+                if progress is not None:
+                    progress(loaded)
+                return loaded
+        return self._run(set_many_records, table, read_rows(path, format, columns, null), chunk_size, progress, 
+                         keep_connection_open=keep_connection_open, default=0)
+    
+    def add(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+            column: str = 'value', keep_connection_open: bool = False) -> bool:
+        """
+        Add a specified value to an existing numeric column in the database.
+        
+        :param table: Name of the table
+        :param query: Dictionary specifying which record(s) to update
+        :param value: Numeric value to add to the existing value
+        :param column: Name of the column to update (default: 'value')
+        :param keep_connection_open: Whether to keep the connection open after operation
+        :return: True if update was successful, False otherwise
+        """
+        return self._run(add_record, table, query, value, column, 
+                         keep_connection_open=keep_connection_open, default=False)
+    
+    def sub(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+            column: str = 'value', keep_connection_open: bool = False) -> bool:
+        """
+        Subtract a specified value from an existing numeric column in the database.
+        
+        :param table: Name of the table
+        :param query: Dictionary specifying which record(s) to update
+        :param value: Numeric value to subtract from the existing value
+        :param column: Name of the column to update (default: 'value')
+        :param keep_connection_open: Whether to keep the connection open after operation
+        :return: True if update was successful, False otherwise
+        """
+        return self._run(sub_record, table, query, value, column, 
+                         keep_connection_open=keep_connection_open, default=False)
+    
+    def add_many(self, table: str, increments: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]], 
+                 keep_connection_open: bool = False) -> Optional[int]:
+        """Add (query, column -> amount) increments to records of MySQL database, in one transaction."""
+        return self._run(add_many_records, table, increments, 
+                         keep_connection_open=keep_connection_open, default=None)
     
     def execute(self, query: str, 
                     params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                    row_format: str = 'dict', 
                     keep_connection_open: bool = False) -> Any:
         """Execute a raw SQL query."""
-        try:
-            if not self.connected:
-                self.connect()
-            
-            result = execute_query(self.connection, query, params)
-            
-            if not keep_connection_open:
-                self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                self.disconnect()
-            return None
+        return self._run(execute_query, query, params, row_format, 
+                         keep_connection_open=keep_connection_open)
 
+    def count(self, table: str, query: Optional[Dict[str, Any]] = None, approximate: bool = False, 
+              keep_connection_open: bool = False) -> int:
+        """Count records in MySQL database, or estimate the size of the whole table."""
+        return self._run(estimate_records if approximate else count_records, table, 
+                         *(() if approximate else (query,)), 
+                         keep_connection_open=keep_connection_open, default=0)
+    
+    def exists(self, table: str, query: Optional[Dict[str, Any]] = None, 
+               keep_connection_open: bool = False) -> bool:
+        """Check whether any record of MySQL database matches a query."""
+        return self._run(record_exists, table, query, 
+                         keep_connection_open=keep_connection_open, default=False)
+    
+    def aggregate(self, table: str, aggregates: Aggregates, query: Optional[Dict[str, Any]] = None, 
+                  group_by: Tuple[str, ...] = (), row_format: str = 'dict', 
+                  keep_connection_open: bool = False) -> Any:
+        """Compute aggregates over records of MySQL database, per group if group_by is given."""
+        return self._run(aggregate_records, table, aggregates, query, group_by, row_format, 
+                         keep_connection_open=keep_connection_open, default=[] if group_by else None)
+    
     def create_table(self, table: str, schema: Dict[str, str], 
                      primary_key: str = 'id', 
                      auto_increment: bool = True,
                      if_not_exists: bool = True,
                      keep_connection_open: bool = False) -> bool:
         """Create a table in MySQL database."""
-        try:
-            if not self.connected:
-                self.connect()
-            
-            result = create_table(self.connection, table, schema, 
-                                  primary_key, auto_increment, if_not_exists)
-            
-            if not keep_connection_open:
-                self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                self.disconnect()
-            return False
+        return self._run(create_table, table, schema, 
+                         primary_key, auto_increment, if_not_exists, 
+                         keep_connection_open=keep_connection_open, default=False)
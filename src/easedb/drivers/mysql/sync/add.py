@@ -0,0 +1,56 @@
+"""Synchronous MySQL add operation."""
+
+from decimal import Decimal
+from typing import Any, Dict, Union
+
+from ...filters import query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+def add_record(connection: Any, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+               column: str = 'value') -> bool:
+    """
+    Add a value to a numeric column of the matching records of MySQL database.
+    
+    The sum is computed by the database as column = column + %s, so
+    concurrent increments of the same record are never lost.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to update
+    :param query: Dictionary specifying which record(s) to update
+    :param value: Numeric value to add to the existing value
+    :param column: Name of the column to update (default: 'value')
+    :return: True if update was successful, False otherwise
+    """
+    cursor = None
+    try:
+        if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+            logger.error(f"Invalid value type. Must be int, float or Decimal, got {type(value)}")
+            return False
+        
+        if not query:
+            logger.error("No query conditions provided to identify record(s)")
+            return False
+        
+        cursor = connection.cursor()
+        statement = compile_statement('mysql', 'increment', table, query_shape(query), (column,))
+        sql, params = statement.sql, statement.params({column: value}, query)
+        
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
+        
+        cursor.execute(sql, params)
+        connection.commit()
+        
+        hot_logger.info("Successfully added {} to {} in record(s) in {}", value, column, table)
+        
+        return True
+        
+    except Exception as e:
+        if connection:
+            connection.rollback()
+        logger.error(f"Error adding value to record in {table}: {e}")
+        return False
+    
+    finally:
+        if cursor:
+            cursor.close()
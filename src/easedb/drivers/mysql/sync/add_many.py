@@ -0,0 +1,45 @@
+"""Synchronous MySQL bulk add operation."""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ...statements import compile_statement, group_increments
+from ....logger import logger, hot_logger
+
+def add_many_records(connection: Any, table: str, 
+                     increments: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Optional[int]:
+    """
+    Add values to numeric columns of many records of MySQL database in one transaction.
+    
+    Increments with the same query shape and columns share one
+    UPDATE ... SET column = column + %s statement sent with executemany.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to update
+    :param increments: (query, column -> amount) pairs, e.g. ({'id': 7}, {'views': 3})
+    :return: Number of records updated, None if the transaction was rolled back
+    """
+    updated = 0
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        for (query_keys, columns), params in group_increments(increments).items():
+            sql = compile_statement('mysql', 'increment', table, query_keys, columns).sql
+            hot_logger.info("Executing SQL: {} for {} records", sql, len(params))
+            
+            cursor.executemany(sql, params)
+            updated += cursor.rowcount
+        connection.commit()
+        
+        hot_logger.info("Added to {} records in {}", updated, table)
+        
+        return updated
+        
+    except Exception as e:
+        if connection:
+            connection.rollback()
+        logger.error(f"Error bulk adding to records in {table}: {e}")
+        return None
+    
+    finally:
+        if cursor:
+            cursor.close()
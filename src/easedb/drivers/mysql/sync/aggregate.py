@@ -0,0 +1,45 @@
+"""Synchronous MySQL aggregate operation."""
+
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils import get_columns_from_cursor
+from ...filters import query_shape
+from ...rows import format_row, format_rows
+from ...statements import Aggregates, compile_aggregate
+from ....logger import logger, hot_logger
+
+def aggregate_records(connection: Any, table: str, aggregates: Aggregates, 
+                      query: Optional[Dict[str, Any]] = None, group_by: Tuple[str, ...] = (), 
+                      row_format: str = 'dict') -> Any:
+    """
+    Compute aggregates over the records of a MySQL table in one statement.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to aggregate
+    :param aggregates: Validated (alias, function, column) triples
+    :param query: Optional dictionary of conditions to filter records
+    :param group_by: Columns to group by
+    :param row_format: Format of the result row, or of each group's row
+    :return: One row of aggregates, or one row per group if group_by is given
+    """
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        statement = compile_aggregate('mysql', table, aggregates, query_shape(query), group_by)
+        sql, params = statement.sql, statement.params(query=query)
+        
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
+        
+        cursor.execute(sql, params)
+        columns = get_columns_from_cursor(cursor)
+        if group_by:
+            return format_rows(cursor.fetchall(), columns, row_format)
+        return format_row(cursor.fetchone(), columns, row_format)
+        
+    except Exception as e:
+        logger.error(f"Error aggregating records of table {table}: {e}")
+        return [] if group_by else None
+    
+    finally:
+        if cursor:
+            cursor.close()
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ....logger import logger, hot_logger
 
 def create_table(connection: Any, table: str, schema: Dict[str, str], 
                  primary_key: str = 'id', 
@@ -45,7 +45,7 @@ def create_table(connection: Any, table: str, schema: Dict[str, str],
         else:
             sql = f"CREATE TABLE `{table}` ({columns_str})"
 
-        logger.info(f"Executing SQL: {sql}")
+        hot_logger.info("Executing SQL: {}", sql)
         
         # Execute table creation
         cursor.execute(sql)
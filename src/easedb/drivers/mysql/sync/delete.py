@@ -2,18 +2,20 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ...filters import query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 def delete_record(connection: Any, table: str, query: Dict[str, Any]) -> bool:
     """Delete a record from MySQL database."""
     try:
         cursor = connection.cursor()
-        where_clause = ' AND '.join([f"{k} = %s" for k in query.keys()])
-        sql = f"DELETE FROM {table} WHERE {where_clause}"
+        statement = compile_statement('mysql', 'delete', table, query_shape(query))
+        sql, params = statement.sql, statement.params(query=query)
 
-        logger.info(f"Executing SQL: {sql} | Parameters: {list(query.values())}")
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
         
-        cursor.execute(sql, list(query.values()))
+        cursor.execute(sql, params)
         connection.commit()
         cursor.close()
         
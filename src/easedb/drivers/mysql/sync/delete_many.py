@@ -0,0 +1,49 @@
+"""Synchronous MySQL bulk delete operation."""
+
+from typing import Any, Iterable
+
+from ...filters import in_chunks, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+def delete_many_records(connection: Any, table: str, values: Iterable[Any], 
+                        key: str = 'id', chunk_size: int = 1000) -> int:
+    """
+    Delete the records of MySQL database whose key column matches any of the values.
+    
+    Values are deleted with one IN query per chunk, all committed as one
+    transaction.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to delete from
+    :param values: Values of the key column to delete
+    :param key: Column the values are looked up in
+    :param chunk_size: Maximum number of values per IN list
+    :return: Number of records deleted, 0 if the transaction was rolled back
+    """
+    deleted = 0
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        for chunk in in_chunks(values, chunk_size):
+            query = {f"{key}__in": chunk}
+            statement = compile_statement('mysql', 'delete', table, query_shape(query))
+            hot_logger.info("Executing SQL: {}", statement.sql)
+            
+            cursor.execute(statement.sql, statement.params(query=query))
+            deleted += cursor.rowcount
+        connection.commit()
+        
+        hot_logger.info("Deleted {} records from {}", deleted, table)
+        
+        return deleted
+        
+    except Exception as e:
+        if connection:
+            connection.rollback()
+        logger.error(f"Error bulk deleting records from {table}: {e}")
+        return 0
+    
+    finally:
+        if cursor:
+            cursor.close()
@@ -2,20 +2,22 @@
 
 from typing import Any, Dict, Optional, Union, List
 
-from ..utils import row_to_dict, get_columns_from_cursor
-from ....logger import logger
+from ..utils import get_columns_from_cursor
+from ...rows import format_rows
+from ....logger import logger, hot_logger
 
-def execute_query(connection: Any, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None) -> Any:
-    """Execute a raw SQL query."""
+def execute_query(connection: Any, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                  row_format: str = 'dict') -> Any:
+    """Execute a raw SQL query, returning SELECT results in the given row format."""
     try:
-        logger.info(f"Executing SQL: {query} | Parameters: {params}")
+        hot_logger.info("Executing SQL: {} | Parameters: {}", query, params)
 
         cursor = connection.cursor()
         cursor.execute(query, params or ())
         
         if query.strip().upper().startswith('SELECT'):
             columns = get_columns_from_cursor(cursor)
-            result = [row_to_dict(row, columns) for row in cursor.fetchall()]
+            result = format_rows(cursor.fetchall(), columns, row_format)
             cursor.close()
             return result
         else:
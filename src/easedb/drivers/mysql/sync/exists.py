@@ -0,0 +1,28 @@
+"""Synchronous MySQL exists operation."""
+
+from typing import Any, Dict, Optional
+
+from ...filters import query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+def record_exists(connection: Any, table: str, query: Optional[Dict[str, Any]] = None) -> bool:
+    """Check with SELECT 1 ... LIMIT 1 whether any record of a MySQL table matches a query."""
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        statement = compile_statement('mysql', 'exists', table, query_shape(query))
+        sql, params = statement.sql, statement.params(query=query)
+        
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
+        
+        cursor.execute(sql, params)
+        return cursor.fetchone() is not None
+        
+    except Exception as e:
+        logger.error(f"Error checking records in table {table}: {e}")
+        return False
+    
+    finally:
+        if cursor:
+            cursor.close()
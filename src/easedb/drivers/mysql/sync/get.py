@@ -1,30 +1,32 @@
 """Synchronous MySQL get operation."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from ..utils import row_to_dict, get_columns_from_cursor
-from ....logger import logger
+from ..utils import get_columns_from_cursor
+from ...rows import format_row
+from ...statements import OrderBy, select_statement
+from ....logger import logger, hot_logger
 
-def get_record(connection: Any, table: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Get a record from MySQL database."""
+def get_record(connection: Any, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+               columns: Tuple[str, ...] = (), order_by: OrderBy = ()) -> Optional[Any]:
+    """Get a record from MySQL database in the given row format."""
     try:
         cursor = connection.cursor()
-        where_clause = ' AND '.join([f"{k} = %s" for k in query.keys()])
-        sql = f"SELECT * FROM {table} WHERE {where_clause}"
+        sql, params = select_statement('mysql', table, query, columns, order_by, 1)
 
-        logger.info(f"Executing SQL: {sql} | Parameters: {list(query.values())}")
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
         
-        cursor.execute(sql, list(query.values()))
+        cursor.execute(sql, params)
         columns = get_columns_from_cursor(cursor)
         row = cursor.fetchone()
         cursor.close()
 
         if row:
-            logger.info(f"Record retrieved: {row}")
+            hot_logger.info("Record retrieved: {}", row)
         else:
-            logger.info(f"No record found for query: {query}")
+            hot_logger.info("No record found for query: {}", query)
         
-        return row_to_dict(row, columns) if row else None
+        return format_row(row, columns, row_format) if row else None
         
     except Exception as e:
         # Log the error
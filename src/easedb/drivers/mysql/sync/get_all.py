@@ -1,40 +1,37 @@
 """Synchronous MySQL get all records operation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import traceback
 
+from ..utils import get_columns_from_cursor
+from ...rows import format_rows
+from ...statements import OrderBy, select_statement
 from easedb import logger
+from easedb.logger import hot_logger
 
-def get_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+def get_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None, 
+                    row_format: str = 'dict', columns: Tuple[str, ...] = (), 
+                    order_by: OrderBy = (), limit: Optional[int] = None) -> Any:
     """
     Retrieve all records from a MySQL database table.
     
     :param connection: Active database connection
     :param table: Name of the table to retrieve records from
     :param query: Optional dictionary of filter conditions
-    :return: List of records matching the query
+    :param row_format: 'dict', 'tuple', 'namedtuple' or 'columnar'
+    :param columns: Columns to return, all of them if empty
+    :param order_by: Parsed (column, descending) pairs to sort by
+    :param limit: Maximum number of records to return
+    :return: List of records matching the query, or a ColumnarResult
     """
     cursor = None
     try:
-        # Create cursor with dictionary output
-        cursor = connection.cursor(dictionary=True)
+        cursor = connection.cursor()
         
-        # Construct base SQL query
-        sql = f"SELECT * FROM {table}"
-
-        
-        # Add WHERE clause if query is provided
-        params = []
-        if query:
-            conditions = []
-            for key, value in query.items():
-                conditions.append(f"{key} = %s")
-                params.append(value)
-            
-            if conditions:
-                sql += " WHERE " + " AND ".join(conditions)
+        # Construct SQL query, with a WHERE clause if query is provided
+        sql, params = select_statement('mysql', table, query, columns, order_by, limit)
         
-        logger.info(f"Executing SQL: {sql} | Parameters: {params}")
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
         
         # Execute query
         if params:
@@ -43,9 +40,10 @@ def get_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]]
             cursor.execute(sql)
         
         # Fetch all records
-        records = cursor.fetchall()
+        columns = get_columns_from_cursor(cursor)
+        records = format_rows(cursor.fetchall(), columns, row_format)
 
-        logger.info(f"Retrieved {len(records)} records from table {table}")
+        hot_logger.info("Retrieved {} records from table {}", len(records), table)
         
         return records
     
@@ -0,0 +1,52 @@
+"""Synchronous MySQL get_many operation."""
+
+from typing import Any, Dict, Iterable, Tuple
+
+from ..utils import get_columns_from_cursor
+from ...filters import in_chunks
+from ...rows import format_row
+from ...statements import select_statement
+from ....logger import logger, hot_logger
+
+def get_many_records(connection: Any, table: str, key: str, values: Iterable[Any], 
+                     columns: Tuple[str, ...] = (), row_format: str = 'dict', 
+                     chunk_size: int = 500) -> Dict[Any, Any]:
+    """
+    Retrieve the records whose key column matches any of the values, with one query per chunk.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to retrieve records from
+    :param key: Column the values are looked up in
+    :param values: Values to look up
+    :param columns: Columns to return, all of them if empty
+    :param row_format: 'dict', 'tuple' or 'namedtuple'
+    :param chunk_size: Maximum number of values per IN list
+    :return: Dictionary of key value to record, without the values not found
+    """
+    cursor = None
+    try:
+        records = {}
+        cursor = connection.cursor()
+        # The key is selected even if not requested, to map rows back to values
+        selected = columns + (key,) if columns and key not in columns else columns
+        width = len(columns) or None
+        for chunk in in_chunks(values, chunk_size):
+            sql, params = select_statement('mysql', table, {f"{key}__in": chunk}, selected)
+            hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
+            
+            cursor.execute(sql, params)
+            result_columns = get_columns_from_cursor(cursor)
+            index = result_columns.index(key)
+            for row in cursor.fetchall():
+                records.setdefault(row[index], format_row(row[:width], result_columns[:width], row_format))
+        
+        hot_logger.info("Retrieved {} records from table {}", len(records), table)
+        return records
+    
+    except Exception as e:
+        logger.error(f"Error retrieving records by {key} from table {table}: {e}")
+        return {}
+    
+    finally:
+        if cursor:
+            cursor.close()
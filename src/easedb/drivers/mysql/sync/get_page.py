@@ -0,0 +1,45 @@
+"""Synchronous MySQL keyset pagination operation."""
+
+from typing import Any, Dict, List, Optional
+
+from ..utils import get_columns_from_cursor
+from ...pagination import OrderBy, Page, make_page, page_statement
+from ....logger import logger, hot_logger
+
+def get_page_records(connection: Any, table: str, query: Optional[Dict[str, Any]], 
+                     order_by: OrderBy, after: Optional[List[Any]], limit: int, 
+                     row_format: str = 'dict') -> Page:
+    """
+    Retrieve one page of records from a MySQL table, continuing after a keyset.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to retrieve records from
+    :param query: Optional dictionary of filter conditions
+    :param order_by: Parsed (column, descending) pairs
+    :param after: Order-by values of the last record of the previous page, or None
+    :param limit: Maximum number of records on the page
+    :param row_format: 'dict', 'tuple', 'namedtuple' or 'columnar'
+    :return: The page, empty on error
+    """
+    cursor = None
+    try:
+        sql, params = page_statement('mysql', table, query, order_by, after, limit)
+        cursor = connection.cursor()
+        
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
+        
+        cursor.execute(sql, params)
+        columns = get_columns_from_cursor(cursor)
+        page = make_page(cursor.fetchall(), columns, order_by, limit, row_format)
+
+        hot_logger.info("Retrieved {} records from table {}", len(page), table)
+        
+        return page
+    
+    except Exception as e:
+        logger.error(f"Error retrieving page of records from table {table}: {e}")
+        return Page([], None)
+    
+    finally:
+        if cursor:
+            cursor.close()
@@ -0,0 +1,54 @@
+"""Synchronous MySQL streaming get all records operation."""
+
+from typing import Any, Dict, Iterator, Optional
+
+from ..utils import row_to_dict, get_columns_from_cursor
+from ...filters import query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+def iter_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None, 
+                     batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over records from a MySQL database table.
+    
+    Uses an unbuffered cursor, so the server streams the result and at most
+    batch_size rows are held in memory at a time. The connection cannot run
+    other queries until the iteration has finished.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to retrieve records from
+    :param query: Optional dictionary of filter conditions
+    :param batch_size: Number of rows fetched per round
+    :return: Iterator over records matching the query
+    """
+    cursor = None
+    try:
+        statement = compile_statement('mysql', 'select', table, query_shape(query))
+        sql, params = statement.sql, statement.params(query=query)
+        
+        cursor = connection.cursor(buffered=False)
+        
+        hot_logger.info("Executing streaming SQL: {} | Parameters: {}", sql, params)
+        
+        cursor.execute(sql, params)
+        columns = get_columns_from_cursor(cursor)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield row_to_dict(row, columns)
+    
+    except Exception as e:
+        logger.error(f"Error streaming records from table {table}: {e}")
+    
+    finally:
+        try:
+            # Drain rows left behind by an early exit so the connection stays usable
+            if getattr(connection, 'unread_result', False):
+                connection.consume_results()
+            if cursor:
+                cursor.close()
+        except Exception as close_error:
+            logger.error(f"Error closing cursor: {close_error}")
@@ -0,0 +1,51 @@
+"""Synchronous MySQL streaming query operation."""
+
+from typing import Any, Iterator, List, Tuple
+
+from ..utils import get_columns_from_cursor
+from ....logger import logger, hot_logger
+
+def iter_query_batches(connection: Any, sql: str, params: Any = None, 
+                       batch_size: int = 1000) -> Iterator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]]:
+    """
+    Iterate over the rows of a query on MySQL database in batches.
+    
+    Uses an unbuffered cursor, so the server streams the result and at most
+    batch_size rows are held in memory at a time. The first batch is
+    yielded even when it is empty, so the columns of an empty result are
+    known. The connection cannot run other queries until the iteration has
+    finished.
+    
+    :param connection: Active database connection
+    :param sql: SELECT statement
+    :param params: Parameters bound to the statement
+    :param batch_size: Number of rows fetched per round
+    :return: Iterator over (columns, rows) pairs
+    """
+    cursor = None
+    try:
+        cursor = connection.cursor(buffered=False)
+        
+        hot_logger.info("Executing streaming SQL: {} | Parameters: {}", sql, params)
+        
+        cursor.execute(sql, params)
+        columns = get_columns_from_cursor(cursor)
+        rows = cursor.fetchmany(batch_size)
+        while True:
+            yield columns, rows
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+    
+    except Exception as e:
+        logger.error(f"Error streaming query results: {e}")
+    
+    finally:
+        try:
+            # Drain rows left behind by an early exit so the connection stays usable
+            if getattr(connection, 'unread_result', False):
+                connection.consume_results()
+            if cursor:
+                cursor.close()
+        except Exception as close_error:
+            logger.error(f"Error closing cursor: {close_error}")
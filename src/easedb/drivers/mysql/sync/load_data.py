@@ -0,0 +1,56 @@
+"""Synchronous MySQL LOAD DATA LOCAL INFILE operation."""
+
+from typing import Any, Optional, Sequence
+
+from ..utils import load_data_statement
+from ...files import csv_header
+from ....logger import logger, hot_logger
+
+def load_data_file(connection: Any, table: str, path: str, 
+                   columns: Optional[Sequence[str]] = None, 
+                   null: Optional[str] = None) -> Optional[int]:
+    """
+    Load a CSV file into MySQL database with LOAD DATA LOCAL INFILE.
+    
+    The server parses the whole file in one statement, committed as one
+    transaction. The connection must be opened with allow_local_infile.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to load into
+    :param path: Path of a CSV file starting with a header line
+    :param columns: Header columns to load, all of them if omitted
+    :param null: Field loaded as NULL, None to load every field as is
+    :return: Number of records loaded, None if the server's local_infile is OFF or loading failed
+    """
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT @@local_infile")
+        if not cursor.fetchone()[0]:
+            hot_logger.info("Server does not allow LOAD DATA LOCAL INFILE, inserting {} instead", path)
+            return None
+        
+        header, terminator = csv_header(path)
+        sql = load_data_statement(table, header, terminator, columns, null)
+        params = (path,)
+        if null is not None:
+            params += (null,) * len([name for name in header if not columns or name in columns])
+        hot_logger.info("Executing SQL: {} | Parameters: {}", sql, params)
+        
+        cursor.execute(sql, params)
+        loaded = cursor.rowcount
+        connection.commit()
+        
+        hot_logger.info("Loaded {} records into {}", loaded, table)
+        
+        return loaded
+        
+    except Exception as e:
+        if connection:
+            connection.rollback()
+        logger.error(f"Error loading {path} into {table}: {e}")
+        return None
+    
+    finally:
+        if cursor:
+            cursor.close()
@@ -2,24 +2,23 @@
 
 from typing import Any, Dict
 
-from ..utils import format_placeholders
-from ....logger import logger
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 def set_record(connection: Any, table: str, data: Dict[str, Any]) -> bool:
     """Insert a record into MySQL database."""
     try:
         cursor = connection.cursor()
-        columns = ', '.join(data.keys())
-        placeholders = format_placeholders(data)
-        sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        statement = compile_statement('mysql', 'insert', table, (), tuple(data))
+        sql = statement.sql
         
-        logger.info(f"Executing SQL: {sql} | Data: {data}")
+        hot_logger.info("Executing SQL: {} | Data: {}", sql, data)
         
-        cursor.execute(sql, list(data.values()))
+        cursor.execute(sql, statement.params(data=data))
         connection.commit()
         cursor.close()
 
-        logger.info(f"Record inserted successfully into {table}")
+        hot_logger.info("Record inserted successfully into {}", table)
 
         return True
         
@@ -0,0 +1,22 @@
+"""Synchronous MySQL transaction operations."""
+
+from typing import Any
+
+from ....logger import hot_logger
+
+def begin_transaction(connection: Any) -> None:
+    """Start an explicit transaction."""
+    # With autocommit off a previous read may have opened an implicit transaction
+    if connection.in_transaction:
+        connection.rollback()
+    hot_logger.debug("Executing SQL: START TRANSACTION")
+    connection.start_transaction()
+
+def execute_savepoint(connection: Any, statement: str) -> None:
+    """Execute a SAVEPOINT, RELEASE SAVEPOINT or ROLLBACK TO SAVEPOINT statement."""
+    hot_logger.debug("Executing SQL: {}", statement)
+    cursor = connection.cursor()
+    try:
+        cursor.execute(statement)
+    finally:
+        cursor.close()
@@ -2,7 +2,9 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ...filters import query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 def update_record(connection: Any, table: str, query: Dict[str, Any], data: Dict[str, Any]) -> bool:
     """Update a record in MySQL database."""
@@ -18,25 +20,19 @@ def update_record(connection: Any, table: str, query: Dict[str, Any], data: Dict
 
         cursor = connection.cursor()
         
-        # Construct the SET clause for update values
-        set_clause = ', '.join([f"{k} = %s" for k in data.keys()])
-        
-        # Construct the WHERE clause for the query conditions
-        where_clause = ' AND '.join([f"{k} = %s" for k in query.keys()])
-        
-        # Combine the SQL statement
-        sql = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+        # Build the SET and WHERE clauses for the update values and query conditions
+        statement = compile_statement('mysql', 'update', table, query_shape(query), tuple(data))
         
         # Combine values: first update values, then query conditions
-        values = list(data.values()) + list(query.values())
+        sql, values = statement.sql, statement.params(data, query)
         
-        logger.info(f"Executing SQL: {sql} | Values: {values}")
+        hot_logger.info("Executing SQL: {} | Values: {}", sql, values)
 
         cursor.execute(sql, values)
         connection.commit()
         cursor.close()
         
-        logger.info(f"Record updated successfully in {table}")
+        hot_logger.info("Record updated successfully in {}", table)
 
         return True
         
@@ -0,0 +1,121 @@
+"""Keyset pagination shared by all drivers."""
+
+import base64
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .filters import Condition, query_shape, query_values
+from .rows import format_rows
+from .statements import (PLACEHOLDERS, OrderBy, compile_statement, order_by_clause,
+                         parse_order_by, quote_identifier)
+
+class Page:
+    """
+    One page of a keyset-paginated result.
+
+    :param records: Records of this page in the requested row format
+    :param after: Order-by values of the last record, or None on the last page
+    """
+
+    __slots__ = ('records', 'after')
+
+    def __init__(self, records: Any, after: Optional[Dict[str, Any]]):
+        self.records = records
+        self.after = after
+
+    @property
+    def has_more(self) -> bool:
+        """Whether another page follows this one."""
+        return self.after is not None
+
+    @property
+    def token(self) -> Optional[str]:
+        """Opaque continuation token for the next page, or None on the last page."""
+        return encode_token(self.after) if self.after is not None else None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.records)
+
+    def __repr__(self) -> str:
+        return f"Page(records={len(self.records)}, after={self.after!r})"
+
+def encode_token(after: Dict[str, Any]) -> str:
+    """Encode the order-by values of a record as a URL-safe continuation token."""
+    payload = json.dumps(after, separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """Decode a continuation token produced by encode_token."""
+    try:
+        after = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except ValueError as e:
+        raise ValueError(f"Invalid continuation token: {token!r}") from e
+    if not isinstance(after, dict):
+        raise ValueError(f"Invalid continuation token: {token!r}")
+    return after
+
+def resolve_after(after: Union[None, str, Dict[str, Any]], order_by: OrderBy) -> Optional[List[Any]]:
+    """Return the order-by values to continue after, from a token or a dictionary."""
+    if after is None:
+        return None
+    if isinstance(after, str):
+        after = decode_token(after)
+    try:
+        return [after[column] for column, _ in order_by]
+    except KeyError as e:
+        raise ValueError(f"after is missing the order_by column {e.args[0]!r}") from None
+
+@lru_cache(maxsize=256)
+def compile_page(dialect: str, table: str, query_keys: Tuple[Condition, ...],
+                 order_by: OrderBy, keyset: bool) -> Tuple[str, Tuple[int, ...]]:
+    """
+    Build the SQL of a page and the order in which the keyset values are bound.
+
+    The keyset condition is expanded to (a > ?) OR (a = ? AND b > ?) ...,
+    which allows mixed sort directions and lets both SQLite and MySQL seek
+    on an index over the order-by columns instead of skipping rows.
+
+    :return: The SQL and, for each keyset placeholder, the index of its order-by value
+    """
+    placeholder = PLACEHOLDERS[dialect]
+    sql = compile_statement(dialect, 'select', table, query_keys).sql
+    value_order: List[int] = []
+
+    if keyset:
+        branches = []
+        for position, (column, descending) in enumerate(order_by):
+            terms = [f"{quote_identifier(name)} = {placeholder}" for name, _ in order_by[:position]]
+            terms.append(f"{quote_identifier(column)} {'<' if descending else '>'} {placeholder}")
+            value_order.extend(range(position + 1))
+            branches.append(' AND '.join(terms))
+        condition = ' OR '.join(f"({branch})" for branch in branches)
+        sql += f" {'AND' if query_keys else 'WHERE'} ({condition})"
+
+    sql += f" {order_by_clause(order_by)} LIMIT {placeholder}"
+    return sql, tuple(value_order)
+
+def page_statement(dialect: str, table: str, query: Optional[Dict[str, Any]],
+                   order_by: OrderBy, after: Optional[List[Any]], limit: int) -> Tuple[str, List[Any]]:
+    """Return the SQL and parameters fetching one record more than limit, to detect a next page."""
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    sql, value_order = compile_page(dialect, table, query_shape(query), order_by, after is not None)
+    params = query_values(query)
+    if after is not None:
+        params.extend([after[index] for index in value_order])
+    params.append(limit + 1)
+    return sql, params
+
+def make_page(rows: Sequence[Sequence[Any]], columns: Tuple[str, ...], order_by: OrderBy,
+              limit: int, row_format: str = 'dict') -> Page:
+    """Build a Page from up to limit + 1 fetched rows."""
+    after = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        after = {column: last[columns.index(column)] for column, _ in order_by}
+    return Page(format_rows(rows, columns, row_format), after)
@@ -0,0 +1,79 @@
+"""Row formats shared by all drivers."""
+
+from collections import namedtuple
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+ROW_FORMATS = ('dict', 'tuple', 'namedtuple', 'columnar')
+
+class ColumnarResult:
+    """
+    Query result stored column by column.
+
+    Holds one tuple of values per column and a single copy of the column
+    names, so no per-row object is allocated.
+
+    :param columns: Column names in result order
+    :param rows: Rows as returned by the cursor
+    """
+
+    __slots__ = ('columns', 'values', '_length')
+
+    def __init__(self, columns: Tuple[str, ...], rows: Sequence[Sequence[Any]]):
+        self.columns = columns
+        self.values: List[Tuple[Any, ...]] = list(zip(*rows)) if rows else [() for _ in columns]
+        self._length = len(rows)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, column: str) -> Tuple[Any, ...]:
+        """Return every value of a column."""
+        return self.values[self.columns.index(column)]
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        """Iterate over the rows as tuples."""
+        return zip(*self.values)
+
+    def __repr__(self) -> str:
+        return f"ColumnarResult(columns={self.columns!r}, rows={self._length})"
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert the result to the default list of dictionaries."""
+        return [dict(zip(self.columns, row)) for row in self]
+
+@lru_cache(maxsize=256)
+def namedtuple_class(columns: Tuple[str, ...]) -> type:
+    """Return the namedtuple class for a column set, created once per set."""
+    # rename=True keeps columns that are not valid identifiers usable by position
+    return namedtuple('Row', columns, rename=True)
+
+def check_row_format(row_format: str, single: bool = False) -> None:
+    """Raise ValueError for an unknown row format, or 'columnar' for a single row."""
+    formats = ROW_FORMATS[:-1] if single else ROW_FORMATS
+    if row_format not in formats:
+        raise ValueError(f"Unsupported row format: {row_format!r}, expected one of {formats}")
+
+def format_row(row: Sequence[Any], columns: Tuple[str, ...], row_format: str = 'dict') -> Any:
+    """Convert a single row to the requested format."""
+    if row_format == 'dict':
+        return dict(zip(columns, row))
+    if row_format == 'tuple':
+        return tuple(row)
+    if row_format == 'namedtuple':
+        return namedtuple_class(columns)._make(row)
+    raise ValueError(f"Unsupported row format for a single row: {row_format!r}")
+
+def format_rows(rows: Sequence[Sequence[Any]], columns: Tuple[str, ...], row_format: str = 'dict') -> Any:
+    """Convert fetched rows to the requested format, a list or a ColumnarResult."""
+    if row_format == 'dict':
+        return [dict(zip(columns, row)) for row in rows]
+    if row_format == 'tuple':
+        # Every driver's default cursor already returns plain tuples
+        return list(rows)
+    if row_format == 'namedtuple':
+        # tuple.__new__ skips the per-row length check of _make()
+        return list(map(partial(tuple.__new__, namedtuple_class(columns)), rows))
+    if row_format == 'columnar':
+        return ColumnarResult(columns, rows)
+    raise ValueError(f"Unsupported row format: {row_format!r}")
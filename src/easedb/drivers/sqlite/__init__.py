@@ -1,6 +1,23 @@
 """SQLite database driver implementation."""
 
-from .sync import SQLiteDriver
-from .aio import AsyncSQLiteDriver
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .sync import SQLiteDriver
+    from .aio import AsyncSQLiteDriver
+
+# Driver class -> submodule defining it, imported on first access
+# so the sync driver never loads aiosqlite
+_DRIVERS = {
+    'SQLiteDriver': '.sync',
+    'AsyncSQLiteDriver': '.aio',
+}
 
 __all__ = ['SQLiteDriver', 'AsyncSQLiteDriver']
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule of a driver class on first access."""
+    if name in _DRIVERS:
+        return getattr(import_module(_DRIVERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,40 +1,75 @@
 """Asynchronous SQLite driver implementation."""
 
 import aiosqlite
-from typing import Any, Dict, Optional, Union, List
+import contextvars
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ...base import AsyncDatabaseDriver
-from ..utils import parse_connection_string
+from ...files import read_rows
+from ...pagination import Page, parse_order_by, resolve_after
+from ...statements import Aggregates, select_options, source_statement
+from ...transaction import Transaction, AsyncTransactionConnection, TransactionGate
+from ..utils import parse_connection_string, pragma_statements, split_pragma_options
 from .get import get_record
 from .get_all import get_all_records
+from .iter_all import iter_all_records
+from .iter_batches import iter_query_batches
+from .get_page import get_page_records
+from .get_many import get_many_records
 from .set import set_record
+from .set_many import set_many_records
+from .upsert import upsert_record
+from .upsert_many import upsert_many_records
 from .update import update_record
+from .update_many import update_many_records
 from .delete import delete_record
+from .delete_many import delete_many_records
+from .add import add_record
+from .sub import sub_record
+from .add_many import add_many_records
 from .execute import execute_query
-from .count import count_records
+from .count import count_records, estimate_records
+from .exists import record_exists
+from .aggregate import aggregate_records
 from .create_table import create_table
-from ....logger import logger
+from .transaction import begin_transaction, execute_savepoint
+from ....logger import logger, hot_logger
 
 class AsyncSQLiteDriver(AsyncDatabaseDriver):
     """Asynchronous SQLite database driver."""
     
     def __init__(self, connection_string: str):
         """Initialize async SQLite driver."""
-        self.connection_params = parse_connection_string(connection_string)
+        self.connection_params, pragmas = split_pragma_options(
+            parse_connection_string(connection_string)
+        )
+        # Applied to every new connection, see PRAGMA_OPTIONS and PRAGMA_PRESETS
+        self.pragma_statements = pragma_statements(pragmas)
         self.connection = None
         self.connected = False
+        # Blocks currently using the connection, which is only closed when the last one exits
+        self._active = 0
+        # Transaction opened by transaction() in the current task, if any
+        self._transaction = contextvars.ContextVar(f'easedb_transaction_{id(self)}', default=None)
+        # Keeps the commits of other tasks out of an open transaction on the shared connection
+        self._gate = TransactionGate()
     
     async def connect(self) -> bool:
         """Establish connection to SQLite database asynchronously."""
         try:
             if not self.connected:
-                logger.info("Attempting to connect to SQLite database with parameters:")
+                hot_logger.info("Attempting to connect to SQLite database with parameters:")
                 for key, value in self.connection_params.items():
                     if key != 'password':  # Avoid printing sensitive info
-                        logger.info(f"{key}: {value}")
+                        hot_logger.info("{}: {}", key, value)
                 self.connection = await aiosqlite.connect(**self.connection_params)
+                for statement in self.pragma_statements:
+                    hot_logger.debug("Executing SQL: {}", statement)
+                    await self.connection.execute(statement)
                 self.connected = True
-                logger.info("SQLite connection established successfully.")
+                hot_logger.info("SQLite connection established successfully.")
             return True
         except Exception as e:
             logger.error(f"Error connecting to database: {e}")
@@ -46,29 +81,110 @@ class AsyncSQLiteDriver(AsyncDatabaseDriver):
             if self.connected and self.connection:
                 await self.connection.close()
                 self.connected = False
-                logger.info("SQLite connection closed successfully.")
+                hot_logger.info("SQLite connection closed successfully.")
             return True
         except Exception as e:
             logger.error(f"Error disconnecting from database: {e}")
             return False
     
-    async def get(self, table: str, query: Dict[str, Any], 
-                keep_connection_open: bool = False) -> Optional[Dict[str, Any]]:
-        """Get a record from SQLite database asynchronously."""
+    @asynccontextmanager
+    async def _connection(self, keep_connection_open: bool = False) -> AsyncIterator[Any]:
+        """
+        Provide the live connection for the duration of a block asynchronously.
+        
+        Connects first if needed and, unless keep_connection_open is set,
+        closes the connection again once no other block, such as a running
+        iter_all(), is using it.
+        """
+        transaction = self._transaction.get()
+        if transaction is not None:
+            yield transaction.proxy
+            return
+        
+        self._active += 1
         try:
             if not self.connected:
                 await self.connect()
-        
-            result = await get_record(self.connection, table, query)
-        
-            if not keep_connection_open:
+            yield self.connection
+        finally:
+            self._active -= 1
+            if not keep_connection_open and not self._active:
                 await self.disconnect()
+    
+    @asynccontextmanager
+    async def _shared(self) -> AsyncIterator[None]:
+        """Run an operation outside the transaction of another task, see TransactionGate."""
+        if self._transaction.get() is not None:
+            yield
+            return
+        async with self._gate.shared():
+            yield
+    
+    async def _run(self, operation: Callable[..., Awaitable[Any]], *args: Any,
+                   keep_connection_open: bool = False, default: Any = None, **kwargs: Any) -> Any:
+        """Run an operation on the live connection, returning default if it raises."""
+        try:
+            async with self._shared(), self._connection(keep_connection_open) as connection:
+                return await operation(connection, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error in {operation.__name__}: {e}")
+            return default
+    
+    @asynccontextmanager
+    async def transaction(self, keep_connection_open: bool = False) -> AsyncIterator[None]:
+        """
+        Run the operations of a block in a single transaction asynchronously.
         
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return None
+        Per-operation commits are deferred and one COMMIT is issued when the
+        block exits, or ROLLBACK if it raises or an operation inside it
+        failed (TransactionError). Nested blocks use savepoints. Operations
+        of other tasks wait until the transaction has finished.
+        """
+        transaction = self._transaction.get()
+        if transaction is not None:
+            name = transaction.savepoint()
+            await execute_savepoint(transaction.connection, f"SAVEPOINT {name}")
+            try:
+                yield
+                transaction.raise_if_failed()
+            except BaseException:
+                transaction.failed = False
+                await execute_savepoint(transaction.connection, f"ROLLBACK TO SAVEPOINT {name}")
+                raise
+            finally:
+                transaction.depth -= 1
+                await execute_savepoint(transaction.connection, f"RELEASE SAVEPOINT {name}")
+            return
+        
+        async with self._gate.exclusive(), self._connection(keep_connection_open) as connection:
+            await begin_transaction(connection)
+            transaction = Transaction(connection, AsyncTransactionConnection)
+            token = self._transaction.set(transaction)
+            try:
+                yield
+                transaction.raise_if_failed()
+                await connection.commit()
+            except BaseException:
+                await connection.rollback()
+                raise
+            finally:
+                self._transaction.reset(token)
+    
+    async def get(self, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+                  columns: Optional[List[str]] = None, order_by: Union[None, str, List[str]] = None, 
+                  keep_connection_open: bool = False) -> Optional[Any]:
+        """Get a record from SQLite database asynchronously."""
+        columns, order = select_options(columns, order_by)
+        return await self._run(get_record, table, query, row_format, columns, order, 
+                               keep_connection_open=keep_connection_open)
+    
+    async def get_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                       columns: Optional[List[str]] = None, row_format: str = 'dict', 
+                       chunk_size: int = 500, keep_connection_open: bool = False) -> Dict[Any, Any]:
+        """Get the records of SQLite database whose key is in values asynchronously, keyed by that value."""
+        columns, _ = select_options(columns)
+        return await self._run(get_many_records, table, key, values, columns, row_format, chunk_size, 
+                               keep_connection_open=keep_connection_open, default={})
     
     async def get_all(
         self, 
@@ -76,50 +192,73 @@ class AsyncSQLiteDriver(AsyncDatabaseDriver):
         query: Optional[Dict[str, Any]] = None, 
         page: Optional[int] = None, 
         page_size: Optional[int] = None,
+        row_format: str = 'dict',
+        columns: Optional[List[str]] = None,
+        order_by: Union[None, str, List[str]] = None,
+        limit: Optional[int] = None,
         keep_connection_open: bool = False
-    ) -> List[Dict[str, Any]]:
+    ) -> Any:
         """Get all records from SQLite database asynchronously with optional pagination."""
-        try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await get_all_records(
-                self.connection, 
-                table, 
-                query=query, 
-                page=page, 
-                page_size=page_size
-            )
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception as e:
-            logger.error(f"Error in get_all: {e}")
-            if not keep_connection_open:
-                await self.disconnect()
-            return []
+        columns, order = select_options(columns, order_by, limit)
+        return await self._run(get_all_records, table, 
+                               query=query, page=page, page_size=page_size, 
+                               row_format=row_format, columns=columns, order_by=order, limit=limit, 
+                               keep_connection_open=keep_connection_open, default=[])
                 
+    async def iter_all(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                       batch_size: int = 1000, 
+                       keep_connection_open: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over records from SQLite database asynchronously without loading them all into memory."""
+        async with self._connection(keep_connection_open) as connection:
+            async for record in iter_all_records(connection, table, query, batch_size):
+                yield record
+    
+    async def iter_batches(self, source: str, query: Optional[Dict[str, Any]] = None, 
+                           params: Optional[Union[tuple, Dict[str, Any]]] = None, batch_size: int = 1000, 
+                           keep_connection_open: bool = False
+                           ) -> AsyncIterator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]]:
+        """Iterate over the rows of a table or SELECT statement of SQLite database asynchronously in (columns, rows) batches."""
+        sql, params = source_statement('sqlite', source, query, params)
+        async with self._connection(keep_connection_open) as connection:
+            async for batch in iter_query_batches(connection, sql, params, batch_size):
+                yield batch
+    
+    async def get_page(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                       order_by: Union[str, List[str]] = 'id', 
+                       after: Union[None, str, Dict[str, Any]] = None, limit: int = 100, 
+                       row_format: str = 'dict', keep_connection_open: bool = False) -> Page:
+        """Get one keyset-paginated page of records from SQLite database asynchronously."""
+        order = parse_order_by(order_by)
+        return await self._run(get_page_records, table, query, order, resolve_after(after, order), 
+                               limit, row_format, 
+                               keep_connection_open=keep_connection_open, default=Page([], None))
+    
     async def set(self, table: str, data: Dict[str, Any], 
                 keep_connection_open: bool = False) -> bool:
         """Insert a record into SQLite database asynchronously."""
-        try:
-            if not self.connected:
-                await self.connect()
-        
-            result = await set_record(self.connection, table, data)
-        
-            if not keep_connection_open:
-                await self.disconnect()
-        
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return False
+        return await self._run(set_record, table, data, 
+                               keep_connection_open=keep_connection_open, default=False)
+    
+    async def set_many(self, table: str, rows: Iterable[Dict[str, Any]], 
+                       chunk_size: int = 1000, keep_connection_open: bool = False) -> int:
+        """Insert multiple records into SQLite database asynchronously, one transaction per chunk."""
+        return await self._run(set_many_records, table, rows, chunk_size, 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def upsert(self, table: str, data: Dict[str, Any], conflict_keys: Tuple[str, ...], 
+                     update_columns: Tuple[str, ...], keep_connection_open: bool = False) -> bool:
+        """Insert a record into SQLite database asynchronously, or update the record it conflicts with."""
+        return await self._run(upsert_record, table, data, conflict_keys, update_columns, 
+                               keep_connection_open=keep_connection_open, default=False)
     
-    async def update(self, table: str, *args, **kwargs) -> bool:
+    async def upsert_many(self, table: str, rows: Iterable[Dict[str, Any]], conflict_keys: Tuple[str, ...], 
+                          update_columns: Tuple[str, ...], chunk_size: int = 1000, 
+                          keep_connection_open: bool = False) -> int:
+        """Insert or update multiple records in SQLite database asynchronously, one transaction per chunk."""
+        return await self._run(upsert_many_records, table, rows, conflict_keys, update_columns, chunk_size, 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def update(self, table: str, *args, keep_connection_open: bool = False, **kwargs) -> bool:
         """Update a record in SQLite database asynchronously.
         
         Four calling styles are supported:
@@ -133,20 +272,15 @@ class AsyncSQLiteDriver(AsyncDatabaseDriver):
            await db.update(table="table", query={"id": 1}, data={"name": "new_name"})
         """
         try:
-            if not self.connected:
-                await self.connect()
-            
             # Handle keyword arguments
             if kwargs.get('table') and kwargs.get('query') and kwargs.get('data'):
                 table = kwargs['table']
                 query = kwargs['query']
                 data = kwargs['data']
-                result = await update_record(self.connection, table, query, data)
             
             # Handle two positional arguments
             elif len(args) == 2 and isinstance(args[0], dict) and isinstance(args[1], dict):
                 query, data = args
-                result = await update_record(self.connection, table, query, data)
             
             # Handle single dictionary style
             elif len(args) == 1 and isinstance(args[0], dict):
@@ -157,97 +291,124 @@ class AsyncSQLiteDriver(AsyncDatabaseDriver):
                 
                 # Use first key as query condition
                 query_key = list(data.keys())[0]
-                query_value = data[query_key]
+                query = {query_key: data[query_key]}
                 
                 # Remove the query key from update data
-                update_data = {k: v for k, v in data.items() if k != query_key}
-                
-                result = await update_record(
-                    self.connection, 
-                    table, 
-                    {query_key: query_value}, 
-                    update_data
-                )
+                data = {k: v for k, v in data.items() if k != query_key}
             
             # Handle keyword arguments query and data
             elif kwargs.get('query') and kwargs.get('data'):
                 query = kwargs['query']
                 data = kwargs['data']
-                result = await update_record(self.connection, table, query, data)
             
             else:
                 raise ValueError("Invalid arguments for update method")
-            
-            await self.disconnect()
-            return result
         
         except Exception as e:
             logger.error(f"Error in update: {e}")
-            await self.disconnect()
+            if not keep_connection_open:
+                await self.disconnect()
             return False
+        
+        return await self._run(update_record, table, query, data, 
+                               keep_connection_open=keep_connection_open, default=False)
             
 
     async def delete(self, table: str, query: Dict[str, Any], 
                   keep_connection_open: bool = False) -> bool:
         """Delete a record from SQLite database asynchronously."""
-        try:
-            if not self.connected:
-                await self.connect()
-        
-            result = await delete_record(self.connection, table, query)
+        return await self._run(delete_record, table, query, 
+                               keep_connection_open=keep_connection_open, default=False)
+    
+    async def update_many(self, table: str, rows: Iterable[Dict[str, Any]], key: str = 'id', 
+                          chunk_size: int = 1000, keep_connection_open: bool = False) -> int:
+        """Update multiple records of SQLite database asynchronously by key with executemany, in one transaction."""
+        return await self._run(update_many_records, table, rows, key, chunk_size, 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def delete_many(self, table: str, values: Iterable[Any], key: str = 'id', 
+                          chunk_size: int = 1000, keep_connection_open: bool = False) -> int:
+        """Delete the records of SQLite database asynchronously whose key is in values, in one transaction."""
+        return await self._run(delete_many_records, table, values, key, chunk_size, 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def import_file(self, table: str, path: str, format: str, chunk_size: int = 1000, 
+                          columns: Optional[List[str]] = None, progress: Optional[Callable[[int], None]] = None, 
+                          null: Optional[str] = '', keep_connection_open: bool = False) -> int:
+        """Stream a CSV or JSON Lines file into SQLite database asynchronously with executemany, committing each chunk."""
+        return await self._run(set_many_records, table, read_rows(path, format, columns, null), chunk_size, progress, 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def add(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+                  column: str = 'value', keep_connection_open: bool = False) -> bool:
+        """
+        Add a specified value to an existing numeric column in the database.
         
-            if not keep_connection_open:
-                await self.disconnect()
+        :param table: Name of the table
+        :param query: Dictionary specifying which record(s) to update
+        :param value: Numeric value to add to the existing value
+        :param column: Name of the column to update (default: 'value')
+        :param keep_connection_open: Whether to keep the connection open after operation
+        :return: True if update was successful, False otherwise
+        """
+        return await self._run(add_record, table, query, value, column, 
+                               keep_connection_open=keep_connection_open, default=False)
+    
+    async def sub(self, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+                  column: str = 'value', keep_connection_open: bool = False) -> bool:
+        """
+        Subtract a specified value from an existing numeric column in the database.
         
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return False
+        :param table: Name of the table
+        :param query: Dictionary specifying which record(s) to update
+        :param value: Numeric value to subtract from the existing value
+        :param column: Name of the column to update (default: 'value')
+        :param keep_connection_open: Whether to keep the connection open after operation
+        :return: True if update was successful, False otherwise
+        """
+        return await self._run(sub_record, table, query, value, column, 
+                               keep_connection_open=keep_connection_open, default=False)
+    
+    async def add_many(self, table: str, increments: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]], 
+                       keep_connection_open: bool = False) -> Optional[int]:
+        """Add (query, column -> amount) increments to records of SQLite database asynchronously, in one transaction."""
+        return await self._run(add_many_records, table, increments, 
+                               keep_connection_open=keep_connection_open, default=None)
     
     async def execute(self, query: str, 
                     params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                    row_format: str = 'dict', 
                     keep_connection_open: bool = False) -> Any:
         """Execute a raw SQL query asynchronously."""
-        try:
-            if not self.connected:
-                await self.connect()
-        
-            result = await execute_query(self.connection, query, params)
-        
-            if not keep_connection_open:
-                await self.disconnect()
-        
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return None
+        return await self._run(execute_query, query, params, row_format, 
+                               keep_connection_open=keep_connection_open)
+    
+    async def count(self, table: str, query: Optional[Dict[str, Any]] = None, approximate: bool = False, 
+                    keep_connection_open: bool = False) -> int:
+        """Count records in SQLite database asynchronously, or estimate the size of the whole table."""
+        return await self._run(estimate_records if approximate else count_records, table, 
+                               *(() if approximate else (query,)), 
+                               keep_connection_open=keep_connection_open, default=0)
+    
+    async def exists(self, table: str, query: Optional[Dict[str, Any]] = None, 
+                     keep_connection_open: bool = False) -> bool:
+        """Check whether any record of SQLite database matches a query asynchronously."""
+        return await self._run(record_exists, table, query, 
+                               keep_connection_open=keep_connection_open, default=False)
+    
+    async def aggregate(self, table: str, aggregates: Aggregates, query: Optional[Dict[str, Any]] = None, 
+                        group_by: Tuple[str, ...] = (), row_format: str = 'dict', 
+                        keep_connection_open: bool = False) -> Any:
+        """Compute aggregates over records of SQLite database asynchronously, per group if group_by is given."""
+        return await self._run(aggregate_records, table, aggregates, query, group_by, row_format, 
+                               keep_connection_open=keep_connection_open, default=[] if group_by else None)
     
-    async def count(self, table: str, query: Optional[Dict[str, Any]] = None) -> int:
-        """Count records in SQLite database asynchronously."""
-        if not self.connected:
-            await self.connect()
-        return await count_records(self.connection, table, query)
-
     async def create_table(self, table: str, schema: Dict[str, str], 
                            primary_key: str = 'id', 
                            auto_increment: bool = True,
                            if_not_exists: bool = True,
                            keep_connection_open: bool = False) -> bool:
         """Create a table in SQLite database asynchronously."""
-        try:
-            if not self.connected:
-                await self.connect()
-            
-            result = await create_table(self.connection, table, schema, 
-                                        primary_key, auto_increment, if_not_exists)
-            
-            if not keep_connection_open:
-                await self.disconnect()
-            
-            return result
-        except Exception:
-            if not keep_connection_open:
-                await self.disconnect()
-            return False
+        return await self._run(create_table, table, schema, 
+                               primary_key, auto_increment, if_not_exists, 
+                               keep_connection_open=keep_connection_open, default=False)
@@ -1,9 +1,12 @@
-"""Asynchronous count method for SQLite database."""
+"""Asynchronous count operations for SQLite database."""
 
 from typing import Dict, Any, Optional
 import aiosqlite
 
-from ....logger import logger
+from ..utils import SQLITE_MAX_VARIABLES
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 async def count_records(connection: aiosqlite.Connection, table: str, query: Optional[Dict[str, Any]] = None) -> int:
     """
@@ -15,28 +18,50 @@ async def count_records(connection: aiosqlite.Connection, table: str, query: Opt
     :return: Number of records matching the query
     """
     try:
-        # If no query is provided, count all records
-        if query is None:
+        # IN lists longer than SQLite's variable limit are split, a row matches one part at most
+        count = 0
+        for part in chunk_query(query, SQLITE_MAX_VARIABLES):
             # If no query is provided, count all records
-            sql = f"SELECT COUNT(*) FROM {table}"
-            params = []
-        else:
-            # Construct a parameterized query with the provided conditions
-            where_clauses = [f"{k} = ?" for k in query.keys()]
-            sql = f"SELECT COUNT(*) FROM {table} WHERE {' AND '.join(where_clauses)}"
-            params = list(query.values())        
+            statement = compile_statement('sqlite', 'count', table, query_shape(part))
+            sql, params = statement.sql, statement.params(query=part)
 
-        logger.debug(f"Executing count query: {sql} | Parameters: {params}")
-        
-        async with connection.execute(sql, params) as cursor:
-            result = await cursor.fetchone()
-            count = result[0] if result else 0
+            hot_logger.debug("Executing count query: {} | Parameters: {}", sql, params)
             
-            # Log the result
-            logger.info(f"Count query result: {count} record(s) found in table '{table}'.")
-            return count
+            async with connection.execute(sql, params) as cursor:
+                result = await cursor.fetchone()
+                count += result[0] if result else 0
+        
+        # Log the result
+        hot_logger.info("Count query result: {} record(s) found in table '{}'.", count, table)
+        return count
 
     except Exception as e:
         logger.error(f"Error counting records in table '{table}': {e}")
-        logger.debug(f"Failed query: {sql if 'sql' in locals() else 'Unknown'} | Parameters: {params if 'params' in locals() else 'Unknown'}")
+        hot_logger.debug("Failed query: {} | Parameters: {}", sql if 'sql' in locals() else 'Unknown', params if 'params' in locals() else 'Unknown')
         return 0
+
+async def estimate_records(connection: aiosqlite.Connection, table: str) -> int:
+    """
+    Asynchronously estimate the number of records of a SQLite table from the sqlite_stat1 statistics.
+    
+    The statistics are gathered by ANALYZE (or PRAGMA optimize) and read
+    without scanning the table. Tables that were never analyzed are counted
+    exactly.
+    
+    :param connection: Active database connection
+    :param table: Name of the table
+    :return: Estimated number of records
+    """
+    try:
+        async with connection.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = ?", (table,)) as cursor:
+            rows = await cursor.fetchall()
+    except Exception as e:
+        # sqlite_stat1 only exists once ANALYZE has run on the database
+        hot_logger.debug("No statistics for {}, counting exactly: {}", table, e)
+        rows = []
+    if not rows:
+        return await count_records(connection, table)
+    # The first number of every statistic is the row count of the table or of an index on it
+    estimate = max(int(row[0].split()[0]) for row in rows)
+    hot_logger.info("Estimated {} record(s) in table '{}'.", estimate, table)
+    return estimate
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 
-from ....logger import logger
+from ....logger import logger, hot_logger
 
 async def create_table(connection: Any, table: str, schema: Dict[str, str], 
                        primary_key: Optional[str] = None, 
@@ -47,12 +47,12 @@ async def create_table(connection: Any, table: str, schema: Dict[str, str],
             else:
                 sql = f"CREATE TABLE `{table}` ({columns_str})"
 
-            logger.debug(f"Executing table creation query: {sql}")
+            hot_logger.debug("Executing table creation query: {}", sql)
             
             # Execute table creation
             await cursor.execute(sql)
         
-        logger.info(f"Table '{table}' created successfully.")
+        hot_logger.info("Table '{}' created successfully.", table)
         
         return True
     
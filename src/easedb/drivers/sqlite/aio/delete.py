@@ -2,21 +2,27 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ..utils import SQLITE_MAX_VARIABLES
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 async def delete_record(connection: Any, table: str, query: Dict[str, Any]) -> bool:
     """Delete a record from SQLite database asynchronously."""
+    sql = None
     try:
-        where_clause = ' AND '.join([f"{k} = ?" for k in query.keys()])
-        sql = f"DELETE FROM {table} WHERE {where_clause}"
+        # IN lists longer than SQLite's variable limit are split into statements of one commit
+        for part in chunk_query(query, SQLITE_MAX_VARIABLES):
+            statement = compile_statement('sqlite', 'delete', table, query_shape(part))
+            sql, params = statement.sql, statement.params(query=part)
 
-        logger.debug(f"Executing delete query: {sql}")
-        logger.trace(f"Parameters: {query}")
+            hot_logger.debug("Executing delete query: {}", sql)
+            logger.trace(f"Parameters: {part}")
+            
+            await connection.execute(sql, params)
+        await connection.commit()
         
-        async with connection.execute(sql, list(query.values())) as cursor:
-            await connection.commit()
-        
-        logger.info(f"Record deleted successfully from '{table}' with query: {query}")
+        hot_logger.info("Record deleted successfully from '{}' with query: {}", table, query)
         return True
         
     except Exception as e:
@@ -2,24 +2,26 @@
 
 from typing import Any, Dict, Optional, Union, List
 
-from ..utils import row_to_dict, get_columns_from_cursor
-from ....logger import logger  
+from ..utils import get_columns_from_cursor
+from ...rows import format_rows
+from ....logger import logger, hot_logger  
 
-async def execute_query(connection: Any, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None) -> Any:
-    """Execute a raw SQL query asynchronously."""
+async def execute_query(connection: Any, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                        row_format: str = 'dict') -> Any:
+    """Execute a raw SQL query asynchronously, returning SELECT results in the given row format."""
     try:
         async with connection.execute(query, params or ()) as cursor:
             if query.strip().upper().startswith('SELECT'):
                 columns = get_columns_from_cursor(cursor)
                 rows = await cursor.fetchall()
-                records = [row_to_dict(row, columns) for row in rows]
+                records = format_rows(rows, columns, row_format)
 
-                logger.info(f"Query executed successfully: {len(records)} records retrieved.")
+                hot_logger.info("Query executed successfully: {} records retrieved.", len(records))
 
                 return records
             else:
                 await connection.commit()
-                logger.info("Query executed successfully: Changes committed.")
+                hot_logger.info("Query executed successfully: Changes committed.")
 
                 return True
                 
@@ -0,0 +1,26 @@
+"""Asynchronous SQLite exists operation."""
+
+from typing import Any, Dict, Optional
+
+from ..utils import SQLITE_MAX_VARIABLES
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+async def record_exists(connection: Any, table: str, query: Optional[Dict[str, Any]] = None) -> bool:
+    """Check asynchronously with SELECT 1 ... LIMIT 1 whether any record of a SQLite table matches a query."""
+    try:
+        for part in chunk_query(query, SQLITE_MAX_VARIABLES):
+            statement = compile_statement('sqlite', 'exists', table, query_shape(part))
+            sql, params = statement.sql, statement.params(query=part)
+
+            hot_logger.debug("Preparing SQL Query: {} | Parameters: {}", sql, params)
+            
+            async with connection.execute(sql, params) as cursor:
+                if await cursor.fetchone() is not None:
+                    return True
+        return False
+
+    except Exception as e:
+        logger.error(f"Error checking records in table '{table}': {e}")
+        return False
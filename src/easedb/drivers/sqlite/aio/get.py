@@ -1,30 +1,43 @@
 """Asynchronous SQLite get operation."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from ..utils import row_to_dict, get_columns_from_cursor
-from ....logger import logger
+from ..utils import SQLITE_MAX_VARIABLES, get_columns_from_cursor
+from ...filters import chunk_query, extend_projection, merge_rows
+from ...rows import format_row
+from ...statements import OrderBy, select_statement
+from ....logger import logger, hot_logger
 
-async def get_record(connection: Any, table: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Get a record from SQLite database asynchronously."""
+async def get_record(connection: Any, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+                     columns: Tuple[str, ...] = (), order_by: OrderBy = ()) -> Optional[Any]:
+    """Get a record from SQLite database asynchronously in the given row format."""
     try:
-        where_clause = ' AND '.join([f"{k} = ?" for k in query.keys()])
-        sql = f"SELECT * FROM {table} WHERE {where_clause}"
-        
-        logger.debug(f"Preparing SQL Query: {sql} | Parameters: {list(query.values())}")
+        # IN lists longer than SQLite's variable limit are split, see chunk_query
+        parts = chunk_query(query, SQLITE_MAX_VARIABLES)
+        selected = extend_projection(columns, order_by) if len(parts) > 1 else columns
+        rows = []
+        for part in parts:
+            sql, params = select_statement('sqlite', table, part, selected, order_by, 1)
+            
+            hot_logger.debug("Preparing SQL Query: {} | Parameters: {}", sql, params)
 
-        async with connection.execute(sql, list(query.values())) as cursor:
-            columns = get_columns_from_cursor(cursor)
-            row = await cursor.fetchone()
+            async with connection.execute(sql, params) as cursor:
+                result_columns = get_columns_from_cursor(cursor)
+                rows.extend(await cursor.fetchall())
+            if rows and not order_by:
+                break
+        if len(parts) > 1:
+            rows = merge_rows(rows, result_columns, order_by, 1, len(columns))
+            result_columns = result_columns[:len(columns) or None]
 
-            if row:
-                # Info log for successful retrieval
-                logger.info(f"Record retrieved from {table}: {row}")
-                return row_to_dict(row, columns)
-            else:
-                # Debug log if no record found
-                logger.debug(f"No record found in {table} matching: {query}")
-                return None
+        if rows:
+            # Info log for successful retrieval
+            hot_logger.info("Record retrieved from {}: {}", table, rows[0])
+            return format_row(rows[0], result_columns, row_format)
+        else:
+            # Debug log if no record found
+            hot_logger.debug("No record found in {} matching: {}", table, query)
+            return None
                 
     except Exception as e:
         logger.error(f"Error retrieving record from {table}: {e}")
@@ -1,17 +1,24 @@
 """Asynchronous SQLite get_all operation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..utils import row_to_dict, get_columns_from_cursor
-from ....logger import logger  
+from ..utils import SQLITE_MAX_VARIABLES, get_columns_from_cursor
+from ...filters import chunk_query, extend_projection, merge_rows
+from ...rows import format_rows
+from ...statements import OrderBy, select_statement
+from ....logger import logger, hot_logger  
 
 async def get_all_records(
     connection: Any, 
     table: str, 
     query: Optional[Dict[str, Any]] = None, 
     page: Optional[int] = None, 
-    page_size: Optional[int] = None
-) -> List[Dict[str, Any]]:
+    page_size: Optional[int] = None,
+    row_format: str = 'dict',
+    columns: Tuple[str, ...] = (),
+    order_by: OrderBy = (),
+    limit: Optional[int] = None
+) -> Any:
     """
     Get all records from SQLite database asynchronously.
     
@@ -20,45 +27,57 @@ async def get_all_records(
     :param query: Optional dictionary of conditions to filter records
     :param page: Optional page number for pagination (1-indexed)
     :param page_size: Optional number of records per page
-    :return: List of records matching the query
+    :param row_format: 'dict', 'tuple', 'namedtuple' or 'columnar'
+    :param columns: Columns to return, all of them if empty
+    :param order_by: Parsed (column, descending) pairs to sort by
+    :param limit: Maximum number of records to return
+    :return: List of records matching the query, or a ColumnarResult
     """
     try:
-        if query is None:
-            # If no query is provided, fetch all records
-            sql = f"SELECT * FROM {table}"
-            params = []
-            logger.debug(f"Fetching all records from table '{table}'")
-        else:
-            # Construct a parameterized query with the provided conditions
-            where_clause = ' AND '.join([f"{k} = ?" for k in query.keys()])
-            sql = f"SELECT * FROM {table} WHERE {where_clause}"
-            params = list(query.values())
-            logger.debug(f"Fetching records from table '{table}' with query: {query}")
+        # IN lists longer than SQLite's variable limit are split, see chunk_query
+        parts = chunk_query(query, SQLITE_MAX_VARIABLES)
+        hot_logger.debug("Fetching records from table '{}' with query: {}", table, query)
 
         # Add pagination if both page and page_size are provided
-        if page is not None and page_size is not None:
+        paginate = page is not None and page_size is not None
+        offset = 0
+        if paginate:
             if page < 1 or page_size < 1:
                 raise ValueError("Page and page_size must be positive integers")
             
             # Calculate OFFSET for pagination (convert to 0-indexed)
             offset = (page - 1) * page_size
-            sql += " LIMIT ? OFFSET ?"
-            params.extend([page_size, offset])
-            logger.debug(f"Applying pagination: page {page}, page_size {page_size}")
+            hot_logger.debug("Applying pagination: page {}, page_size {}", page, page_size)
+            if len(parts) > 1:
+                # Every part returns its first rows up to the page end, the page is cut after merging
+                limit = offset + page_size
 
-        logger.trace(f"Executing SQL: {sql} | Parameters: {params}")
-        
-        async with connection.execute(sql, params) as cursor:
-            columns = get_columns_from_cursor(cursor)
-            rows = await cursor.fetchall()
-            records = [row_to_dict(row, columns) for row in rows]
+        selected = extend_projection(columns, order_by) if len(parts) > 1 else columns
+        rows = []
+        for part in parts:
+            # Without a query the statement has no WHERE clause and fetches all records
+            sql, params = select_statement('sqlite', table, part, selected, order_by, limit)
+            if paginate and len(parts) == 1:
+                sql += " LIMIT ? OFFSET ?"
+                params.extend([page_size, offset])
 
-            if records:
-                logger.info(f"Retrieved {len(records)} records from '{table}'")
-            else:
-                logger.debug(f"No records found in '{table}' with query: {query}")
+            logger.trace(f"Executing SQL: {sql} | Parameters: {params}")
             
-            return records
+            async with connection.execute(sql, params) as cursor:
+                result_columns = get_columns_from_cursor(cursor)
+                rows.extend(await cursor.fetchall())
+        if len(parts) > 1:
+            rows = merge_rows(rows, result_columns, order_by, limit, len(columns))[offset:]
+            result_columns = result_columns[:len(columns) or None]
+
+        records = format_rows(rows, result_columns, row_format)
+
+        if records:
+            hot_logger.info("Retrieved {} records from '{}'", len(records), table)
+        else:
+            hot_logger.debug("No records found in '{}' with query: {}", table, query)
+        
+        return records
             
     except Exception as e:
         logger.error(f"Error retrieving records from '{table}': {e}")
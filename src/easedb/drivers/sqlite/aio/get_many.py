@@ -0,0 +1,46 @@
+"""Asynchronous SQLite get_many operation."""
+
+from typing import Any, Dict, Iterable, Tuple
+
+from ..utils import SQLITE_MAX_VARIABLES, get_columns_from_cursor
+from ...filters import in_chunks
+from ...rows import format_row
+from ...statements import select_statement
+from ....logger import logger, hot_logger
+
+async def get_many_records(connection: Any, table: str, key: str, values: Iterable[Any], 
+                           columns: Tuple[str, ...] = (), row_format: str = 'dict', 
+                           chunk_size: int = 500) -> Dict[Any, Any]:
+    """
+    Get the records whose key column matches any of the values asynchronously, one query per chunk.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to retrieve records from
+    :param key: Column the values are looked up in
+    :param values: Values to look up
+    :param columns: Columns to return, all of them if empty
+    :param row_format: 'dict', 'tuple' or 'namedtuple'
+    :param chunk_size: Maximum number of values per IN list
+    :return: Dictionary of key value to record, without the values not found
+    """
+    try:
+        records = {}
+        # The key is selected even if not requested, to map rows back to values
+        selected = columns + (key,) if columns and key not in columns else columns
+        width = len(columns) or None
+        for chunk in in_chunks(values, min(chunk_size, SQLITE_MAX_VARIABLES)):
+            sql, params = select_statement('sqlite', table, {f"{key}__in": chunk}, selected)
+            hot_logger.debug("Preparing SQL Query: {} | Parameters: {}", sql, params)
+            
+            async with connection.execute(sql, params) as cursor:
+                result_columns = get_columns_from_cursor(cursor)
+                index = result_columns.index(key)
+                for row in await cursor.fetchall():
+                    records.setdefault(row[index], format_row(row[:width], result_columns[:width], row_format))
+        
+        hot_logger.debug("Found {} records in {}", len(records), table)
+        return records
+            
+    except Exception as e:
+        logger.error(f"Error retrieving records by {key} from {table}: {e}")
+        return {}
@@ -0,0 +1,46 @@
+"""Asynchronous SQLite streaming get_all operation."""
+
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ..utils import SQLITE_MAX_VARIABLES, row_to_dict, get_columns_from_cursor
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger
+
+async def iter_all_records(
+    connection: Any, 
+    table: str, 
+    query: Optional[Dict[str, Any]] = None, 
+    batch_size: int = 1000
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over records from SQLite database asynchronously.
+    
+    Rows are fetched with fetchmany, so at most batch_size rows are held in
+    memory at a time regardless of the size of the result.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to retrieve records from
+    :param query: Optional dictionary of conditions to filter records
+    :param batch_size: Number of rows fetched per round
+    :return: Async iterator over records matching the query
+    """
+    try:
+        # IN lists longer than SQLite's variable limit are split, see chunk_query
+        for part in chunk_query(query, SQLITE_MAX_VARIABLES):
+            statement = compile_statement('sqlite', 'select', table, query_shape(part))
+            sql, params = statement.sql, statement.params(query=part)
+            
+            logger.trace(f"Executing streaming SQL: {sql} | Parameters: {params}")
+            
+            async with connection.execute(sql, params) as cursor:
+                columns = get_columns_from_cursor(cursor)
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row_to_dict(row, columns)
+            
+    except Exception as e:
+        logger.error(f"Error streaming records from '{table}': {e}")
@@ -0,0 +1,40 @@
+"""Asynchronous SQLite streaming query operation."""
+
+from typing import Any, AsyncIterator, List, Tuple
+
+from ..utils import get_columns_from_cursor
+from ....logger import logger, hot_logger
+
+async def iter_query_batches(
+    connection: Any, 
+    sql: str, 
+    params: Any = None, 
+    batch_size: int = 1000
+) -> AsyncIterator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]]:
+    """
+    Iterate over the rows of a query on SQLite database asynchronously in batches.
+    
+    Rows are fetched with fetchmany, so at most batch_size rows are held in
+    memory at a time. The first batch is yielded even when it is empty, so
+    the columns of an empty result are known.
+    
+    :param connection: Active database connection
+    :param sql: SELECT statement
+    :param params: Parameters bound to the statement
+    :param batch_size: Number of rows fetched per round
+    :return: Async iterator over (columns, rows) pairs
+    """
+    try:
+        hot_logger.debug("Executing streaming SQL: {} | Parameters: {}", sql, params)
+        
+        async with connection.execute(sql, params or ()) as cursor:
+            columns = get_columns_from_cursor(cursor)
+            rows = await cursor.fetchmany(batch_size)
+            while True:
+                yield columns, [tuple(row) for row in rows]
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+            
+    except Exception as e:
+        logger.error(f"Error streaming query results: {e}")
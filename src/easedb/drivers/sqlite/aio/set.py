@@ -1,23 +1,23 @@
 """Asynchronous SQLite set operation."""
 
 from typing import Any, Dict
-from ....logger import logger
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 
 
 async def set_record(connection: Any, table: str, data: Dict[str, Any]) -> bool:
     """Insert a record into SQLite database asynchronously."""
     try:
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        statement = compile_statement('sqlite', 'insert', table, (), tuple(data))
+        sql, params = statement.sql, statement.params(data=data)
 
-        logger.debug(f"Preparing SQL Query: {sql} | Parameters: {list(data.values())}")
+        hot_logger.debug("Preparing SQL Query: {} | Parameters: {}", sql, params)
         
-        async with connection.execute(sql, list(data.values())) as cursor:
+        async with connection.execute(sql, params) as cursor:
             await connection.commit()
         
-        logger.info(f"Inserted record into {table}: {data}")
+        hot_logger.info("Inserted record into {}: {}", table, data)
 
         return True
         
@@ -0,0 +1,49 @@
+"""Asynchronous SQLite bulk insert operation."""
+
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from ...statements import compile_statement
+from ..utils import chunked
+from ....logger import logger, hot_logger
+
+async def set_many_records(connection: Any, table: str, rows: Iterable[Dict[str, Any]], 
+                           chunk_size: int = 1000, 
+                           progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Insert multiple records into SQLite database asynchronously.
+    
+    Rows are inserted with executemany and committed once per chunk, so a
+    large load costs one transaction per chunk instead of one per row. All
+    rows must have the same keys as the first one.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to insert into
+    :param rows: Iterable of records, may be a generator
+    :param chunk_size: Number of rows inserted per transaction
+    :param progress: Called with the number of records inserted so far after each committed chunk
+    :return: Number of records inserted
+    """
+    inserted = 0
+    sql = None
+    try:
+        for chunk in chunked(rows, chunk_size):
+            if sql is None:
+                columns = list(chunk[0].keys())
+                sql = compile_statement('sqlite', 'insert', table, (), tuple(columns)).sql
+                hot_logger.debug("Preparing bulk insert query: {}", sql)
+            
+            await connection.executemany(sql, [tuple(row[column] for column in columns) for row in chunk])
+            await connection.commit()
+            inserted += len(chunk)
+            if progress is not None:
+                progress(inserted)
+        
+        hot_logger.info("Inserted {} records into {}", inserted, table)
+        
+        return inserted
+        
+    except Exception as e:
+        if connection:
+            await connection.rollback()
+        logger.error(f"Error bulk inserting records into {table} after {inserted} rows: {e}")
+        return inserted
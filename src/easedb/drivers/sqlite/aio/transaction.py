@@ -0,0 +1,15 @@
+"""Asynchronous SQLite transaction operations."""
+
+from typing import Any
+
+from ....logger import hot_logger
+
+async def begin_transaction(connection: Any) -> None:
+    """Start an explicit transaction asynchronously."""
+    hot_logger.debug("Executing SQL: BEGIN")
+    await connection.execute("BEGIN")
+
+async def execute_savepoint(connection: Any, statement: str) -> None:
+    """Execute a SAVEPOINT, RELEASE SAVEPOINT or ROLLBACK TO SAVEPOINT statement asynchronously."""
+    hot_logger.debug("Executing SQL: {}", statement)
+    await connection.execute(statement)
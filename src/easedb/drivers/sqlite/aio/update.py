@@ -2,7 +2,10 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ..utils import SQLITE_MAX_VARIABLES
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 async def update_record(connection: Any, table: str, query: Dict[str, Any], data: Dict[str, Any]) -> bool:
     """Update a record in SQLite database asynchronously."""
@@ -15,24 +18,20 @@ async def update_record(connection: Any, table: str, query: Dict[str, Any], data
         if not data:
             return False
         
-        # Construct the query condition with double quotes for column names with spaces
-        where_clause = ' AND '.join([f'"{k}" = ?' for k in query.keys()])
-        set_clause = ', '.join([f'"{k}" = ?' for k in data.keys()])
-        
-        # Construct SQL query with proper table and column quoting
-        sql = f'UPDATE "{table}" SET {set_clause} WHERE {where_clause}'
-        
-        # Prepare values
-        values = list(data.values()) + list(query.values())
-
-        logger.debug(f"Executing update query: {sql} | Parameters: {values}")
-        
-        # Execute query
+        # IN lists longer than SQLite's variable limit are split into statements of one commit
         async with connection.cursor() as cursor:
-            await cursor.execute(sql, values)
+            for part in chunk_query(query, SQLITE_MAX_VARIABLES, reserved=len(data)):
+                # Construct SQL query with proper table and column quoting,
+                # values are data first, then query conditions
+                statement = compile_statement('sqlite', 'update', table, query_shape(part), tuple(data))
+                sql, values = statement.sql, statement.params(data, part)
+
+                hot_logger.debug("Executing update query: {} | Parameters: {}", sql, values)
+                
+                await cursor.execute(sql, values)
             await connection.commit()
         
-        logger.info(f"Record updated successfully in '{table}' with query: {query} and data: {data}")
+        hot_logger.info("Record updated successfully in '{}' with query: {} and data: {}", table, query, data)
         
         return True
         
@@ -40,6 +39,6 @@ async def update_record(connection: Any, table: str, query: Dict[str, Any], data
         if connection:
             await connection.rollback()
         logger.error(f"Error updating record in table '{table}': {e}")
-        logger.debug(f"Failed query: {sql if 'sql' in locals() else 'Unknown'} | Parameters: {values if 'values' in locals() else 'Unknown'}")        
+        hot_logger.debug("Failed query: {} | Parameters: {}", sql if 'sql' in locals() else 'Unknown', values if 'values' in locals() else 'Unknown')        
         return False
         
\ No newline at end of file
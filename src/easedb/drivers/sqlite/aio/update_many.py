@@ -0,0 +1,47 @@
+"""Asynchronous SQLite bulk update operation."""
+
+from typing import Any, Dict, Iterable
+
+from ..utils import chunked
+from ...statements import compile_statement, group_by_columns
+from ....logger import logger, hot_logger
+
+async def update_many_records(connection: Any, table: str, rows: Iterable[Dict[str, Any]], 
+                              key: str = 'id', chunk_size: int = 1000) -> int:
+    """
+    Update multiple records of SQLite database asynchronously, each identified by its key column.
+    
+    Rows setting the same columns share one UPDATE ... WHERE key = ? sent
+    with executemany, and all rows are committed as one transaction.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to update
+    :param rows: Iterable of records holding the key and the columns to set, may be a generator
+    :param key: Column identifying the record of each row
+    :param chunk_size: Number of rows sent per executemany call
+    :return: Number of records updated, 0 if the transaction was rolled back
+    """
+    updated = 0
+    try:
+        for chunk in chunked(rows, chunk_size):
+            for data_keys, group in group_by_columns(chunk, key).items():
+                if not data_keys:
+                    continue
+                sql = compile_statement('sqlite', 'update', table, (key,), data_keys).sql
+                hot_logger.debug("Preparing bulk update query: {} for {} rows", sql, len(group))
+                
+                cursor = await connection.executemany(sql, [[row[column] for column in data_keys] + [row[key]] 
+                                                            for row in group])
+                updated += cursor.rowcount
+                await cursor.close()
+        await connection.commit()
+        
+        hot_logger.info("Updated {} records in {}", updated, table)
+        
+        return updated
+        
+    except Exception as e:
+        if connection:
+            await connection.rollback()
+        logger.error(f"Error bulk updating records in {table}: {e}")
+        return 0
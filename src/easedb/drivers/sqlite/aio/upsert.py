@@ -0,0 +1,28 @@
+"""Asynchronous SQLite upsert operation."""
+
+from typing import Any, Dict, Tuple
+
+from ...statements import compile_upsert
+from ....logger import logger, hot_logger
+
+async def upsert_record(connection: Any, table: str, data: Dict[str, Any], 
+                        conflict_keys: Tuple[str, ...], update_columns: Tuple[str, ...]) -> bool:
+    """Insert a record into SQLite database asynchronously, or update the record it conflicts with."""
+    try:
+        statement = compile_upsert('sqlite', table, tuple(data), conflict_keys, update_columns)
+        sql, params = statement.sql, statement.params(data=data)
+
+        hot_logger.debug("Preparing SQL Query: {} | Parameters: {}", sql, params)
+        
+        async with connection.execute(sql, params):
+            await connection.commit()
+        
+        hot_logger.info("Upserted record into {}: {}", table, data)
+
+        return True
+        
+    except Exception as e:
+        if connection:
+            await connection.rollback()
+        logger.error(f"Error upserting record into {table}: {e}")
+        return False
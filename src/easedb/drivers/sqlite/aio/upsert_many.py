@@ -0,0 +1,46 @@
+"""Asynchronous SQLite bulk upsert operation."""
+
+from typing import Any, Dict, Iterable, Tuple
+
+from ..utils import chunked
+from ...statements import compile_upsert
+from ....logger import logger, hot_logger
+
+async def upsert_many_records(connection: Any, table: str, rows: Iterable[Dict[str, Any]], 
+                              conflict_keys: Tuple[str, ...], update_columns: Tuple[str, ...], 
+                              chunk_size: int = 1000) -> int:
+    """
+    Insert or update multiple records in SQLite database asynchronously.
+    
+    Rows are sent with executemany and committed once per chunk. All rows
+    must have the same keys as the first one.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to upsert into
+    :param rows: Iterable of records, may be a generator
+    :param conflict_keys: Columns of the unique key detecting an existing record
+    :param update_columns: Columns overwritten on a conflict
+    :param chunk_size: Number of rows upserted per transaction
+    :return: Number of records inserted or updated
+    """
+    upserted = 0
+    statement = None
+    try:
+        for chunk in chunked(rows, chunk_size):
+            if statement is None:
+                statement = compile_upsert('sqlite', table, tuple(chunk[0]), conflict_keys, update_columns)
+                hot_logger.debug("Preparing bulk upsert query: {}", statement.sql)
+            
+            await connection.executemany(statement.sql, [statement.params(data=row) for row in chunk])
+            await connection.commit()
+            upserted += len(chunk)
+        
+        hot_logger.info("Upserted {} records into {}", upserted, table)
+        
+        return upserted
+        
+    except Exception as e:
+        if connection:
+            await connection.rollback()
+        logger.error(f"Error bulk upserting records into {table} after {upserted} rows: {e}")
+        return upserted
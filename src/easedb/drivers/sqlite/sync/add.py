@@ -0,0 +1,54 @@
+"""Synchronous SQLite add operation."""
+
+from decimal import Decimal
+from typing import Any, Dict, Union
+
+from ..utils import SQLITE_MAX_VARIABLES
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+def add_record(connection: Any, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+               column: str = 'value') -> bool:
+    """
+    Add a value to a numeric column of the matching records of SQLite database.
+    
+    The sum is computed by the database as column = column + ?, so
+    concurrent increments of the same record are never lost.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to update
+    :param query: Dictionary specifying which record(s) to update
+    :param value: Numeric value to add to the existing value
+    :param column: Name of the column to update (default: 'value')
+    :return: True if update was successful, False otherwise
+    """
+    sql = None
+    try:
+        if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+            logger.error(f"Invalid value type. Must be int, float or Decimal, got {type(value)}")
+            return False
+        
+        if not query:
+            logger.error("No query conditions provided to identify record(s)")
+            return False
+        
+        # IN lists longer than SQLite's variable limit are split into statements of one commit
+        for part in chunk_query(query, SQLITE_MAX_VARIABLES, reserved=1):
+            statement = compile_statement('sqlite', 'increment', table, query_shape(part), (column,))
+            sql, values = statement.sql, statement.params({column: value}, part)
+            
+            hot_logger.debug("Executing SQL: {} | Parameters: {}", sql, values)
+            
+            connection.execute(sql, values)
+        connection.commit()
+        
+        hot_logger.info("Successfully added {} to {} in record(s) in {}", value, column, table)
+        
+        return True
+        
+    except Exception as e:
+        if connection:
+            connection.rollback()
+        logger.error(f"Error adding value to record in {table}. SQL: {sql}, Error: {str(e)}")
+        return False
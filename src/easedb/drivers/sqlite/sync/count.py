@@ -0,0 +1,61 @@
+"""Synchronous SQLite count operations."""
+
+from typing import Any, Dict, Optional
+
+from ..utils import SQLITE_MAX_VARIABLES
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+def count_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Count the records of a SQLite table matching a query.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to count records in
+    :param query: Optional dictionary of conditions to filter records
+    :return: Number of records matching the query
+    """
+    sql = params = None
+    try:
+        # IN lists longer than SQLite's variable limit are split, a row matches one part at most
+        count = 0
+        for part in chunk_query(query, SQLITE_MAX_VARIABLES):
+            statement = compile_statement('sqlite', 'count', table, query_shape(part))
+            sql, params = statement.sql, statement.params(query=part)
+
+            hot_logger.debug("Executing count query: {} with parameters: {}", sql, params)
+            
+            count += connection.execute(sql, params).fetchone()[0]
+        
+        hot_logger.info("Count query result: {} record(s) found in table '{}'.", count, table)
+        return count
+
+    except Exception as e:
+        logger.error(f"Error counting records in {table}. SQL: {sql}, Parameters: {params}, Error: {str(e)}")
+        return 0
+
+def estimate_records(connection: Any, table: str) -> int:
+    """
+    Estimate the number of records of a SQLite table from the sqlite_stat1 statistics.
+    
+    The statistics are gathered by ANALYZE (or PRAGMA optimize) and read
+    without scanning the table. Tables that were never analyzed are counted
+    exactly.
+    
+    :param connection: Active database connection
+    :param table: Name of the table
+    :return: Estimated number of records
+    """
+    try:
+        rows = connection.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = ?", (table,)).fetchall()
+    except Exception as e:
+        # sqlite_stat1 only exists once ANALYZE has run on the database
+        hot_logger.debug("No statistics for {}, counting exactly: {}", table, e)
+        rows = []
+    if not rows:
+        return count_records(connection, table)
+    # The first number of every statistic is the row count of the table or of an index on it
+    estimate = max(int(row[0].split()[0]) for row in rows)
+    hot_logger.info("Estimated {} record(s) in table '{}'.", estimate, table)
+    return estimate
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ....logger import logger, hot_logger
 
 def create_table(connection: Any, table: str, schema: Dict[str, str], 
                  primary_key: str = 'id', 
@@ -45,14 +45,14 @@ def create_table(connection: Any, table: str, schema: Dict[str, str],
         else:
             sql = f"CREATE TABLE `{table}` ({columns_str})"
         
-        logger.debug(f"Executing create table query: {sql}")
+        hot_logger.debug("Executing create table query: {}", sql)
 
         # Execute table creation
         cursor.execute(sql)
         connection.commit()
         cursor.close()
         
-        logger.info(f"Table '{table}' created successfully.")
+        hot_logger.info("Table '{}' created successfully.", table)
 
         return True
     
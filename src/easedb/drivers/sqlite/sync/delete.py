@@ -2,24 +2,30 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ..utils import SQLITE_MAX_VARIABLES
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 def delete_record(connection: Any, table: str, query: Dict[str, Any]) -> bool:
     """Delete a record from SQLite database."""
+    sql = None
     try:
-        where_clause = ' AND '.join([f"{k} = ?" for k in query.keys()])
-        sql = f"DELETE FROM {table} WHERE {where_clause}"
+        # IN lists longer than SQLite's variable limit are split into statements of one commit
+        for part in chunk_query(query, SQLITE_MAX_VARIABLES):
+            statement = compile_statement('sqlite', 'delete', table, query_shape(part))
+            sql, params = statement.sql, statement.params(query=part)
 
-        logger.debug(f"Executing delete query: {sql} with parameters: {list(query.values())}")
-        
-        connection.execute(sql, list(query.values()))
+            hot_logger.debug("Executing delete query: {} with parameters: {}", sql, params)
+            
+            connection.execute(sql, params)
         connection.commit()
         
-        logger.info(f"Record deleted from table '{table}' where {query}.")
+        hot_logger.info("Record deleted from table '{}' where {}.", table, query)
         return True
         
     except Exception as e:
         if connection:
             connection.rollback()
-        logger.error(f"Error deleting record from {table}. SQL: {sql}, Parameters: {list(query.values())}, Error: {str(e)}")
+        logger.error(f"Error deleting record from {table}. SQL: {sql}, Query: {query}, Error: {str(e)}")
         return False
@@ -0,0 +1,45 @@
+"""Synchronous SQLite bulk delete operation."""
+
+from typing import Any, Iterable
+
+from ..utils import SQLITE_MAX_VARIABLES
+from ...filters import in_chunks, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+def delete_many_records(connection: Any, table: str, values: Iterable[Any], 
+                        key: str = 'id', chunk_size: int = 1000) -> int:
+    """
+    Delete the records of SQLite database whose key column matches any of the values.
+    
+    Values are deleted with one IN query per chunk, all committed as one
+    transaction.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to delete from
+    :param values: Values of the key column to delete
+    :param key: Column the values are looked up in
+    :param chunk_size: Maximum number of values per IN list
+    :return: Number of records deleted, 0 if the transaction was rolled back
+    """
+    deleted = 0
+    sql = None
+    try:
+        for chunk in in_chunks(values, min(chunk_size, SQLITE_MAX_VARIABLES)):
+            query = {f"{key}__in": chunk}
+            statement = compile_statement('sqlite', 'delete', table, query_shape(query))
+            sql = statement.sql
+            hot_logger.debug("Executing bulk delete query: {}", sql)
+            
+            deleted += connection.execute(sql, statement.params(query=query)).rowcount
+        connection.commit()
+        
+        hot_logger.info("Deleted {} records from {}", deleted, table)
+        
+        return deleted
+        
+    except Exception as e:
+        if connection:
+            connection.rollback()
+        logger.error(f"Error bulk deleting records from {table}. SQL: {sql}, Error: {str(e)}")
+        return 0
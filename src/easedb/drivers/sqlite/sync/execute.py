@@ -2,27 +2,29 @@
 
 from typing import Any, Dict, Optional, Union, List
 
-from ..utils import row_to_dict, get_columns_from_cursor
+from ..utils import get_columns_from_cursor
+from ...rows import format_rows
 
-from ....logger import logger
+from ....logger import logger, hot_logger
 
-def execute_query(connection: Any, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None) -> Any:
-    """Execute a raw SQL query."""
+def execute_query(connection: Any, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None, 
+                  row_format: str = 'dict') -> Any:
+    """Execute a raw SQL query, returning SELECT results in the given row format."""
     try:
-        logger.debug(f"Executing query: {query} with parameters: {params or ()}")
+        hot_logger.debug("Executing query: {} with parameters: {}", query, params or ())
         cursor = connection.execute(query, params or ())
         
         if query.strip().upper().startswith('SELECT'):
             columns = get_columns_from_cursor(cursor)
-            result = [row_to_dict(row, columns) for row in cursor.fetchall()]
+            result = format_rows(cursor.fetchall(), columns, row_format)
 
-            logger.debug(f"Query result: {result}")
+            hot_logger.debug("Query result: {}", result)
             
             return result
         else:
             connection.commit()
             
-            logger.info(f"Query executed successfully: {query}")
+            hot_logger.info("Query executed successfully: {}", query)
             return True
             
     except Exception as e:
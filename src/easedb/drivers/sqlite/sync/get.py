@@ -1,27 +1,42 @@
 """Synchronous SQLite get operation."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from ..utils import row_to_dict, get_columns_from_cursor
+from ..utils import SQLITE_MAX_VARIABLES, get_columns_from_cursor
 
-def get_record(connection: Any, table: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Get a record from SQLite database."""
+from ...filters import chunk_query, extend_projection, merge_rows
+from ...rows import format_row
+from ...statements import OrderBy, select_statement
+from ....logger import logger, hot_logger
+
+def get_record(connection: Any, table: str, query: Dict[str, Any], row_format: str = 'dict', 
+               columns: Tuple[str, ...] = (), order_by: OrderBy = ()) -> Optional[Any]:
+    """Get a record from SQLite database in the given row format."""
+    sql = None
     try:
-        # Log the query parameters before execution
-        where_clause = ' AND '.join([f"{k} = ?" for k in query.keys()])
-        sql = f"SELECT * FROM {table} WHERE {where_clause}"
-        params = list(query.values())
-        logger.debug(f"Executing query: {sql} with parameters: {params}")
+        # IN lists longer than SQLite's variable limit are split, see chunk_query
+        parts = chunk_query(query, SQLITE_MAX_VARIABLES)
+        selected = extend_projection(columns, order_by) if len(parts) > 1 else columns
+        rows = []
+        for part in parts:
+            sql, params = select_statement('sqlite', table, part, selected, order_by, 1)
+            hot_logger.debug("Executing query: {} with parameters: {}", sql, params)
 
-        cursor = connection.execute(sql, list(query.values()))
-        columns = get_columns_from_cursor(cursor)
-        row = cursor.fetchone()
+            cursor = connection.execute(sql, params)
+            rows.extend(cursor.fetchall())
+            if rows and not order_by:
+                break
+        result_columns = get_columns_from_cursor(cursor)
+        if len(parts) > 1:
+            rows = merge_rows(rows, result_columns, order_by, 1, len(columns))
+            result_columns = result_columns[:len(columns) or None]
+        row = rows[0] if rows else None
 
-        result = row_to_dict(row, columns) if row else None
-        logger.debug(f"Query result: {result}")
+        result = format_row(row, result_columns, row_format) if row else None
+        hot_logger.debug("Query result: {}", result)
 
         return result
         
     except Exception as e:
-        logger.error(f"Error getting record from {table}. SQL: {sql}, Parameters: {list(query.values())}, Error: {str(e)}")
+        logger.error(f"Error getting record from {table}. SQL: {sql}, Query: {query}, Error: {str(e)}")
         return None
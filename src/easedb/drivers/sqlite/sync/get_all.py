@@ -1,39 +1,49 @@
 """Synchronous SQLite get_all operation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..utils import row_to_dict, get_columns_from_cursor
+from ..utils import SQLITE_MAX_VARIABLES, get_columns_from_cursor
 
-from ....logger import logger
+from ...filters import chunk_query, extend_projection, merge_rows
+from ...rows import format_rows
+from ...statements import OrderBy, select_statement
+from ....logger import logger, hot_logger
 
-def get_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+def get_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None, 
+                    row_format: str = 'dict', columns: Tuple[str, ...] = (), 
+                    order_by: OrderBy = (), limit: Optional[int] = None) -> Any:
     """
     Get all records from SQLite database synchronously.
     
     :param connection: Active database connection
     :param table: Name of the table to retrieve records from
     :param query: Optional dictionary of conditions to filter records
-    :return: List of records matching the query
+    :param row_format: 'dict', 'tuple', 'namedtuple' or 'columnar'
+    :param columns: Columns to return, all of them if empty
+    :param order_by: Parsed (column, descending) pairs to sort by
+    :param limit: Maximum number of records to return
+    :return: List of records matching the query, or a ColumnarResult
     """
+    sql = params = None
     try:
-        if query is None:
-            # If no query is provided, fetch all records
-            sql = f"SELECT * FROM {table}"
-            params = []
-            logger.debug(f"Executing query: {sql} with no parameters")
-        else:
-            # Construct a parameterized query with the provided conditions
-            where_clause = ' AND '.join([f"{k} = ?" for k in query.keys()])
-            sql = f"SELECT * FROM {table} WHERE {where_clause}"
-            params = list(query.values())
-            logger.debug(f"Executing query: {sql} with parameters: {params}")
-        
-        cursor = connection.execute(sql, params)
-        columns = get_columns_from_cursor(cursor)
-        rows = cursor.fetchall()
-        result = [row_to_dict(row, columns) for row in rows]
+        # IN lists longer than SQLite's variable limit are split, see chunk_query
+        parts = chunk_query(query, SQLITE_MAX_VARIABLES)
+        selected = extend_projection(columns, order_by) if len(parts) > 1 else columns
+        rows = []
+        for part in parts:
+            # Without a query the statement has no WHERE clause and fetches all records
+            sql, params = select_statement('sqlite', table, part, selected, order_by, limit)
+            hot_logger.debug("Executing query: {} with parameters: {}", sql, params)
+            
+            cursor = connection.execute(sql, params)
+            rows.extend(cursor.fetchall())
+        result_columns = get_columns_from_cursor(cursor)
+        if len(parts) > 1:
+            rows = merge_rows(rows, result_columns, order_by, limit, len(columns))
+            result_columns = result_columns[:len(columns) or None]
+        result = format_rows(rows, result_columns, row_format)
 
-        logger.debug(f"Query result: {result}")
+        hot_logger.debug("Query result: {}", result)
 
         return result
             
@@ -0,0 +1,50 @@
+"""Synchronous SQLite streaming get_all operation."""
+
+from typing import Any, Dict, Iterator, Optional
+
+from ..utils import SQLITE_MAX_VARIABLES, row_to_dict, get_columns_from_cursor
+
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
+def iter_all_records(connection: Any, table: str, query: Optional[Dict[str, Any]] = None, 
+                     batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over records from SQLite database synchronously.
+    
+    Rows are fetched with fetchmany, so at most batch_size rows are held in
+    memory at a time regardless of the size of the result.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to retrieve records from
+    :param query: Optional dictionary of conditions to filter records
+    :param batch_size: Number of rows fetched per round
+    :return: Iterator over records matching the query
+    """
+    sql, params = None, None
+    cursor = None
+    try:
+        # IN lists longer than SQLite's variable limit are split, see chunk_query
+        for part in chunk_query(query, SQLITE_MAX_VARIABLES):
+            statement = compile_statement('sqlite', 'select', table, query_shape(part))
+            sql, params = statement.sql, statement.params(query=part)
+            
+            hot_logger.debug("Executing streaming query: {} with parameters: {}", sql, params)
+            
+            cursor = connection.execute(sql, params)
+            columns = get_columns_from_cursor(cursor)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row_to_dict(row, columns)
+            cursor.close()
+            
+    except Exception as e:
+        logger.error(f"Error streaming records from {table}. SQL: {sql}, Parameters: {params}, Error: {str(e)}")
+    
+    finally:
+        if cursor:
+            cursor.close()
@@ -0,0 +1,41 @@
+"""Synchronous SQLite streaming query operation."""
+
+from typing import Any, Iterator, List, Tuple
+
+from ..utils import get_columns_from_cursor
+from ....logger import logger, hot_logger
+
+def iter_query_batches(connection: Any, sql: str, params: Any = None, 
+                       batch_size: int = 1000) -> Iterator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]]:
+    """
+    Iterate over the rows of a query on SQLite database in batches.
+    
+    Rows are fetched with fetchmany, so at most batch_size rows are held in
+    memory at a time. The first batch is yielded even when it is empty, so
+    the columns of an empty result are known.
+    
+    :param connection: Active database connection
+    :param sql: SELECT statement
+    :param params: Parameters bound to the statement
+    :param batch_size: Number of rows fetched per round
+    :return: Iterator over (columns, rows) pairs
+    """
+    cursor = None
+    try:
+        hot_logger.debug("Executing streaming query: {} with parameters: {}", sql, params)
+        
+        cursor = connection.execute(sql, params or ())
+        columns = get_columns_from_cursor(cursor)
+        rows = cursor.fetchmany(batch_size)
+        while True:
+            yield columns, rows
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            
+    except Exception as e:
+        logger.error(f"Error streaming query results. SQL: {sql}, Parameters: {params}, Error: {str(e)}")
+    
+    finally:
+        if cursor:
+            cursor.close()
@@ -2,21 +2,21 @@
 
 from typing import Any, Dict
 
-from ....logger import logger
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
 
 def set_record(connection: Any, table: str, data: Dict[str, Any]) -> bool:
     """Insert a record into SQLite database."""
     try:
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        statement = compile_statement('sqlite', 'insert', table, (), tuple(data))
+        sql, params = statement.sql, statement.params(data=data)
 
-        logger.debug(f"Executing query: {sql} with parameters: {list(data.values())}")
+        hot_logger.debug("Executing query: {} with parameters: {}", sql, params)
         
-        connection.execute(sql, list(data.values()))
+        connection.execute(sql, params)
         connection.commit()
         
-        logger.info(f"Record inserted successfully: {data}")
+        hot_logger.info("Record inserted successfully: {}", data)
         
         return True
         
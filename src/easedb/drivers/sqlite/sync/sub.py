@@ -0,0 +1,24 @@
+"""Synchronous SQLite subtract operation."""
+
+from decimal import Decimal
+from typing import Any, Dict, Union
+
+from .add import add_record
+from ....logger import logger
+
+def sub_record(connection: Any, table: str, query: Dict[str, Any], value: Union[int, float, Decimal], 
+               column: str = 'value') -> bool:
+    """
+    Subtract a value from a numeric column of the matching records of SQLite database.
+    
+    :param connection: Active database connection
+    :param table: Name of the table to update
+    :param query: Dictionary specifying which record(s) to update
+    :param value: Numeric value to subtract from the existing value
+    :param column: Name of the column to update (default: 'value')
+    :return: True if update was successful, False otherwise
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+        logger.error(f"Invalid value type. Must be int, float or Decimal, got {type(value)}")
+        return False
+    return add_record(connection, table, query, -value, column)
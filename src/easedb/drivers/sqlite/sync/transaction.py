@@ -0,0 +1,15 @@
+"""Synchronous SQLite transaction operations."""
+
+from typing import Any
+
+from ....logger import hot_logger
+
+def begin_transaction(connection: Any) -> None:
+    """Start an explicit transaction."""
+    hot_logger.debug("Executing SQL: BEGIN")
+    connection.execute("BEGIN")
+
+def execute_savepoint(connection: Any, statement: str) -> None:
+    """Execute a SAVEPOINT, RELEASE SAVEPOINT or ROLLBACK TO SAVEPOINT statement."""
+    hot_logger.debug("Executing SQL: {}", statement)
+    connection.execute(statement)
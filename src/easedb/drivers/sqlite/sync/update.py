@@ -2,8 +2,14 @@
 
 from typing import Any, Dict
 
+from ..utils import SQLITE_MAX_VARIABLES
+from ...filters import chunk_query, query_shape
+from ...statements import compile_statement
+from ....logger import logger, hot_logger
+
 def update_record(connection: Any, table: str, query: Dict[str, Any], data: Dict[str, Any]) -> bool:
     """Update a record in SQLite database."""
+    sql = None
     try:
         # If no query is provided, we cannot determine what to update
         if not query:
@@ -11,26 +17,22 @@ def update_record(connection: Any, table: str, query: Dict[str, Any], data: Dict
         
         # If no data is provided, no update will occur
         if not data:
-            logger.info(f"No data provided to update for table {table} with query: {query}")
+            hot_logger.info("No data provided to update for table {} with query: {}", table, query)
             return False
         
-        # Construct the query condition
-        where_clause = ' AND '.join([f"{k} = ?" for k in query.keys()])
-        set_clause = ', '.join([f"{k} = ?" for k in data.keys()])
-        
-        # Construct SQL query
-        sql = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
-        
-        # Prepare values
-        values = list(data.values()) + list(query.values())
+        # Construct SQL query, values are data first, then query conditions
+        # IN lists longer than SQLite's variable limit are split into statements of one commit
+        for part in chunk_query(query, SQLITE_MAX_VARIABLES, reserved=len(data)):
+            statement = compile_statement('sqlite', 'update', table, query_shape(part), tuple(data))
+            sql, values = statement.sql, statement.params(data, part)
 
-        logger.info(f"Attempting to update record in {table}. SQL: {sql}, Query Parameters: {list(query.values())}, Data: {list(data.values())}")
-        
-        # Execute query
-        connection.execute(sql, values)
+            hot_logger.info("Attempting to update record in {}. SQL: {}, Query Parameters: {}, Data: {}", table, sql, part, list(data.values()))
+            
+            # Execute query
+            connection.execute(sql, values)
         connection.commit()
 
-        logger.info(f"Successfully updated record in {table}. SQL: {sql}, Query Parameters: {list(query.values())}, Data: {list(data.values())}")
+        hot_logger.info("Successfully updated record in {}. SQL: {}, Query Parameters: {}, Data: {}", table, sql, list(query.values()), list(data.values()))
 
         return True
         
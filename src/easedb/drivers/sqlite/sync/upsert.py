@@ -0,0 +1,29 @@
+"""Synchronous SQLite upsert operation."""
+
+from typing import Any, Dict, Tuple
+
+from ...statements import compile_upsert
+from ....logger import logger, hot_logger
+
+def upsert_record(connection: Any, table: str, data: Dict[str, Any], 
+                  conflict_keys: Tuple[str, ...], update_columns: Tuple[str, ...]) -> bool:
+    """Insert a record into SQLite database, or update the record it conflicts with."""
+    sql = None
+    try:
+        statement = compile_upsert('sqlite', table, tuple(data), conflict_keys, update_columns)
+        sql, params = statement.sql, statement.params(data=data)
+
+        hot_logger.debug("Executing query: {} with parameters: {}", sql, params)
+        
+        connection.execute(sql, params)
+        connection.commit()
+        
+        hot_logger.info("Record upserted successfully: {}", data)
+        
+        return True
+        
+    except Exception as e:
+        if connection:
+            connection.rollback()
+        logger.error(f"Error upserting record into {table}. SQL: {sql}, Parameters: {list(data.values())}, Error: {str(e)}")
+        return False
@@ -1,11 +1,17 @@
 """Utility functions for SQLite driver."""
 
 import os
-from typing import Dict, Any, Optional, Tuple
-from urllib.parse import urlparse
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
 
 def parse_connection_string(connection_string: str) -> Dict[str, Any]:
-    """Parse SQLite connection string."""
+    """
+    Parse SQLite connection string.
+    
+    Query parameters, e.g. `sqlite:///app.db?preset=fast&busy_timeout=10000`,
+    are returned as strings next to the database path.
+    """
     parsed = urlparse(connection_string)
     if parsed.scheme != 'sqlite':
         raise ValueError("Invalid connection string scheme. Must be 'sqlite'")
@@ -20,14 +26,100 @@ def parse_connection_string(connection_string: str) -> Dict[str, Any]:
     if directory and not os.path.exists(directory):
         os.makedirs(directory)
     
-    return {'database': path}
+    params = {'database': path}
+    params.update(parse_qsl(parsed.query))
+    return params
+
+# Pragmas that can be set from the connection string, with their accepted values
+# (None accepts any integer)
+PRAGMA_OPTIONS = {
+    'journal_mode': ('delete', 'truncate', 'persist', 'memory', 'wal', 'off'),
+    'synchronous': ('off', 'normal', 'full', 'extra', '0', '1', '2', '3'),
+    'mmap_size': None,
+    'cache_size': None,
+    'temp_store': ('default', 'file', 'memory', '0', '1', '2'),
+    'busy_timeout': None,
+}
+
+# Named pragma sets selected with `preset=`; explicit options override them
+PRAGMA_PRESETS = {
+    # WAL with full fsync: no committed transaction is lost on power failure
+    'durable': {
+        'journal_mode': 'wal',
+        'synchronous': 'full',
+        'busy_timeout': '5000',
+    },
+    # WAL with fsync only at checkpoints, a 64 MiB page cache and 256 MiB of mmap
+    'fast': {
+        'journal_mode': 'wal',
+        'synchronous': 'normal',
+        'mmap_size': '268435456',
+        'cache_size': '-65536',
+        'temp_store': 'memory',
+        'busy_timeout': '5000',
+    },
+    # No fsync and an in-memory journal: for one-off imports that can be redone
+    'bulk_load': {
+        'journal_mode': 'memory',
+        'synchronous': 'off',
+        'cache_size': '-262144',
+        'temp_store': 'memory',
+    },
+}
+
+def split_pragma_options(params: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Separate pragma options from connection parameters.
+    
+    :param params: Parameters returned by parse_connection_string
+    :return: Connection parameters for sqlite3.connect, and the pragmas to
+             apply on every new connection, in order
+    :raises ValueError: For an unknown preset, option or pragma value
+    """
+    connection_params = {'database': params['database']}
+    options = {key: str(value).lower() for key, value in params.items() if key != 'database'}
+    
+    preset = options.pop('preset', None)
+    if preset is not None and preset not in PRAGMA_PRESETS:
+        raise ValueError(f"Unknown SQLite preset: {preset!r}, expected one of {tuple(PRAGMA_PRESETS)}")
+    pragmas = dict(PRAGMA_PRESETS[preset]) if preset else {}
+    
+    for key, value in options.items():
+        if key not in PRAGMA_OPTIONS:
+            raise ValueError(f"Unknown SQLite connection option: {key!r}")
+        accepted = PRAGMA_OPTIONS[key]
+        if accepted is None:
+            value = str(int(value))
+        elif value not in accepted:
+            raise ValueError(f"Invalid value for {key}: {value!r}, expected one of {accepted}")
+        pragmas[key] = value
+    
+    return connection_params, pragmas
+
+def pragma_statements(pragmas: Dict[str, str]) -> List[str]:
+    """Build the PRAGMA statements for validated pragma options."""
+    return [f"PRAGMA {key} = {value}" for key, value in pragmas.items()]
 
 def row_to_dict(row: Optional[tuple], columns: tuple) -> Optional[Dict[str, Any]]:
     """Convert SQLite row to dictionary."""
     if row is None:
         return None
-    return {columns[i]: value for i, value in enumerate(row)}
+    return dict(zip(columns, row))
 
 def get_columns_from_cursor(cursor: Any) -> Tuple[str, ...]:
     """Get column names from cursor."""
     return tuple(col[0] for col in cursor.description)
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most `size` items without materializing it."""
+    if size < 1:
+        raise ValueError("Chunk size must be a positive integer")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+# Lowest default SQLITE_MAX_VARIABLE_NUMBER (before SQLite 3.32), longer IN lists are split
+SQLITE_MAX_VARIABLES = 999
@@ -0,0 +1,335 @@
+"""Compiled SQL statement cache shared by all drivers."""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .filters import Condition, condition_column, query_shape, query_values, render_condition
+
+# Maximum number of distinct statements kept in the process-wide cache
+STATEMENT_CACHE_SIZE = 1024
+
+PLACEHOLDERS = {
+    'sqlite': '?',
+    'mysql': '%s',
+}
+
+# (column, descending) pairs in ORDER BY order
+OrderBy = Tuple[Tuple[str, bool], ...]
+
+# Functions accepted by aggregate(), 'count_distinct' renders COUNT(DISTINCT column)
+AGGREGATE_FUNCTIONS = ('count', 'sum', 'avg', 'min', 'max', 'count_distinct')
+
+# (alias, function, column) triples in SELECT order
+Aggregates = Tuple[Tuple[str, str, str], ...]
+
+class CompiledStatement(NamedTuple):
+    """Prebuilt SQL and the order in which its parameters are extracted."""
+
+    sql: str
+    data_keys: Tuple[str, ...]
+    query_keys: Tuple[Condition, ...]
+
+    def params(self, data: Optional[Dict[str, Any]] = None,
+               query: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Extract the parameters for this statement, data values first, then query values."""
+        values = [data[key] for key in self.data_keys] if self.data_keys else []
+        if self.query_keys:
+            values.extend(query_values(query))
+        return values
+
+def quote_identifier(name: str) -> str:
+    """Quote a table or column name with backticks, understood by both SQLite and MySQL."""
+    return '.'.join(f"`{part.replace('`', '``')}`" for part in name.split('.'))
+
+def parse_order_by(order_by: Union[str, Sequence[str]]) -> OrderBy:
+    """Parse 'id', 'created DESC, id' or ['created DESC', 'id'] into (column, descending) pairs."""
+    if isinstance(order_by, str):
+        order_by = order_by.split(',')
+
+    parsed = []
+    for item in order_by:
+        parts = item.split()
+        if not parts or len(parts) > 2 or (len(parts) == 2 and parts[1].upper() not in ('ASC', 'DESC')):
+            raise ValueError(f"Invalid order_by column: {item!r}")
+        parsed.append((parts[0], len(parts) == 2 and parts[1].upper() == 'DESC'))
+    if not parsed:
+        raise ValueError("order_by requires at least one column")
+    return tuple(parsed)
+
+def select_options(columns: Optional[Sequence[str]] = None,
+                   order_by: Union[None, str, Sequence[str]] = None,
+                   limit: Optional[int] = None) -> Tuple[Tuple[str, ...], OrderBy]:
+    """Validate the projection, ordering and limit of a select and return them in compile_statement form."""
+    if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 1):
+        raise ValueError("limit must be a positive integer")
+    if isinstance(columns, str):
+        columns = [columns]
+    return tuple(columns) if columns else (), parse_order_by(order_by) if order_by else ()
+
+def order_by_clause(order_by: OrderBy) -> str:
+    """Render parsed order_by pairs as an ORDER BY clause with quoted columns."""
+    return "ORDER BY " + ', '.join(f"{quote_identifier(column)}{' DESC' if descending else ''}"
+                                   for column, descending in order_by)
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def compile_statement(dialect: str, operation: str, table: str,
+                      query_keys: Tuple[Condition, ...] = (),
+                      data_keys: Tuple[str, ...] = (),
+                      columns: Tuple[str, ...] = (),
+                      order_by: OrderBy = (),
+                      limit: bool = False) -> CompiledStatement:
+    """
+    Build the SQL for a CRUD operation, cached per statement shape.
+
+    Repeated calls with the same dialect, operation, table and key sets
+    return the cached statement, so the hot path only pays for a cache
+    lookup and the parameter list.
+
+    :param dialect: 'sqlite' or 'mysql'
+    :param operation: One of 'select', 'insert', 'update', 'increment', 'delete', 'count', 'exists'
+    :param table: Name of the table
+    :param query_keys: query_shape() of the WHERE conditions, joined by AND
+    :param data_keys: Column names written by 'insert' or 'update', or added to by 'increment'
+    :param columns: Columns returned by 'select', all of them if empty
+    :param order_by: Parsed ORDER BY of 'select', see parse_order_by
+    :param limit: Whether 'select' ends with a LIMIT placeholder, bound last by the caller
+    :return: The compiled statement
+    """
+    placeholder = PLACEHOLDERS[dialect]
+    quoted_table = quote_identifier(table)
+    where = ' AND '.join([render_condition(key, quote_identifier(condition_column(key)), placeholder)
+                          for key in query_keys])
+
+    if (columns or order_by or limit) and operation != 'select':
+        raise ValueError(f"Columns, order_by and limit only apply to select, not {operation}")
+
+    if operation == 'select':
+        projection = ', '.join([quote_identifier(column) for column in columns]) or '*'
+        sql = f"SELECT {projection} FROM {quoted_table}"
+    elif operation == 'count':
+        sql = f"SELECT COUNT(*) FROM {quoted_table}"
+    elif operation == 'exists':
+        sql = f"SELECT 1 FROM {quoted_table}"
+    elif operation == 'insert':
+        columns = ', '.join([quote_identifier(key) for key in data_keys])
+        placeholders = ', '.join([placeholder for _ in data_keys])
+        return CompiledStatement(f"INSERT INTO {quoted_table} ({columns}) VALUES ({placeholders})",
+                                 data_keys, ())
+    elif operation in ('update', 'increment', 'delete'):
+        # Never compile an unconditional UPDATE or DELETE by accident
+        if not query_keys:
+            raise ValueError(f"{operation.capitalize()} requires a query to identify records")
+        if operation == 'update':
+            set_clause = ', '.join([f"{quote_identifier(key)} = {placeholder}" for key in data_keys])
+            sql = f"UPDATE {quoted_table} SET {set_clause}"
+        elif operation == 'increment':
+            # Computed by the database, so concurrent increments never overwrite each other
+            set_clause = ', '.join([f"{quote_identifier(key)} = {quote_identifier(key)} + {placeholder}"
+                                    for key in data_keys])
+            sql = f"UPDATE {quoted_table} SET {set_clause}"
+        else:
+            sql = f"DELETE FROM {quoted_table}"
+    else:
+        raise ValueError(f"Unsupported statement operation: {operation}")
+
+    if where:
+        sql += f" WHERE {where}"
+    if order_by:
+        sql += f" {order_by_clause(order_by)}"
+    if limit:
+        sql += f" LIMIT {placeholder}"
+    elif operation == 'exists':
+        # The database stops at the first matching row instead of counting them all
+        sql += " LIMIT 1"
+
+    return CompiledStatement(sql, data_keys if operation in ('update', 'increment') else (), query_keys)
+
+def upsert_options(data_keys: Sequence[str], conflict_keys: Union[None, str, Sequence[str]] = None,
+                   update_columns: Union[None, str, Sequence[str]] = None) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Validate the conflict keys and updated columns of an upsert and return them in compile_upsert form.
+
+    :param data_keys: Columns of the inserted record
+    :param conflict_keys: Columns of the unique key detecting an existing record, 'id' if omitted
+    :param update_columns: Columns overwritten on a conflict, every non-key column if omitted
+    """
+    conflict_keys = (conflict_keys,) if isinstance(conflict_keys, str) else tuple(conflict_keys or ('id',))
+    if update_columns is None:
+        update_columns = tuple(key for key in data_keys if key not in conflict_keys)
+    else:
+        update_columns = (update_columns,) if isinstance(update_columns, str) else tuple(update_columns)
+    missing = [key for key in conflict_keys + update_columns if key not in data_keys]
+    if missing:
+        raise ValueError(f"Upsert columns missing from the record: {missing}")
+    return conflict_keys, update_columns
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def compile_upsert(dialect: str, table: str, data_keys: Tuple[str, ...],
+                   conflict_keys: Tuple[str, ...], update_columns: Tuple[str, ...]) -> CompiledStatement:
+    """
+    Build an insert that updates the existing record instead when a unique key conflicts.
+
+    SQLite uses INSERT ... ON CONFLICT (keys) DO UPDATE, MySQL uses
+    INSERT ... ON DUPLICATE KEY UPDATE, which reacts to any unique key and
+    ignores conflict_keys. Without update columns a conflicting record is
+    kept unchanged.
+    """
+    insert = compile_statement(dialect, 'insert', table, (), data_keys)
+    if dialect == 'sqlite':
+        target = ', '.join([quote_identifier(key) for key in conflict_keys])
+        if update_columns:
+            assignments = ', '.join([f"{quote_identifier(key)} = excluded.{quote_identifier(key)}"
+                                     for key in update_columns])
+            sql = f"{insert.sql} ON CONFLICT ({target}) DO UPDATE SET {assignments}"
+        else:
+            sql = f"{insert.sql} ON CONFLICT ({target}) DO NOTHING"
+    else:
+        # VALUES(col) rather than the 8.0.19+ row alias, which MariaDB does not support
+        assignments = ', '.join([f"{quote_identifier(key)} = VALUES({quote_identifier(key)})"
+                                 for key in update_columns])
+        if not update_columns:
+            # Assigning a column to itself keeps the record, unlike INSERT IGNORE it still fails on bad data
+            assignments = f"{quote_identifier(conflict_keys[0])} = {quote_identifier(conflict_keys[0])}"
+        sql = f"{insert.sql} ON DUPLICATE KEY UPDATE {assignments}"
+    return CompiledStatement(sql, data_keys, ())
+
+def aggregate_options(aggregates: Dict[str, Union[str, Sequence[str]]],
+                      group_by: Union[None, str, Sequence[str]] = None) -> Tuple[Aggregates, Tuple[str, ...]]:
+    """
+    Validate the aggregates and grouping of aggregate() and return them in compile_aggregate form.
+
+    :param aggregates: Alias -> (function, column), e.g. {'total': ('sum', 'amount'), 'n': ('count', '*')};
+                       a bare 'count' stands for ('count', '*')
+    :param group_by: Column or columns to group by
+    """
+    if not aggregates:
+        raise ValueError("aggregate requires at least one aggregate")
+    validated = []
+    for alias, spec in aggregates.items():
+        function, column = (spec, '*') if isinstance(spec, str) else tuple(spec)
+        function = function.lower()
+        if function not in AGGREGATE_FUNCTIONS:
+            raise ValueError(f"Unknown aggregate function {function!r} for {alias!r}, "
+                             f"expected one of {AGGREGATE_FUNCTIONS}")
+        if column == '*' and function != 'count':
+            raise ValueError(f"Only count accepts '*', not {function} of {alias!r}")
+        validated.append((alias, function, column))
+    return tuple(validated), (group_by,) if isinstance(group_by, str) else tuple(group_by or ())
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def compile_aggregate(dialect: str, table: str, aggregates: Aggregates,
+                      query_keys: Tuple[Condition, ...] = (), group_by: Tuple[str, ...] = ()) -> CompiledStatement:
+    """
+    Build one SELECT computing aggregates over the matching records, per group if group_by is given.
+
+    The group columns come first in the result, followed by the aggregates
+    under their aliases; groups are returned sorted by their columns.
+    """
+    placeholder = PLACEHOLDERS[dialect]
+    selected = [quote_identifier(column) for column in group_by]
+    for alias, function, column in aggregates:
+        target = '*' if column == '*' else quote_identifier(column)
+        expression = f"COUNT(DISTINCT {target})" if function == 'count_distinct' else f"{function.upper()}({target})"
+        selected.append(f"{expression} AS {quote_identifier(alias)}")
+    sql = f"SELECT {', '.join(selected)} FROM {quote_identifier(table)}"
+
+    if query_keys:
+        sql += " WHERE " + ' AND '.join([render_condition(key, quote_identifier(condition_column(key)), placeholder)
+                                         for key in query_keys])
+    if group_by:
+        grouped = ', '.join([quote_identifier(column) for column in group_by])
+        sql += f" GROUP BY {grouped} ORDER BY {grouped}"
+    return CompiledStatement(sql, (), query_keys)
+
+def group_by_columns(rows: Sequence[Dict[str, Any]], key: str) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+    """Group the rows of update_many by the columns they set, each group sharing one statement."""
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in rows:
+        if key not in row:
+            raise ValueError(f"Row is missing the key column {key!r}: {row}")
+        groups.setdefault(tuple(column for column in row if column != key), []).append(row)
+    return groups
+
+def group_increments(increments: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]]
+                     ) -> Dict[Tuple[Tuple[Condition, ...], Tuple[str, ...]], List[List[Any]]]:
+    """
+    Group the (query, column -> amount) pairs of add_many by statement shape.
+
+    Each group shares one compiled 'increment' statement and holds the
+    parameters of every record it is run for, amounts first.
+    """
+    groups: Dict[Tuple[Tuple[Condition, ...], Tuple[str, ...]], List[List[Any]]] = {}
+    for query, amounts in increments:
+        if not query:
+            raise ValueError("Increments require a query to identify records")
+        if amounts:
+            groups.setdefault((query_shape(query), tuple(amounts)), []).append(
+                list(amounts.values()) + query_values(query))
+    return groups
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def compile_case_update(dialect: str, table: str, key: str, data_keys: Tuple[str, ...], count: int) -> str:
+    """
+    Build an UPDATE setting different values on count records in one statement.
+
+    Each column becomes CASE key WHEN ? THEN ? ... ELSE column END, and the
+    WHERE clause limits the statement to the listed keys. Parameters are
+    bound by case_update_params.
+    """
+    placeholder = PLACEHOLDERS[dialect]
+    quoted_key = quote_identifier(key)
+    whens = ' '.join([f"WHEN {placeholder} THEN {placeholder}"] * count)
+    assignments = ', '.join([f"{quote_identifier(column)} = CASE {quoted_key} {whens} "
+                             f"ELSE {quote_identifier(column)} END" for column in data_keys])
+    keys = ', '.join([placeholder] * count)
+    return f"UPDATE {quote_identifier(table)} SET {assignments} WHERE {quoted_key} IN ({keys})"
+
+def case_update_params(rows: Sequence[Dict[str, Any]], key: str, data_keys: Tuple[str, ...]) -> List[Any]:
+    """Return the parameters of compile_case_update for rows setting data_keys."""
+    params: List[Any] = []
+    for column in data_keys:
+        for row in rows:
+            params.append(row[key])
+            params.append(row[column])
+    params.extend([row[key] for row in rows])
+    return params
+
+def select_statement(dialect: str, table: str, query: Optional[Dict[str, Any]] = None,
+                     columns: Tuple[str, ...] = (), order_by: OrderBy = (),
+                     limit: Optional[int] = None) -> Tuple[str, List[Any]]:
+    """Return the SQL and parameters of a select, with the limit bound after the query values."""
+    statement = compile_statement(dialect, 'select', table, query_shape(query),
+                                  columns=columns, order_by=order_by, limit=limit is not None)
+    params = statement.params(query=query)
+    if limit is not None:
+        params.append(limit)
+    return statement.sql, params
+
+def source_statement(dialect: str, source: str, query: Optional[Dict[str, Any]] = None, 
+                     params: Optional[Union[tuple, Dict[str, Any]]] = None) -> Tuple[str, Any]:
+    """
+    Return the SQL and parameters reading an export source.
+
+    A source containing whitespace is a raw SELECT statement bound to
+    params; anything else names a table, filtered by query.
+    """
+    if any(character.isspace() for character in source.strip()):
+        if query:
+            raise ValueError("query filters a table, pass params to bind a SQL statement")
+        return source, params
+    if params:
+        raise ValueError("params bind a SQL statement, pass query to filter a table")
+    return select_statement(dialect, source, query)
+
+def statement_cache_info() -> Dict[str, int]:
+    """Return hit/miss counters and the current size of the statement cache."""
+    info = compile_statement.cache_info()
+    return {'hits': info.hits, 'misses': info.misses,
+            'size': info.currsize, 'maxsize': info.maxsize}
+
+def clear_statement_cache() -> None:
+    """Drop every cached statement and reset the counters."""
+    compile_statement.cache_clear()
+    compile_upsert.cache_clear()
+    compile_case_update.cache_clear()
+    compile_aggregate.cache_clear()
@@ -0,0 +1,135 @@
+"""Transaction state shared by all drivers."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+class TransactionError(Exception):
+    """Raised when a transaction is rolled back because an operation inside it failed."""
+
+class Transaction:
+    """
+    An open transaction: the connection it runs on and its savepoint depth.
+
+    Operations inside the transaction receive `proxy` instead of the raw
+    connection, so their own commits are deferred to the end of the block.
+    """
+
+    __slots__ = ('connection', 'proxy', 'depth', 'failed')
+
+    def __init__(self, connection: Any, proxy_class: type):
+        self.connection = connection
+        self.proxy = proxy_class(connection, self)
+        self.depth = 0
+        # Set when an operation rolled back its own statement
+        self.failed = False
+
+    def savepoint(self) -> str:
+        """Open the next nesting level and return its savepoint name."""
+        self.depth += 1
+        return f"easedb_savepoint_{self.depth}"
+
+    def raise_if_failed(self) -> None:
+        """Raise TransactionError if an operation failed since the last check."""
+        if self.failed:
+            self.failed = False
+            raise TransactionError("An operation failed inside the transaction, rolling back")
+
+class TransactionConnection:
+    """Connection proxy whose commit and rollback are deferred to the transaction."""
+
+    __slots__ = ('_connection', '_transaction')
+
+    def __init__(self, connection: Any, transaction: Transaction):
+        object.__setattr__(self, '_connection', connection)
+        object.__setattr__(self, '_transaction', transaction)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._connection, name, value)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        self._transaction.failed = True
+
+class AsyncTransactionConnection(TransactionConnection):
+    """Async variant of TransactionConnection, also ignoring nested begin() calls."""
+
+    __slots__ = ()
+
+    async def begin(self) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        self._transaction.failed = True
+
+class TransactionGate:
+    """
+    Keeps the operations of other tasks out of a transaction on a shared async connection.
+
+    Operations enter shared() and still run concurrently with each other.
+    A transaction enters exclusive(): it waits for the running operations
+    to finish, and operations arriving while it waits or runs wait for it,
+    so none of their commits can end the transaction early.
+    """
+
+    __slots__ = ('_condition', '_running', '_transactions', '_open')
+
+    def __init__(self):
+        # Created on first use, inside the event loop
+        self._condition: Optional[asyncio.Condition] = None
+        self._running = 0
+        # Transactions waiting or open
+        self._transactions = 0
+        self._open = False
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def _notify(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def shared(self) -> AsyncIterator[None]:
+        """Run an operation, after any waiting or open transaction."""
+        if self._transactions:
+            condition = self._get_condition()
+            async with condition:
+                await condition.wait_for(lambda: not self._transactions)
+                self._running += 1
+        else:
+            self._running += 1
+        try:
+            yield
+        finally:
+            self._running -= 1
+            if not self._running and self._transactions:
+                await self._notify()
+
+    @asynccontextmanager
+    async def exclusive(self) -> AsyncIterator[None]:
+        """Run a transaction once no operation and no other transaction is running."""
+        condition = self._get_condition()
+        self._transactions += 1
+        try:
+            async with condition:
+                await condition.wait_for(lambda: not self._open and not self._running)
+                self._open = True
+            try:
+                yield
+            finally:
+                self._open = False
+        finally:
+            self._transactions -= 1
+            await self._notify()
@@ -1 +1 @@
-from .logger import logger_config, logger
\ No newline at end of file
+from .logger import logger_config, logger, hot_logger, hot_path_enabled, quiet_hot_path
\ No newline at end of file
@@ -2,10 +2,21 @@ from loguru import logger as loguru_logger
 import os
 import sys
 from pathlib import Path
+from typing import Any, Dict, Optional
 
 # Globális logoló objektum
 logger = loguru_logger
 
+# Set by quiet_hot_path(), skips the per-operation messages of the drivers entirely
+_hot_path_quiet = False
+
+# Level name -> severity, read once through the public logger.level()
+_level_numbers: Dict[str, int] = {}
+
+# Severity of the level given to logger_config(), the threshold used when
+# loguru's handler table cannot be read
+_configured_level: Optional[int] = None
+
 def create_log_directory(base_dir="logs"):
     """
     Creates the directory structure for logs.
@@ -26,6 +37,9 @@ def setup_logger(level: str = "WARNING", base_dir="logs", use_structure=False):
     Sets up the default logger with both console and file handlers.
     If use_structure is True, logs will be saved in the structured directories.
     """
+    global _configured_level
+    _configured_level = logger.level(level).no
+
     # Remove existing handlers
     logger.remove()
 
@@ -57,3 +71,68 @@ def setup_logger(level: str = "WARNING", base_dir="logs", use_structure=False):
 def logger_config(level: str = "INFO", base_dir="logs", use_structure=False):
     setup_logger(level, base_dir, use_structure)
     logger.info(f"Logger initialized with level: {level}, use_structure: {use_structure}")
+
+def quiet_hot_path(enabled: bool = True) -> None:
+    """
+    Turns the per-operation debug and info messages of the drivers off or back on.
+    Warnings and errors are always logged.
+    """
+    global _hot_path_quiet
+    _hot_path_quiet = enabled
+
+def _level_number(level: str) -> int:
+    """
+    Returns the severity of a level. Severities of existing levels cannot change, so they are cached.
+    """
+    number = _level_numbers.get(level)
+    if number is None:
+        number = _level_numbers[level] = logger.level(level).no
+    return number
+
+def _handlers_min_level() -> Optional[float]:
+    """
+    Returns the lowest severity any handler accepts, infinity without handlers.
+
+    Loguru has no public API for this, so it is read from its handler
+    table; None is returned if a loguru release changes that table.
+    """
+    try:
+        core = logger._core
+        return core.min_level if core.handlers else float("inf")
+    except AttributeError:
+        return None
+
+def hot_path_enabled(level: str = "INFO") -> bool:
+    """
+    Returns whether a per-operation message at the given level would reach a handler.
+
+    Falls back to the level given to logger_config(), or to letting loguru
+    filter the message, when the handlers cannot be inspected.
+    """
+    if _hot_path_quiet:
+        return False
+    threshold = _handlers_min_level()
+    if threshold is None:
+        threshold = _configured_level if _configured_level is not None else 0
+    return _level_number(level) >= threshold
+
+class HotPathLogger:
+    """
+    Logging surface for the per-operation messages of the drivers.
+
+    Messages take loguru's brace-style arguments, so rows and parameters are
+    only formatted when the message is actually emitted, and nothing is done
+    at all below the active level or in quiet hot path mode.
+    """
+
+    __slots__ = ()
+
+    def debug(self, message: str, *args: Any) -> None:
+        if hot_path_enabled("DEBUG"):
+            logger.opt(depth=1).debug(message, *args)
+
+    def info(self, message: str, *args: Any) -> None:
+        if hot_path_enabled("INFO"):
+            logger.opt(depth=1).info(message, *args)
+
+hot_logger = HotPathLogger()
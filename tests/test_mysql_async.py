@@ -1,9 +1,12 @@
+import asyncio
 import os
 import pytest
 import pytest_asyncio
 import easedb
 import traceback
 
+import aiomysql
+
 @pytest_asyncio.fixture
 async def db():
     """
@@ -130,3 +133,131 @@ async def test_delete(db):
     except Exception as e:
         print(f"Error testing record deletion: {e}")
         traceback.print_exc()
+
+class FakeCursor:
+    """Cursor that simulates a slow query and records concurrency."""
+    
+    description = (('value',),)
+    
+    def __init__(self, stats):
+        self.stats = stats
+    
+    async def execute(self, query, params=()):
+        self.stats['running'] += 1
+        self.stats['peak'] = max(self.stats['peak'], self.stats['running'])
+        await asyncio.sleep(0.01)
+        self.stats['running'] -= 1
+    
+    async def fetchall(self):
+        return [(1,)]
+    
+    async def close(self):
+        pass
+
+class FakeConnection:
+    """Minimal stand-in for an aiomysql connection."""
+    
+    def __init__(self, stats):
+        self.stats = stats
+    
+    async def cursor(self):
+        return FakeCursor(self.stats)
+    
+    async def ping(self):
+        self.stats['pings'] = self.stats.get('pings', 0) + 1
+
+class FakePool:
+    """Minimal stand-in for an aiomysql pool with a maxsize bound."""
+    
+    def __init__(self, minsize, maxsize, stats):
+        self.semaphore = asyncio.Semaphore(maxsize)
+        self.stats = stats
+        self.closed = False
+    
+    async def acquire(self):
+        await self.semaphore.acquire()
+        return FakeConnection(self.stats)
+    
+    def release(self, connection):
+        self.semaphore.release()
+    
+    def close(self):
+        self.closed = True
+    
+    async def wait_closed(self):
+        pass
+
+@pytest.mark.asyncio
+async def test_pool_runs_concurrent_queries(monkeypatch):
+    """
+    Test that concurrent coroutines use separate pooled connections.
+    
+    Verifies that:
+    - Pool size comes from the pool_min_size/pool_max_size parameters
+    - Up to pool_max_size queries run at the same time
+    - The pool is kept open for the whole session and closed afterwards
+    """
+    stats = {'running': 0, 'peak': 0, 'pools': []}
+    
+    async def create_pool(minsize, maxsize, pool_recycle, **kwargs):
+        assert kwargs['autocommit'] is True
+        pool = FakePool(minsize, maxsize, stats)
+        stats['pools'].append(pool)
+        return pool
+    
+    monkeypatch.setattr(aiomysql, 'create_pool', create_pool)
+    database = easedb.AsyncDatabase('mysql://user:pw@localhost/app?pool_min_size=2&pool_max_size=4')
+    
+    async with database:
+        results = await asyncio.gather(*(database.execute('SELECT 1') for _ in range(12)))
+    
+    assert results == [[{'value': 1}]] * 12
+    assert stats['peak'] == 4
+    assert len(stats['pools']) == 1
+    assert stats['pools'][0].closed
+
+@pytest.mark.asyncio
+async def test_pool_shared_by_concurrent_calls_outside_session(monkeypatch):
+    """
+    Test connect-per-call mode with concurrent coroutines.
+    
+    Verifies that:
+    - Concurrent calls outside a session share one pool
+    - The pool is closed once the last call has finished
+    """
+    stats = {'running': 0, 'peak': 0, 'pools': []}
+    
+    async def create_pool(minsize, maxsize, pool_recycle, **kwargs):
+        pool = FakePool(minsize, maxsize, stats)
+        stats['pools'].append(pool)
+        return pool
+    
+    monkeypatch.setattr(aiomysql, 'create_pool', create_pool)
+    database = easedb.AsyncDatabase('mysql://user:pw@localhost/app')
+    
+    await asyncio.gather(*(database.execute('SELECT 1') for _ in range(5)))
+    
+    assert len(stats['pools']) == 1
+    assert stats['pools'][0].closed
+    assert not database.driver.connected
+
+@pytest.mark.asyncio
+async def test_pool_pre_ping_default(monkeypatch):
+    """
+    Test that pooled async connections are pinged before use by default.
+    
+    Verifies that:
+    - Every checkout pings its connection, like the synchronous pool
+    - pool_pre_ping=false turns the check off
+    """
+    stats = {'running': 0, 'peak': 0}
+    
+    async def create_pool(minsize, maxsize, pool_recycle, **kwargs):
+        return FakePool(minsize, maxsize, stats)
+    
+    monkeypatch.setattr(aiomysql, 'create_pool', create_pool)
+    await easedb.AsyncDatabase('mysql://user:pw@localhost/app').execute('SELECT 1')
+    assert stats['pings'] == 1
+    
+    await easedb.AsyncDatabase('mysql://user:pw@localhost/app?pool_pre_ping=false').execute('SELECT 1')
+    assert stats['pings'] == 1
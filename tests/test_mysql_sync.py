@@ -1,8 +1,18 @@
 import os
 import pytest
 import easedb
+import threading
+import time
 import traceback
 
+from easedb.drivers.mysql.pool import ConnectionPool
+from easedb.drivers.mysql.utils import load_data_statement, parse_connection_string, split_pool_options
+from easedb.drivers import filters
+from easedb.drivers.pagination import page_statement, parse_order_by
+from easedb.drivers.statements import (aggregate_options, case_update_params, compile_aggregate,
+                                       compile_case_update, compile_statement, compile_upsert,
+                                       group_by_columns, group_increments, upsert_options)
+
 @pytest.fixture
 def db():
     """
@@ -125,3 +135,305 @@ def test_delete(db):
     except Exception as e:
         print(f"Error testing record deletion: {e}")
         traceback.print_exc()
+
+class FakeConnection:
+    """Minimal stand-in for a mysql.connector connection."""
+    
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+        self.in_transaction = False
+    
+    def is_connected(self):
+        return self.alive
+    
+    def rollback(self):
+        self.in_transaction = False
+    
+    def close(self):
+        self.closed = True
+
+def test_split_pool_options():
+    """
+    Test extraction of pool options from the connection string.
+    
+    Verifies that:
+    - pool_* query parameters are removed from the connection parameters
+    - Values are converted to the types ConnectionPool expects
+    - Pooling stays disabled without pool options
+    """
+    params = parse_connection_string(
+        'mysql://user:pw@localhost/app?pool_min_size=2&pool_max_size=20'
+        '&pool_timeout=2.5&pool_pre_ping=false&connect_timeout=5'
+    )
+    connection_params, pool_options = split_pool_options(params)
+    
+    assert pool_options == {'min_size': 2, 'max_size': 20, 'timeout': 2.5, 'pre_ping': False}
+    assert connection_params['connect_timeout'] == 5
+    assert not any(key.startswith('pool') for key in connection_params)
+    
+    assert split_pool_options(parse_connection_string('mysql://localhost/app'))[1] is None
+    assert split_pool_options(parse_connection_string('mysql://localhost/app?pool=true'))[1] == {}
+
+def test_pool_reuses_and_bounds_connections():
+    """
+    Test connection reuse and the max_size bound.
+    
+    Verifies that:
+    - A released connection is handed out again
+    - Checkout times out once max_size connections are in use
+    """
+    opened = []
+    pool = ConnectionPool(lambda: opened.append(FakeConnection()) or opened[-1], 
+                          min_size=0, max_size=2, timeout=0.05)
+    
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        assert second is first
+    
+    a = pool.acquire()
+    b = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+    pool.release(a)
+    assert pool.acquire() is a
+    assert len(opened) == 2
+    pool.release(b)
+
+def test_pool_waits_for_release_across_threads():
+    """
+    Test that a blocked checkout is woken up by a release from another thread.
+    
+    Verifies that:
+    - acquire() waits instead of failing while the pool is exhausted
+    - The connection released by the other thread is handed out
+    """
+    pool = ConnectionPool(FakeConnection, min_size=0, max_size=1, timeout=5)
+    held = pool.acquire()
+    timer = threading.Timer(0.05, pool.release, args=(held,))
+    timer.start()
+    
+    assert pool.acquire() is held
+    timer.join()
+
+def test_pool_pre_ping_lifetime_and_idle_eviction():
+    """
+    Test that dead, expired and idle connections are replaced.
+    
+    Verifies that:
+    - A connection failing the pre-ping is discarded
+    - Connections older than max_lifetime are closed
+    - Idle connections above min_size are evicted after idle_timeout
+    """
+    pool = ConnectionPool(FakeConnection, min_size=0, max_size=2)
+    dead = pool.acquire()
+    pool.release(dead)
+    dead.alive = False
+    assert pool.acquire() is not dead
+    assert dead.closed
+    
+    pool = ConnectionPool(FakeConnection, min_size=0, max_size=2, max_lifetime=0.01)
+    old = pool.acquire()
+    pool.release(old)
+    time.sleep(0.02)
+    assert pool.acquire() is not old
+    assert old.closed
+    
+    pool = ConnectionPool(FakeConnection, min_size=1, max_size=3, idle_timeout=0.01)
+    connections = [pool.acquire() for _ in range(3)]
+    for connection in connections:
+        pool.release(connection)
+    time.sleep(0.02)
+    pool.release(pool.acquire())
+    assert pool.size == 1
+
+def test_pool_close_and_transaction_reset():
+    """
+    Test pool shutdown and connection state reset.
+    
+    Verifies that:
+    - Releasing a connection rolls back an open transaction
+    - close() closes idle connections and checked-out ones on release
+    """
+    pool = ConnectionPool(FakeConnection, min_size=2, max_size=3)
+    pool.fill()
+    assert pool.size == 2
+    
+    busy = pool.acquire()
+    busy.in_transaction = True
+    pool.close()
+    assert pool.idle == 0
+    
+    pool.release(busy)
+    assert not busy.in_transaction
+    assert busy.closed
+    assert pool.size == 0
+
+def test_compile_statement_mysql_dialect():
+    """
+    Test statement compilation for the MySQL dialect.
+    
+    Verifies that:
+    - Identifiers are quoted and %s placeholders are used
+    - Parameters are extracted data first, then query conditions
+    - Unconditional UPDATE and DELETE statements are refused
+    """
+    statement = compile_statement('mysql', 'update', 'app.users', ('id',), ('name', 'age'))
+    assert statement.sql == "UPDATE `app`.`users` SET `name` = %s, `age` = %s WHERE `id` = %s"
+    assert statement.params({'age': 3, 'name': 'x'}, {'id': 7}) == ['x', 3, 7]
+    
+    with pytest.raises(ValueError):
+        compile_statement('mysql', 'delete', 'users', ())
+
+def test_page_statement_mysql_dialect():
+    """
+    Test keyset page statements for the MySQL dialect.
+    
+    Verifies that:
+    - The keyset condition is expanded per order_by column with its direction
+    - Filter values come first, then keyset values, then limit + 1
+    """
+    order_by = parse_order_by('created DESC, id')
+    sql, params = page_statement('mysql', 'users', {'active': 1}, order_by, ['2024-01-01', 7], 50)
+    assert sql == ("SELECT * FROM `users` WHERE `active` = %s AND "
+                   "((`created` < %s) OR (`created` = %s AND `id` > %s)) "
+                   "ORDER BY `created` DESC, `id` LIMIT %s")
+    assert params == [1, '2024-01-01', '2024-01-01', 7, 51]
+    
+    sql, params = page_statement('mysql', 'users', None, order_by, None, 50)
+    assert sql == "SELECT * FROM `users` ORDER BY `created` DESC, `id` LIMIT %s"
+    assert params == [51]
+
+def test_filter_operators_mysql_dialect():
+    """
+    Test operator conditions compiled for the MySQL dialect.
+    
+    Verifies that:
+    - Each operator form renders with %s placeholders and quoted columns
+    - IN lists bind one placeholder per value and None compiles to IS NULL
+    """
+    query = {'age__gte': 18, 'id': ('in', [1, 2, 3]), 'deleted_at': None, 'name': {'like': 'A%', '!=': 'Al'}}
+    statement = compile_statement('mysql', 'select', 'users', filters.query_shape(query))
+    assert statement.sql == ("SELECT * FROM `users` WHERE `age` >= %s AND `id` IN (%s, %s, %s) AND "
+                             "`deleted_at` IS NULL AND `name` LIKE %s AND `name` != %s")
+    assert compile_statement('mysql', 'exists', 'users', filters.query_shape(query)).sql == (
+        "SELECT 1 FROM `users` WHERE `age` >= %s AND `id` IN (%s, %s, %s) AND "
+        "`deleted_at` IS NULL AND `name` LIKE %s AND `name` != %s LIMIT 1")
+    assert statement.params(query=query) == [18, 1, 2, 3, 'A%', 'Al']
+    
+    parts = filters.chunk_query({'id__in': list(range(10)) * 2, 'age': 5}, max_variables=4)
+    assert [filters.query_values(part) for part in parts] == [[0, 1, 2, 5], [3, 4, 5, 5], [6, 7, 8, 5], [9, 5]]
+
+
+def test_in_chunks_padding():
+    """
+    Test the IN lists get_many binds.
+    
+    Verifies that:
+    - Values are de-duplicated and split into chunks of at most chunk_size
+    - The last chunk is padded to a power of two, so few statements are compiled
+    """
+    assert list(filters.in_chunks([1, 2, 2, 3, 4, 5, 6], 4)) == [[1, 2, 3, 4], [5, 6]]
+    assert list(filters.in_chunks(range(5), 8)) == [[0, 1, 2, 3, 4, 4, 4, 4]]
+    assert list(filters.in_chunks(range(7), 6)) == [[0, 1, 2, 3, 4, 5], [6]]
+    assert list(filters.in_chunks([], 8)) == []
+
+def test_upsert_dialects():
+    """
+    Test the upsert statements of both dialects.
+    
+    Verifies that:
+    - SQLite targets the conflict keys, MySQL uses ON DUPLICATE KEY UPDATE
+    - Conflict keys are not overwritten unless listed, [] keeps the record
+    """
+    conflict_keys, update_columns = upsert_options(('id', 'name', 'age'))
+    assert (conflict_keys, update_columns) == (('id',), ('name', 'age'))
+    
+    statement = compile_upsert('mysql', 'users', ('id', 'name', 'age'), conflict_keys, update_columns)
+    assert statement.sql == ("INSERT INTO `users` (`id`, `name`, `age`) VALUES (%s, %s, %s) "
+                             "ON DUPLICATE KEY UPDATE `name` = VALUES(`name`), `age` = VALUES(`age`)")
+    assert statement.params(data={'age': 3, 'name': 'x', 'id': 1}) == [1, 'x', 3]
+    assert compile_upsert('mysql', 'users', ('id', 'name'), ('id',), ()).sql.endswith(
+        "ON DUPLICATE KEY UPDATE `id` = `id`")
+    assert compile_upsert('sqlite', 'users', ('email', 'name'), ('email',), ('name',)).sql == (
+        "INSERT INTO `users` (`email`, `name`) VALUES (?, ?) "
+        "ON CONFLICT (`email`) DO UPDATE SET `name` = excluded.`name`")
+    
+    with pytest.raises(ValueError):
+        upsert_options(('name',), conflict_keys=['email'])
+
+def test_case_update_mysql_dialect():
+    """
+    Test the multi-row UPDATE ... CASE statement of MySQL update_many.
+    
+    Verifies that:
+    - Each column gets one WHEN per row and keeps its value otherwise
+    - Parameters are bound column by column, then the key list
+    """
+    rows = [{'id': 1, 'age': 30, 'name': 'a'}, {'id': 2, 'age': 31, 'name': 'b'}]
+    groups = group_by_columns(rows + [{'id': 3, 'age': 5}], 'id')
+    assert list(groups) == [('age', 'name'), ('age',)]
+    
+    sql = compile_case_update('mysql', 'users', 'id', ('age', 'name'), 2)
+    assert sql == ("UPDATE `users` SET "
+                   "`age` = CASE `id` WHEN %s THEN %s WHEN %s THEN %s ELSE `age` END, "
+                   "`name` = CASE `id` WHEN %s THEN %s WHEN %s THEN %s ELSE `name` END "
+                   "WHERE `id` IN (%s, %s)")
+    assert case_update_params(groups[('age', 'name')], 'id', ('age', 'name')) == [1, 30, 2, 31, 1, 'a', 2, 'b', 1, 2]
+    
+    with pytest.raises(ValueError):
+        group_by_columns([{'age': 5}], 'id')
+
+def test_aggregate_mysql_dialect():
+    """
+    Test the aggregate statement compiled for the MySQL dialect.
+    
+    Verifies that:
+    - Group columns come first and aggregates are aliased
+    - Conditions bind %s placeholders and groups are sorted
+    """
+    aggregates, group_by = aggregate_options({'total': ('SUM', 'amount'), 'n': ('count', '*'), 
+                                              'buyers': ('count_distinct', 'user_id')}, 'day')
+    where = {'amount__gt': 0, 'status': 'paid'}
+    statement = compile_aggregate('mysql', 'orders', aggregates, filters.query_shape(where), group_by)
+    assert statement.sql == ("SELECT `day`, SUM(`amount`) AS `total`, COUNT(*) AS `n`, "
+                             "COUNT(DISTINCT `user_id`) AS `buyers` FROM `orders` "
+                             "WHERE `amount` > %s AND `status` = %s GROUP BY `day` ORDER BY `day`")
+    assert statement.params(query=where) == [0, 'paid']
+
+def test_increment_mysql_dialect():
+    """
+    Test the add/sub statements compiled for the MySQL dialect.
+    
+    Verifies that:
+    - Increments are computed by the database with quoted columns
+    - Combined increments are grouped by statement shape, amounts bound first
+    """
+    statement = compile_statement('mysql', 'increment', 'pages', ('id',), ('views', 'likes'))
+    assert statement.sql == "UPDATE `pages` SET `views` = `views` + %s, `likes` = `likes` + %s WHERE `id` = %s"
+    assert statement.params({'views': 3, 'likes': -1}, {'id': 7}) == [3, -1, 7]
+    
+    groups = group_increments([({'id': 1}, {'views': 2}), ({'id': 2}, {'views': 1}), 
+                               ({'slug': 'home'}, {'views': 5, 'likes': 1})])
+    assert groups == {(('id',), ('views',)): [[2, 1], [1, 2]], 
+                      (('slug',), ('views', 'likes')): [[5, 1, 'home']]}
+    with pytest.raises(ValueError):
+        compile_statement('mysql', 'increment', 'pages', (), ('views',))
+
+def test_load_data_statement():
+    """
+    Test the LOAD DATA LOCAL INFILE statement of CSV imports.
+    
+    Verifies that:
+    - The file name is bound as a parameter and the header line is skipped
+    - Header columns that are not imported are discarded
+    - With null given, loaded columns are set to NULLIF(field, null)
+    """
+    sql = load_data_statement('users', ['name', 'age', 'city'], '\r\n', ['name', 'age'])
+    assert sql == ("LOAD DATA LOCAL INFILE %s INTO TABLE `users` CHARACTER SET utf8mb4 "
+                   "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                   "LINES TERMINATED BY '\\r\\n' IGNORE 1 LINES (`name`, `age`, @skip)")
+    
+    sql = load_data_statement('users', ['name', 'age', 'city'], '\n', ['name', 'age'], null='')
+    assert sql.endswith("IGNORE 1 LINES (@v0, @v1, @skip) SET `name` = NULLIF(@v0, %s), `age` = NULLIF(@v1, %s)")
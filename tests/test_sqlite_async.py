@@ -1,3 +1,4 @@
+import asyncio
 import os
 import pytest
 import pytest_asyncio
@@ -130,3 +131,437 @@ async def test_delete(db):
     except Exception as e:
         print(f"Error testing record deletion: {e}")
         traceback.print_exc()
+
+@pytest_asyncio.fixture
+async def file_db(tmp_path):
+    """
+    Create a file-backed asynchronous SQLite database fixture.
+    
+    Unlike `db`, the database lives at an absolute path inside pytest's
+    temporary directory, so every connection opened by the driver sees
+    the same data.
+    
+    Returns:
+        easedb.AsyncDatabase: A database instance with a populated 'users' table.
+    """
+    database = easedb.AsyncDatabase(f"sqlite:///{tmp_path / 'test_async.db'}")
+    await database.create_table('users', {
+        'id': 'INTEGER',
+        'name': 'TEXT',
+        'age': 'INTEGER'
+    })
+    await database.set('users', {'name': 'Alice', 'age': 30})
+    await database.set('users', {'name': 'Bob', 'age': 25})
+    
+    yield database
+    
+    await database.disconnect()
+
+@pytest.mark.asyncio
+async def test_session_reuses_connection(file_db):
+    """
+    Test the persistent session mode asynchronously.
+    
+    Verifies that:
+    - Operations inside an async with block share one live connection
+    - The connection is closed when the block exits
+    """
+    async with file_db:
+        connection = file_db.driver.connection
+        assert (await file_db.get('users', {'name': 'Alice'}))['age'] == 30
+        assert await file_db.update('users', {'name': 'Bob'}, {'age': 26})
+        assert (await file_db.get('users', {'name': 'Bob'}))['age'] == 26
+        assert file_db.driver.connected
+        assert file_db.driver.connection is connection
+    
+    assert not file_db.driver.connected
+    assert not file_db.keep_connection_open
+
+@pytest.mark.asyncio
+async def test_set_many(file_db):
+    """
+    Test asynchronous bulk insertion in chunked transactions.
+    
+    Verifies that:
+    - Rows are inserted across several chunks
+    - The number of inserted rows is returned
+    - Column names with spaces and reserved words are quoted
+    """
+    rows = [{'name': f'user{i}', 'age': i} for i in range(250)]
+    assert await file_db.set_many('users', rows, chunk_size=100) == 250
+    assert len(await file_db.get_all('users')) == 252
+    
+    await file_db.create_table('orders', {'id': 'INTEGER', 'first name': 'TEXT', 'order': 'INTEGER'})
+    assert await file_db.set_many('orders', [{'first name': 'Alice', 'order': 1}]) == 1
+    assert await file_db.get('orders', {'order': 1}, columns=['first name']) == {'first name': 'Alice'}
+
+@pytest.mark.asyncio
+async def test_iter_all(file_db):
+    """
+    Test asynchronous streaming iteration over a table.
+    
+    Verifies that:
+    - Every matching row is yielded across several batches
+    - The connection is released once the iteration finishes
+    - Calls made during the iteration do not close its connection
+    """
+    await file_db.set_many('users', [{'name': 'bulk', 'age': i} for i in range(250)])
+    
+    ages = [user['age'] async for user in file_db.iter_all('users', {'name': 'bulk'}, batch_size=100)]
+    assert ages == list(range(250))
+    assert not file_db.driver.connected
+    
+    connections = set()
+    async for user in file_db.iter_all('users', {'name': 'bulk'}, batch_size=100):
+        assert (await file_db.get('users', {'id': 1}))['name'] == 'Alice'
+        connections.add(id(file_db.driver.connection))
+    assert len(connections) == 1
+    assert not file_db.driver.connected
+
+@pytest.mark.asyncio
+async def test_transaction(file_db):
+    """
+    Test the asynchronous transaction context manager.
+    
+    Verifies that:
+    - Writes inside the block are committed when it exits
+    - An exception rolls the whole transaction back
+    - A failing nested block only rolls back to its savepoint
+    """
+    async with file_db.transaction():
+        assert await file_db.set('users', {'name': 'Carol', 'age': 41})
+        assert await file_db.update('users', {'name': 'Carol'}, {'age': 42})
+    assert (await file_db.get('users', {'name': 'Carol'}))['age'] == 42
+    
+    with pytest.raises(RuntimeError):
+        async with file_db.transaction():
+            await file_db.delete('users', {'name': 'Alice'})
+            raise RuntimeError("abort")
+    assert await file_db.get('users', {'name': 'Alice'}) is not None
+    
+    async with file_db.transaction():
+        await file_db.set('users', {'name': 'Dave', 'age': 50})
+        with pytest.raises(RuntimeError):
+            async with file_db.transaction():
+                await file_db.set('users', {'name': 'Eve', 'age': 60})
+                raise RuntimeError("abort savepoint")
+    assert await file_db.get('users', {'name': 'Dave'}) is not None
+    assert await file_db.get('users', {'name': 'Eve'}) is None
+
+@pytest.mark.asyncio
+async def test_transaction_isolated_from_other_tasks(file_db):
+    """
+    Test writes of other tasks while a transaction is open.
+    
+    Verifies that:
+    - A write of another task waits instead of committing the open transaction
+    - The transaction still rolls back completely, the other write succeeds afterwards
+    """
+    opened = asyncio.Event()
+    
+    async def rolled_back():
+        with pytest.raises(RuntimeError):
+            async with file_db.transaction():
+                await file_db.set('users', {'name': 'Carol', 'age': 41})
+                opened.set()
+                await asyncio.sleep(0.05)
+                raise RuntimeError("abort")
+    
+    async def other_task():
+        await opened.wait()
+        return await file_db.set('users', {'name': 'Dave', 'age': 50})
+    
+    _, written = await asyncio.gather(rolled_back(), other_task())
+    assert written
+    assert await file_db.get('users', {'name': 'Carol'}) is None
+    assert await file_db.get('users', {'name': 'Dave'}) is not None
+
+@pytest.mark.asyncio
+async def test_row_format(file_db):
+    """
+    Test the row_format option of the asynchronous get, get_all and execute.
+    
+    Verifies that:
+    - 'tuple', 'namedtuple' and 'columnar' results hold the same data as dicts
+    - Pagination still applies with a row format
+    """
+    assert await file_db.get('users', {'name': 'Alice'}, row_format='tuple') == (1, 'Alice', 30)
+    assert (await file_db.get('users', {'name': 'Bob'}, row_format='namedtuple')).age == 25
+    
+    result = await file_db.get_all('users', row_format='columnar')
+    assert result['name'] == ('Alice', 'Bob')
+    assert await file_db.get_all('users', page=2, page_size=1, row_format='tuple') == [(2, 'Bob', 25)]
+    assert await file_db.execute("SELECT COUNT(*) FROM users", row_format='tuple') == [(2,)]
+
+@pytest.mark.asyncio
+async def test_query_cache(tmp_path):
+    """
+    Test the read-through query cache of AsyncDatabase.
+    
+    Verifies that:
+    - Repeated reads are served from the cache
+    - Writes through the same instance invalidate the table's entries
+    """
+    database = easedb.AsyncDatabase(f"sqlite:///{tmp_path / 'test_cache.db'}", cache_size=16)
+    await database.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+    await database.set('users', {'name': 'Alice', 'age': 30})
+    
+    assert (await database.get('users', {'name': 'Alice'}))['age'] == 30
+    assert (await database.get('users', {'name': 'Alice'}))['age'] == 30
+    assert database.cache.stats()['hits'] == 1
+    
+    await database.update('users', {'name': 'Alice'}, {'age': 31})
+    assert (await database.get('users', {'name': 'Alice'}))['age'] == 31
+    assert database.cache.stats()['hits'] == 1
+
+@pytest.mark.asyncio
+async def test_pragma_options(tmp_path):
+    """
+    Test that SQLite pragmas from the connection string are applied asynchronously.
+    """
+    async with easedb.AsyncDatabase(f"sqlite:///{tmp_path / 'pragmas.db'}?preset=durable") as db:
+        async with db.driver.connection.execute("PRAGMA journal_mode") as cursor:
+            assert (await cursor.fetchone())[0] == 'wal'
+        async with db.driver.connection.execute("PRAGMA synchronous") as cursor:
+            assert (await cursor.fetchone())[0] == 2
+
+@pytest.mark.asyncio
+async def test_get_page(file_db):
+    """
+    Test asynchronous keyset pagination with get_page.
+    """
+    await file_db.set_many('users', [{'id': i, 'name': f'user{i}', 'age': 40} for i in range(3, 6)])
+    
+    page = await file_db.get_page('users', order_by='id', limit=2)
+    assert [record['id'] for record in page] == [1, 2]
+    page = await file_db.get_page('users', order_by='id', after=page.token, limit=2)
+    assert [record['id'] for record in page] == [3, 4]
+    page = await file_db.get_page('users', order_by='id', after=page.token, limit=2)
+    assert [record['id'] for record in page] == [5]
+    assert not page.has_more
+
+@pytest.mark.asyncio
+async def test_columns_order_by_limit(file_db):
+    """
+    Test column projection, ORDER BY and LIMIT pushdown asynchronously.
+    """
+    assert await file_db.get_all('users', columns=['name'], order_by='age', limit=1) == [{'name': 'Bob'}]
+    assert await file_db.get_all('users', columns=['name'], order_by='age DESC', 
+                                 page=2, page_size=1) == [{'name': 'Bob'}]
+    assert await file_db.get('users', {'id': 1}, columns=['name', 'age'], row_format='tuple') == ('Alice', 30)
+    
+    with pytest.raises(ValueError):
+        await file_db.get_all('users', page=1, page_size=1, limit=1)
+
+@pytest.mark.asyncio
+async def test_filter_operators(file_db):
+    """
+    Test operator conditions and IN list splitting asynchronously.
+    """
+    await file_db.set_many('users', [{'id': i, 'name': f'user{i}', 'age': 60} for i in range(3, 1503)])
+    
+    assert [r['name'] for r in await file_db.get_all('users', {'age': ('<', 60)}, order_by='age')] == ['Bob', 'Alice']
+    assert await file_db.driver.count('users', {'id__in': list(range(1, 1503)), 'age__gte': 30}) == 1501
+    records = await file_db.get_all('users', {'id__in': list(range(1503))}, order_by='id DESC', page=2, page_size=2)
+    assert [record['id'] for record in records] == [1500, 1499]
+    
+    assert await file_db.delete('users', {'id__gt': 2})
+    assert len(await file_db.get_all('users')) == 2
+
+@pytest.mark.asyncio
+async def test_get_many(file_db):
+    """
+    Test batched key lookups with get_many asynchronously.
+    """
+    await file_db.set_many('users', [{'id': i, 'name': f'user{i}', 'age': 40} for i in range(3, 1203)])
+    
+    records = await file_db.get_many('users', [1, 99999, *range(2, 1203)], columns=['name'])
+    assert len(records) == 1202
+    assert records[1] == {'name': 'Alice'} and records[1202] == {'name': 'user1202'}
+    assert await file_db.get_many('users', [2], row_format='namedtuple') == {2: (2, 'Bob', 25)}
+
+@pytest.mark.asyncio
+async def test_batched_get(tmp_path):
+    """
+    Test coalescing of concurrent single-key get() calls.
+    
+    Verifies that:
+    - Concurrent lookups on one column run as a single query
+    - Identical concurrent lookups share one result, missing keys return None
+    - Other queries and reads inside a transaction are not batched
+    - A value the database converts ('6' for an INTEGER id) finds the record like an unbatched get
+    """
+    database = easedb.AsyncDatabase(f"sqlite:///{tmp_path / 'test_batch.db'}", batch_window=0)
+    await database.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+    await database.set_many('users', [{'name': f'user{i}', 'age': i} for i in range(1, 21)])
+    
+    async with database:
+        records = await asyncio.gather(*(database.get('users', {'id': i}) for i in [1, 2, 2, 20, 99]))
+        assert [record and record['age'] for record in records] == [1, 2, 2, 20, None]
+        assert database.batcher.stats() == {'loads': 5, 'batches': 1, 'shared': 1, 'pending': 0}
+    
+        names = await asyncio.gather(database.get('users', {'name': 'user3'}, columns=['age']), 
+                                     database.get('users', {'id': 4}, row_format='tuple'), 
+                                     database.get('users', {'name': 'user5', 'age': 5}))
+        assert names == [{'age': 3}, (4, 'user4', 4), {'id': 5, 'name': 'user5', 'age': 5}]
+        assert database.batcher.stats()['batches'] == 3
+    
+        async with database.transaction():
+            await database.update('users', {'id': 1}, {'age': 50})
+            assert (await database.get('users', {'id': 1}))['age'] == 50
+        assert database.batcher.stats()['batches'] == 3
+    
+        records = await asyncio.gather(database.get('users', {'id': '6'}), database.get('users', {'id': 7}))
+        assert [record['age'] for record in records] == [6, 7]
+        assert database.batcher.stats()['batches'] == 4
+    
+    with pytest.raises(ValueError):
+        easedb.AsyncDatabase(f"sqlite:///{tmp_path / 'test_batch.db'}", batch_window=0, batch_size=0)
+
+@pytest.mark.asyncio
+async def test_upsert(file_db):
+    """
+    Test upsert and upsert_many asynchronously.
+    """
+    assert await file_db.upsert('users', {'id': 1, 'name': 'Alice', 'age': 31})
+    assert await file_db.upsert_many('users', [{'id': 2, 'name': 'Bob', 'age': 26}, 
+                                               {'id': 3, 'name': 'Carol', 'age': 40}]) == 2
+    assert await file_db.get_all('users', row_format='tuple') == [(1, 'Alice', 31), (2, 'Bob', 26), (3, 'Carol', 40)]
+
+@pytest.mark.asyncio
+async def test_update_many_delete_many(file_db):
+    """
+    Test bulk updates and deletes by key asynchronously.
+    """
+    assert await file_db.update_many('users', [{'id': 1, 'age': 31}, {'id': 2, 'name': 'Robert'}]) == 2
+    assert await file_db.get_all('users', row_format='tuple') == [(1, 'Alice', 31), (2, 'Robert', 25)]
+    assert await file_db.delete_many('users', [2, 3]) == 1
+    assert await file_db.get_all('users', columns=['id']) == [{'id': 1}]
+
+@pytest.mark.asyncio
+async def test_count_exists(file_db):
+    """
+    Test count and exists asynchronously.
+    """
+    assert await file_db.count('users') == 2
+    assert await file_db.count('users', {'age__lt': 30}) == 1
+    assert await file_db.count('users', approximate=True) == 2
+    assert await file_db.exists('users', {'name': 'Alice'})
+    assert not await file_db.exists('users', {'age__gt': 99})
+
+@pytest.mark.asyncio
+async def test_aggregate(file_db):
+    """
+    Test aggregate pushdown asynchronously.
+    """
+    assert await file_db.aggregate('users', {'total': ('sum', 'age'), 'n': ('count', '*')}) == {'total': 55, 'n': 2}
+    groups = await file_db.aggregate('users', {'n': 'count'}, where={'age__gt': 20}, group_by='name', 
+                                     row_format='columnar')
+    assert groups['name'] == ('Alice', 'Bob') and groups['n'] == (1, 1)
+
+@pytest.mark.asyncio
+async def test_add_sub(file_db, tmp_path):
+    """
+    Test atomic add/sub and write-combining.
+    
+    Verifies that:
+    - add and sub change a column in place
+    - Combined increments are summed per record and flushed once the window has passed
+    - disconnect() flushes the increments still buffered
+    """
+    assert await file_db.add('users', {'id': 1}, 5, column='age')
+    assert await file_db.sub('users', {'name': 'Bob'}, 3, column='age')
+    assert [user['age'] for user in await file_db.get_all('users', order_by='id')] == [35, 22]
+    with pytest.raises(ValueError):
+        await file_db.sub('users', {'id': 1}, None, column='age')
+    
+    database = easedb.AsyncDatabase(f"sqlite:///{tmp_path / 'test_combine.db'}", combine_window=0.05)
+    await database.create_table('pages', {'id': 'INTEGER', 'views': 'INTEGER'})
+    await database.set_many('pages', [{'views': 0} for _ in range(2)])
+    
+    async with database:
+        await asyncio.gather(*(database.add('pages', {'id': page}, 1, column='views') for page in [1, 2, 1]))
+        assert (await database.get('pages', {'id': 1}))['views'] == 0
+        await asyncio.sleep(0.2)
+        assert [page['views'] for page in await database.get_all('pages', order_by='id')] == [2, 1]
+        assert database.combiner.stats() == {'adds': 3, 'flushes': 1, 'records': 2, 'pending': 0}
+    
+        await database.sub('pages', {'id': 2}, 4, column='views')
+    assert (await database.get('pages', {'id': 2}))['views'] == -3
+
+@pytest.mark.asyncio
+async def test_flush_failure_keeps_increments(tmp_path):
+    """
+    Test that increments of a failed flush are retried asynchronously.
+    
+    Verifies that:
+    - A rolled back flush keeps the increments buffered
+    - They are written by the flush re-armed after the combine window
+    """
+    database = easedb.AsyncDatabase(f"sqlite:///{tmp_path / 'test_combine.db'}", combine_window=0.05)
+    async with database:
+        await database.add('pages', {'id': 1}, 2, column='views')
+        assert await database.flush() == 0
+        assert len(database.combiner) == 1
+        
+        await database.create_table('pages', {'id': 'INTEGER', 'views': 'INTEGER'})
+        await database.set('pages', {'views': 0})
+        await asyncio.sleep(0.2)
+        assert len(database.combiner) == 0
+        assert (await database.get('pages', {'id': 1}))['views'] == 2
+
+@pytest.mark.asyncio
+async def test_import_file(file_db, tmp_path):
+    """
+    Test streaming imports asynchronously.
+    
+    Verifies that:
+    - JSON Lines rows are inserted in chunks with a progress report per chunk
+    """
+    path = tmp_path / 'users.ndjson'
+    path.write_text(''.join(f'{{"name": "user{i}", "age": {i}}}\n' for i in range(5)), encoding='utf-8')
+    reports = []
+    
+    assert await file_db.import_file('users', str(path), chunk_size=2, 
+                                     progress=lambda rows, rate: reports.append(rows)) == 5
+    assert reports == [2, 4, 5]
+    assert await file_db.count('users') == 7
+
+@pytest.mark.asyncio
+async def test_export(file_db, tmp_path):
+    """
+    Test streaming exports asynchronously.
+    
+    Verifies that:
+    - Batches are written while the next ones are fetched, in order
+    - A failed Parquet export removes the partial file
+    """
+    await file_db.set_many('users', [{'name': f'user{i}', 'age': i} for i in range(10)])
+    
+    path = tmp_path / 'users.jsonl'
+    assert await file_db.export('users', str(path), batch_size=3) == 12
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 12 and lines[0] == '{"id": 1, "name": "Alice", "age": 30}'
+    assert lines[-1] == '{"id": 12, "name": "user9", "age": 9}'
+    
+    pyarrow = pytest.importorskip('pyarrow')
+    await file_db.set('users', {'name': 'user10', 'age': 'unknown'})
+    with pytest.raises(pyarrow.ArrowException):
+        await file_db.export('users', str(tmp_path / 'users.parquet'), batch_size=3)
+    assert not (tmp_path / 'users.parquet').exists()
+
+
+@pytest.mark.asyncio
+async def test_fetch_columns(file_db):
+    """
+    Test columnar fetches asynchronously.
+    
+    Verifies that:
+    - Batches are concatenated into one array per column, in select order
+    """
+    pytest.importorskip('numpy')
+    await file_db.set_many('users', [{'name': f'user{i}', 'age': i} for i in range(5)])
+    
+    columns = await file_db.fetch_columns('SELECT age, id FROM users ORDER BY id', batch_size=2)
+    assert list(columns) == ['age', 'id']
+    assert columns['age'].tolist() == [30, 25, 0, 1, 2, 3, 4]
@@ -1,7 +1,13 @@
+import gc
 import os
+import sqlite3
+import sys
 import pytest
 import easedb
 import traceback
+from easedb.drivers import filters
+from easedb.drivers.statements import compile_statement, parse_order_by
+from easedb.logger import hot_logger
 
 @pytest.fixture
 def db():
@@ -125,3 +131,929 @@ def test_delete(db):
     except Exception as e:
         print(f"Error testing record deletion: {e}")
         traceback.print_exc()
+
+@pytest.fixture
+def file_db(tmp_path):
+    """
+    Create a file-backed SQLite database fixture.
+    
+    Unlike `db`, the database lives at an absolute path inside pytest's
+    temporary directory, so every connection opened by the driver sees
+    the same data.
+    
+    Returns:
+        easedb.Database: A database instance with a populated 'users' table.
+    """
+    database = easedb.Database(f"sqlite:///{tmp_path / 'test_sync.db'}")
+    database.create_table('users', {
+        'id': 'INTEGER',
+        'name': 'TEXT',
+        'age': 'INTEGER'
+    })
+    database.set('users', {'name': 'Alice', 'age': 30})
+    database.set('users', {'name': 'Bob', 'age': 25})
+    
+    yield database
+    
+    database.disconnect()
+
+def test_session_reuses_connection(file_db):
+    """
+    Test the persistent session mode.
+    
+    Verifies that:
+    - Operations inside a with block share one live connection
+    - The connection is closed when the block exits
+    """
+    with file_db:
+        connection = file_db.driver.connection
+        assert file_db.get('users', {'name': 'Alice'})['age'] == 30
+        assert file_db.set('users', {'name': 'Carol', 'age': 41})
+        assert len(file_db.get_all('users')) == 3
+        assert file_db.driver.connected
+        assert file_db.driver.connection is connection
+    
+    assert not file_db.driver.connected
+    assert not file_db.keep_connection_open
+
+def test_connect_per_call_without_session(file_db):
+    """
+    Test that operations outside a session release their connection.
+    
+    Verifies that:
+    - The driver is disconnected after each call
+    - Data written by one call is visible to the next
+    """
+    assert file_db.set('users', {'name': 'Carol', 'age': 41})
+    assert not file_db.driver.connected
+    assert file_db.get('users', {'name': 'Carol'})['age'] == 41
+    assert not file_db.driver.connected
+
+def test_set_many(file_db):
+    """
+    Test bulk insertion in chunked transactions.
+    
+    Verifies that:
+    - Rows from a generator are inserted across several chunks
+    - The number of inserted rows is returned
+    - A failing chunk stops the load after the committed chunks
+    """
+    rows = ({'name': f'user{i}', 'age': i} for i in range(2500))
+    assert file_db.set_many('users', rows, chunk_size=1000) == 2500
+    assert len(file_db.get_all('users')) == 2502
+    
+    rows = [{'name': 'ok', 'age': 1}] * 3 + [{'name': 'broken'}]
+    assert file_db.set_many('users', rows, chunk_size=3) == 3
+    assert len(file_db.get_all('users', {'name': 'ok'})) == 3
+
+def test_set_many_quoted_identifiers(file_db):
+    """
+    Test bulk insertion into columns that need quoting.
+    
+    Verifies that:
+    - Column names with spaces and reserved words are quoted like set() quotes them
+    """
+    file_db.create_table('orders', {'id': 'INTEGER', 'first name': 'TEXT', 'order': 'INTEGER'})
+    rows = [{'first name': f'user{i}', 'order': i} for i in range(3)]
+    assert file_db.set_many('orders', rows) == 3
+    assert file_db.get('orders', {'order': 2}, columns=['first name']) == {'first name': 'user2'}
+
+
+def test_iter_all(file_db):
+    """
+    Test streaming iteration over a table.
+    
+    Verifies that:
+    - Every matching row is yielded across several batches
+    - Closing the generator early releases the connection
+    """
+    file_db.set_many('users', ({'name': 'bulk', 'age': i} for i in range(250)))
+    
+    ages = [user['age'] for user in file_db.iter_all('users', {'name': 'bulk'}, batch_size=100)]
+    assert ages == list(range(250))
+    assert not file_db.driver.connected
+    
+    records = file_db.iter_all('users', batch_size=10)
+    assert next(records)['name'] == 'Alice'
+    assert file_db.driver.connected
+    records.close()
+    assert not file_db.driver.connected
+
+def test_iter_all_with_nested_calls(file_db, tmp_path):
+    """
+    Test other calls on the same database while a stream is open.
+    
+    Verifies that:
+    - Reads and writes during iter_all() do not close the streaming connection
+    - export() is unaffected by calls made between its batches
+    - The connection is closed once the iteration finishes
+    """
+    file_db.set_many('users', [{'name': 'bulk', 'age': i} for i in range(50)])
+    
+    ages = []
+    for user in file_db.iter_all('users', {'name': 'bulk'}, batch_size=10):
+        assert file_db.get('users', {'id': 1})['name'] == 'Alice'
+        file_db.set('users', {'name': 'nested', 'age': user['age']})
+        ages.append(user['age'])
+    assert ages == list(range(50))
+    assert not file_db.driver.connected
+    
+    batches = 0
+    for columns, rows in file_db.driver.iter_batches('users', batch_size=10):
+        assert file_db.count('users') == 102
+        batches += 1
+    assert batches == 11
+    assert not file_db.driver.connected
+
+def test_statement_cache(file_db):
+    """
+    Test the compiled statement cache.
+    
+    Verifies that:
+    - Repeated operations with the same key set reuse the compiled SQL
+    - A different key set compiles a new statement
+    """
+    easedb.clear_statement_cache()
+    
+    with file_db:
+        for _ in range(3):
+            assert file_db.get('users', {'name': 'Alice'})['age'] == 30
+        assert file_db.get('users', {'name': 'Alice', 'age': 30}) is not None
+    
+    info = easedb.statement_cache_info()
+    assert info['misses'] == 2
+    assert info['hits'] == 2
+
+def test_quiet_hot_path_logging(file_db):
+    """
+    Test lazy logging on the CRUD hot path.
+    
+    Verifies that:
+    - Per-operation messages reach a DEBUG sink
+    - Arguments are not formatted when the level filters the message out
+    - Quiet hot path mode suppresses per-operation messages but keeps errors
+    """
+    class Probe:
+        formatted = 0
+        def __format__(self, spec):
+            Probe.formatted += 1
+            return 'probe'
+    
+    messages = []
+    easedb.logger.remove()
+    handler_id = easedb.logger.add(messages.append, level='DEBUG', format='{level} {message}')
+    try:
+        file_db.get('users', {'name': 'Alice'})
+        assert any('SELECT' in message for message in messages)
+        
+        easedb.logger.remove(handler_id)
+        handler_id = easedb.logger.add(messages.append, level='WARNING', format='{level} {message}')
+        hot_logger.info("Row: {}", Probe())
+        assert Probe.formatted == 0
+        
+        easedb.logger.remove(handler_id)
+        handler_id = easedb.logger.add(messages.append, level='DEBUG', format='{level} {message}')
+        messages.clear()
+        easedb.quiet_hot_path()
+        file_db.get('users', {'name': 'Alice'})
+        file_db.get('missing_table', {'name': 'Alice'})
+        assert messages and all(message.startswith('ERROR') for message in messages)
+    finally:
+        easedb.quiet_hot_path(False)
+        easedb.logger.remove()
+        easedb.logger.add(sys.stderr)
+
+def test_hot_path_level_fallback(monkeypatch):
+    """
+    Test the level check of hot path messages.
+    
+    Verifies that:
+    - The lowest handler level is readable from the installed loguru
+    - Without it, the level given to logger_config() is the threshold
+    - Without either, messages are passed on for loguru to filter
+    """
+    import importlib
+    logger_module = importlib.import_module('easedb.logger.logger')
+    
+    easedb.logger.remove()
+    handler_id = easedb.logger.add(lambda message: None, level='WARNING')
+    try:
+        assert logger_module._handlers_min_level() == easedb.logger.level('WARNING').no
+        assert not logger_module.hot_path_enabled('INFO')
+        
+        monkeypatch.setattr(logger_module, '_handlers_min_level', lambda: None)
+        monkeypatch.setattr(logger_module, '_configured_level', None)
+        assert logger_module.hot_path_enabled('DEBUG')
+        monkeypatch.setattr(logger_module, '_configured_level', easedb.logger.level('INFO').no)
+        assert logger_module.hot_path_enabled('INFO')
+        assert not logger_module.hot_path_enabled('DEBUG')
+    finally:
+        easedb.logger.remove(handler_id)
+        easedb.logger.add(sys.stderr)
+
+def test_transaction(file_db, tmp_path):
+    """
+    Test the transaction context manager.
+    
+    Verifies that:
+    - Writes inside the block are committed once, when it exits
+    - An exception rolls the whole transaction back
+    - A failing nested block only rolls back to its savepoint
+    - A failed operation turns into TransactionError and a rollback
+    """
+    other = sqlite3.connect(tmp_path / 'test_sync.db')
+    
+    with file_db.transaction():
+        assert file_db.set('users', {'name': 'Carol', 'age': 41})
+        assert file_db.update('users', {'id': 3, 'age': 42})
+        assert other.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 2
+    assert other.execute("SELECT age FROM users WHERE name = 'Carol'").fetchone()[0] == 42
+    
+    with pytest.raises(RuntimeError):
+        with file_db.transaction():
+            file_db.delete('users', {'name': 'Alice'})
+            raise RuntimeError("abort")
+    assert file_db.get('users', {'name': 'Alice'}) is not None
+    
+    with file_db.transaction():
+        file_db.set('users', {'name': 'Dave', 'age': 50})
+        with pytest.raises(RuntimeError):
+            with file_db.transaction():
+                file_db.set('users', {'name': 'Eve', 'age': 60})
+                raise RuntimeError("abort savepoint")
+    assert file_db.get('users', {'name': 'Dave'}) is not None
+    assert file_db.get('users', {'name': 'Eve'}) is None
+    
+    with pytest.raises(easedb.TransactionError):
+        with file_db.transaction():
+            file_db.set('users', {'name': 'Frank', 'age': 70})
+            assert not file_db.set('users', {'missing_column': 1})
+    assert file_db.get('users', {'name': 'Frank'}) is None
+    
+    other.close()
+
+def test_row_format(file_db):
+    """
+    Test the row_format option of get, get_all and execute.
+    
+    Verifies that:
+    - 'tuple' and 'namedtuple' return rows in column order
+    - Namedtuple classes are shared between calls with the same columns
+    - 'columnar' returns one tuple of values per column
+    - Unknown formats are rejected
+    """
+    assert file_db.get('users', {'name': 'Alice'}, row_format='tuple') == (1, 'Alice', 30)
+    
+    rows = file_db.get_all('users', row_format='namedtuple')
+    assert [row.name for row in rows] == ['Alice', 'Bob']
+    assert type(rows[0]) is type(file_db.get('users', {'name': 'Bob'}, row_format='namedtuple'))
+    
+    result = file_db.get_all('users', row_format='columnar')
+    assert isinstance(result, easedb.ColumnarResult)
+    assert len(result) == 2
+    assert result.columns == ('id', 'name', 'age')
+    assert result['age'] == (30, 25)
+    assert list(result) == [(1, 'Alice', 30), (2, 'Bob', 25)]
+    assert result.to_dicts() == file_db.get_all('users')
+    
+    assert file_db.execute("SELECT name FROM users ORDER BY age", row_format='tuple') == [('Bob',), ('Alice',)]
+    assert len(file_db.get_all('users', {'name': 'Nobody'}, row_format='columnar')) == 0
+    
+    with pytest.raises(ValueError):
+        file_db.get('users', {'name': 'Alice'}, row_format='columnar')
+    with pytest.raises(ValueError):
+        file_db.get_all('users', row_format='list')
+
+@pytest.fixture
+def cached_db(tmp_path):
+    """
+    Create a file-backed SQLite database fixture with the query cache enabled.
+    
+    Returns:
+        easedb.Database: A database instance with a populated 'users' table.
+    """
+    database = easedb.Database(f"sqlite:///{tmp_path / 'test_cache.db'}", cache_size=2, cache_ttl=60)
+    database.create_table('users', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+    database.set_many('users', [{'name': 'Alice', 'age': 30}, {'name': 'Bob', 'age': 25}])
+    return database
+
+def test_query_cache(cached_db):
+    """
+    Test the read-through query cache.
+    
+    Verifies that:
+    - Repeated reads are served from the cache and counted as hits
+    - Modifying a returned record does not change the cached one
+    - Writes through the same instance invalidate the table's entries
+    - The least recently used entry is evicted above cache_size
+    """
+    alice = cached_db.get('users', {'name': 'Alice'})
+    alice['age'] = 99
+    assert cached_db.get('users', {'name': 'Alice'})['age'] == 30
+    assert cached_db.cache.stats()['hits'] == 1
+    
+    assert len(cached_db.get_all('users')) == 2
+    cached_db.set('users', {'name': 'Carol', 'age': 41})
+    assert len(cached_db.get_all('users')) == 3
+    
+    cached_db.update('users', {'id': 1, 'age': 31})
+    assert cached_db.get('users', {'name': 'Alice'})['age'] == 31
+    
+    cached_db.execute("DELETE FROM users WHERE name = ?", ('Carol',))
+    assert len(cached_db.get_all('users')) == 2
+    
+    cached_db.get('users', {'name': 'Bob'})
+    cached_db.get('users', {'name': 'Alice'})
+    stats = cached_db.cache.stats()
+    assert stats['size'] == 2
+    assert stats['evictions'] == 1
+    assert 0 < stats['hit_rate'] < 1
+
+def test_query_cache_ttl_and_rollback(cached_db, monkeypatch):
+    """
+    Test expiry and transaction handling of the query cache.
+    
+    Verifies that:
+    - Entries expire after cache_ttl seconds
+    - A rolled back transaction does not leave its reads in the cache
+    """
+    import easedb.cache
+    
+    now = [1000.0]
+    monkeypatch.setattr(easedb.cache.time, 'monotonic', lambda: now[0])
+    cached_db.get('users', {'name': 'Alice'})
+    now[0] += 61
+    cached_db.get('users', {'name': 'Alice'})
+    assert cached_db.cache.stats()['hits'] == 0
+    
+    with pytest.raises(RuntimeError):
+        with cached_db.transaction():
+            cached_db.update('users', {'id': 1, 'age': 50})
+            assert cached_db.get('users', {'name': 'Alice'})['age'] == 50
+            raise RuntimeError("abort")
+    assert cached_db.get('users', {'name': 'Alice'})['age'] == 30
+
+def test_pragma_options(tmp_path):
+    """
+    Test SQLite pragmas set from the connection string.
+    
+    Verifies that:
+    - A preset's pragmas are applied to every new connection
+    - Explicit options override the preset
+    - Unknown options and invalid values are rejected
+    """
+    db = easedb.Database(f"sqlite:///{tmp_path / 'pragmas.db'}?preset=fast&busy_timeout=10000")
+    
+    with db:
+        connection = db.driver.connection
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert connection.execute("PRAGMA cache_size").fetchone()[0] == -65536
+        assert connection.execute("PRAGMA busy_timeout").fetchone()[0] == 10000
+    
+    with pytest.raises(ValueError):
+        easedb.Database(f"sqlite:///{tmp_path / 'pragmas.db'}?synchronous=sometimes")
+    with pytest.raises(ValueError):
+        easedb.Database(f"sqlite:///{tmp_path / 'pragmas.db'}?cache_size=-1;DROP TABLE users")
+    with pytest.raises(ValueError):
+        easedb.Database(f"sqlite:///{tmp_path / 'pragmas.db'}?preset=reckless")
+
+def test_get_page(file_db):
+    """
+    Test keyset pagination with get_page.
+    
+    Verifies that:
+    - Pages follow each other without gaps or duplicates
+    - The continuation token and the after dictionary are interchangeable
+    - The last page has no token
+    - Descending and multi-column orderings work with filters
+    """
+    file_db.set_many('users', [{'id': i, 'name': f'user{i}', 'age': 20 + i % 3} for i in range(3, 11)])
+    
+    seen = []
+    page = file_db.get_page('users', order_by='id', limit=3)
+    while True:
+        seen.extend(record['id'] for record in page)
+        if not page.has_more:
+            break
+        assert page.after == {'id': seen[-1]}
+        page = file_db.get_page('users', order_by='id', after=page.token, limit=3)
+    
+    assert seen == list(range(1, 11))
+    assert page.token is None
+    
+    page = file_db.get_page('users', order_by='id', after={'id': 8}, limit=5)
+    assert [record['id'] for record in page] == [9, 10]
+    
+    page = file_db.get_page('users', {'age': 21}, order_by='name DESC, id', limit=2)
+    assert [record['name'] for record in page] == ['user7', 'user4']
+    page = file_db.get_page('users', {'age': 21}, order_by='name DESC, id', after=page.token, limit=2)
+    assert [record['name'] for record in page] == ['user10']
+    
+    page = file_db.get_page('users', order_by=['id DESC'], limit=2, row_format='tuple')
+    assert [record[0] for record in page] == [10, 9]
+    
+    with pytest.raises(ValueError):
+        file_db.get_page('users', order_by='id', after={'name': 'x'})
+    with pytest.raises(ValueError):
+        file_db.get_page('users', order_by='id sideways')
+
+def test_columns_order_by_limit(file_db):
+    """
+    Test column projection, ORDER BY and LIMIT pushdown in get and get_all.
+    
+    Verifies that:
+    - Only the requested columns are returned
+    - Sorting and limiting happen in SQL, in every row format
+    - order_by decides which record get returns
+    - Invalid options raise ValueError
+    """
+    file_db.set('users', {'id': 3, 'name': 'Carol', 'age': 35})
+    
+    assert file_db.get_all('users', columns=['name'], order_by='age DESC', limit=2) == [
+        {'name': 'Carol'}, {'name': 'Alice'}]
+    assert file_db.get_all('users', columns=['id', 'age'], order_by=['age'], row_format='tuple') == [
+        (2, 25), (1, 30), (3, 35)]
+    assert file_db.get('users', {}, columns=['name'], order_by='age') == {'name': 'Bob'}
+    assert file_db.get('users', {'id': 1}, columns=['age']) == {'age': 30}
+    
+    compiled = compile_statement('sqlite', 'select', 'users', ('age',), columns=('id', 'name'), 
+                                 order_by=parse_order_by('name DESC'), limit=True)
+    assert compiled.sql == "SELECT `id`, `name` FROM `users` WHERE `age` = ? ORDER BY `name` DESC LIMIT ?"
+    
+    with pytest.raises(ValueError):
+        file_db.get_all('users', limit=0)
+    with pytest.raises(ValueError):
+        file_db.get_all('users', order_by='age; DROP TABLE users')
+
+def test_filter_operators(file_db):
+    """
+    Test operator conditions in query dictionaries.
+    
+    Verifies that:
+    - __ suffixes, ('op', value) tuples and {'op': value} dictionaries are compiled to SQL
+    - None and __is_null compile to IS NULL / IS NOT NULL
+    - update and delete accept the same conditions
+    - IN lists above SQLite's variable limit are split and merged, keeping order_by and limit
+    """
+    file_db.set('users', {'id': 3, 'name': None, 'age': 41})
+    
+    def ids(query, **options):
+        return [record['id'] for record in file_db.get_all('users', query, order_by='id', **options)]
+    
+    assert ids({'age__gte': 30}) == [1, 3]
+    assert ids({'age': ('<', 30)}) == [2]
+    assert ids({'age': {'>': 20, '<=': 30}}) == [1, 2]
+    assert ids({'id__in': [1, 3], 'age__ne': 41}) == [1]
+    assert ids({'id__not_in': [1]}) == [2, 3]
+    assert ids({'id__in': []}) == []
+    assert ids({'name': None}) == [3]
+    assert ids({'name__is_null': False}) == [1, 2]
+    assert ids({'name__like': 'A%'}) == [1]
+    assert file_db.get('users', {'age__lt': 30})['name'] == 'Bob'
+    
+    assert file_db.update('users', {'id__in': [1, 2], 'age': 50})
+    assert ids({'age': 50}) == [1, 2]
+    assert file_db.delete('users', {'name__is_null': True})
+    assert ids(None) == [1, 2]
+    
+    file_db.set_many('users', [{'id': i, 'name': f'user{i}', 'age': i % 7} for i in range(10, 2510)])
+    wanted = list(range(2509, 5, -1))
+    assert len(ids({'id__in': wanted})) == 2500
+    assert ids({'id__in': wanted, 'age__lt': 7}, limit=3) == [10, 11, 12]
+    records = file_db.get_all('users', {'id__in': wanted}, columns=['id'], order_by='age DESC, id DESC', limit=2)
+    assert records == [{'id': 2505}, {'id': 2498}]
+    assert file_db.get('users', {'id__in': wanted}, order_by='id DESC')['id'] == 2509
+    assert sum(1 for _ in file_db.iter_all('users', {'id__in': wanted})) == 2500
+    assert file_db.delete('users', {'id__in': wanted})
+    assert ids(None) == [1, 2]
+    
+    with pytest.raises(ValueError):
+        filters.query_shape({'age': ('~', 1)})
+    with pytest.raises(ValueError):
+        filters.query_shape({'id__in': 5})
+
+def test_get_many(file_db):
+    """
+    Test batched key lookups with get_many.
+    """
+    assert file_db.get_many('users', [2, 1, 99, 1]) == {
+        1: {'id': 1, 'name': 'Alice', 'age': 30},
+        2: {'id': 2, 'name': 'Bob', 'age': 25},
+    }
+    assert file_db.get_many('users', [1, 2], columns=['name']) == {1: {'name': 'Alice'}, 2: {'name': 'Bob'}}
+    assert file_db.get_many('users', ['Bob'], key='name', row_format='tuple') == {'Bob': (2, 'Bob', 25)}
+    assert file_db.get_many('users', []) == {}
+    
+    file_db.set_many('users', [{'id': i, 'name': f'user{i}', 'age': 40} for i in range(3, 2003)])
+    records = file_db.get_many('users', range(2, 2500), columns=['age'], chunk_size=1500)
+    assert len(records) == 2001
+    assert records[2] == {'age': 25} and records[2002] == {'age': 40}
+    
+    with pytest.raises(ValueError):
+        file_db.get_many('users', [1], chunk_size=0)
+    with pytest.raises(ValueError):
+        file_db.get_many('users', [1], row_format='columnar')
+
+def test_upsert(file_db):
+    """
+    Test upsert and upsert_many.
+    
+    Verifies that:
+    - A conflicting record is updated and a new one inserted
+    - update_columns limits the overwritten columns, [] keeps the record
+    - Other unique keys can be named as conflict_keys
+    """
+    assert file_db.upsert('users', {'id': 1, 'name': 'Alice', 'age': 31})
+    assert file_db.upsert('users', {'id': 3, 'name': 'Carol', 'age': 40})
+    assert file_db.upsert('users', {'id': 2, 'name': 'Robert', 'age': 26}, update_columns=['age'])
+    assert file_db.upsert('users', {'id': 3, 'name': 'Carol', 'age': 99}, update_columns=[])
+    assert file_db.get_all('users', row_format='tuple') == [(1, 'Alice', 31), (2, 'Bob', 26), (3, 'Carol', 40)]
+    
+    file_db.execute("CREATE UNIQUE INDEX users_name ON users (name)")
+    rows = ({'name': name, 'age': age} for name, age in [('Bob', 27), ('Dave', 50), ('Alice', 32)])
+    assert file_db.upsert_many('users', rows, conflict_keys='name', chunk_size=2) == 3
+    assert file_db.get_all('users', columns=['name', 'age'], order_by='name', row_format='tuple') == [
+        ('Alice', 32), ('Bob', 27), ('Carol', 40), ('Dave', 50)]
+    assert file_db.upsert_many('users', []) == 0
+    
+    with pytest.raises(ValueError):
+        file_db.upsert('users', {'name': 'Eve'}, update_columns=['age'])
+
+def test_update_many_delete_many(file_db):
+    """
+    Test bulk updates and deletes by key.
+    
+    Verifies that:
+    - Rows setting different columns are all applied and counted
+    - delete_many splits key lists above SQLite's variable limit
+    - A failing row rolls the whole batch back
+    """
+    file_db.set_many('users', [{'name': f'user{i}', 'age': 20} for i in range(3, 2003)])
+    
+    rows = [{'id': 1, 'age': 31}, {'id': 2, 'name': 'Robert', 'age': 26}, {'id': 99999, 'age': 1}]
+    assert file_db.update_many('users', rows) == 2
+    assert file_db.get_many('users', [1, 2], row_format='tuple') == {1: (1, 'Alice', 31), 2: (2, 'Robert', 26)}
+    assert file_db.update_many('users', ({'name': f'user{i}', 'age': 40} for i in range(3, 2003)), 
+                               key='name', chunk_size=500) == 2000
+    assert len(file_db.get_all('users', {'age': 40})) == 2000
+    
+    assert file_db.update_many('users', [{'id': 1, 'age': 50}, {'age': 60}]) == 0
+    assert file_db.get('users', {'id': 1})['age'] == 31
+    
+    assert file_db.delete_many('users', list(range(3, 2003)) + [3, 99999]) == 2000
+    assert file_db.delete_many('users', ['Robert'], key='name') == 1
+    assert file_db.get_all('users', columns=['name']) == [{'name': 'Alice'}]
+
+def test_count_exists(file_db):
+    """
+    Test count, approximate counts and exists.
+    
+    Verifies that:
+    - count and exists honour filters, including split IN lists
+    - approximate=True counts exactly before ANALYZE and reads sqlite_stat1 after it
+    """
+    file_db.set_many('users', [{'name': f'user{i}', 'age': i % 50} for i in range(3, 1503)])
+    
+    assert file_db.count('users') == 1502
+    assert file_db.count('users', {'age__gte': 25}) == 752
+    assert file_db.count('users', {'id__in': list(range(1000, 3000))}) == 503
+    assert file_db.exists('users', {'name': 'Bob'})
+    assert not file_db.exists('users', {'name': 'Nobody'})
+    assert file_db.exists('users', {'id__in': [99999] * 500 + list(range(2000, 1499, -1))})
+    
+    assert file_db.count('users', approximate=True) == 1502
+    file_db.execute("CREATE INDEX users_age ON users (age)")
+    file_db.execute("ANALYZE")
+    file_db.delete('users', {'id__gt': 1000})
+    assert file_db.count('users', approximate=True) == 1502
+    assert file_db.count('users') == 1000
+    
+    with pytest.raises(ValueError):
+        file_db.count('users', {'age': 1}, approximate=True)
+
+def test_aggregate(file_db):
+    """
+    Test aggregate pushdown.
+    
+    Verifies that:
+    - Aggregates over filtered records come back as one record
+    - group_by returns one sorted record per group in the requested row format
+    - Unknown functions and '*' outside count are rejected
+    """
+    file_db.set_many('users', [{'name': name, 'age': age} for name, age in [('Alice', 40), ('Carol', 35)]])
+    
+    assert file_db.aggregate('users', {'total': ('sum', 'age'), 'n': ('count', '*'), 'oldest': ('max', 'age')}) == {
+        'total': 130, 'n': 4, 'oldest': 40}
+    assert file_db.aggregate('users', {'n': 'count', 'average': ('avg', 'age')}, where={'age__lt': 40}) == {
+        'n': 3, 'average': 30.0}
+    assert file_db.aggregate('users', {'n': 'count', 'youngest': ('min', 'age')}, group_by='name') == [
+        {'name': 'Alice', 'n': 2, 'youngest': 30}, {'name': 'Bob', 'n': 1, 'youngest': 25}, 
+        {'name': 'Carol', 'n': 1, 'youngest': 35}]
+    result = file_db.aggregate('users', {'names': ('count_distinct', 'name')}, group_by=['age'], 
+                               where={'age__gte': 30}, row_format='tuple')
+    assert result == [(30, 1), (35, 1), (40, 1)]
+    
+    with pytest.raises(ValueError):
+        file_db.aggregate('users', {'x': ('median', 'age')})
+    with pytest.raises(ValueError):
+        file_db.aggregate('users', {'x': ('sum', '*')})
+    with pytest.raises(ValueError):
+        file_db.aggregate('users', {'n': 'count'}, row_format='columnar')
+
+def test_add_sub(file_db, tmp_path):
+    """
+    Test atomic add/sub and write-combining.
+    
+    Verifies that:
+    - add and sub change a column in place, missing queries or values are rejected
+    - Combined increments are summed per record and written by flush()
+    - A full buffer and disconnect() flush, transactions bypass the buffer
+    """
+    assert file_db.add('users', {'id': 1}, 5, column='age')
+    assert file_db.sub('users', {'name': 'Bob'}, 3, column='age')
+    assert [user['age'] for user in file_db.get_all('users', order_by='id')] == [35, 22]
+    with pytest.raises(ValueError):
+        file_db.add('users', {}, 1, column='age')
+    with pytest.raises(ValueError):
+        file_db.add('users', {'id': 1}, '1', column='age')
+    
+    database = easedb.Database(f"sqlite:///{tmp_path / 'test_combine.db'}", combine_window=60, combine_size=5)
+    database.create_table('pages', {'id': 'INTEGER', 'views': 'INTEGER', 'likes': 'INTEGER'})
+    database.set_many('pages', [{'views': 0, 'likes': 0} for _ in range(3)])
+    
+    with database:
+        for page in [1, 2, 1, 1]:
+            database.add('pages', {'id': page}, 1, column='views')
+        assert database.get('pages', {'id': 1})['views'] == 0
+        assert database.flush() == 2
+        assert [page['views'] for page in database.get_all('pages', order_by='id')] == [3, 1, 0]
+    
+        for _ in range(4):
+            database.add('pages', {'id': 3}, 2, column='likes')
+        database.sub('pages', {'id': 3}, 1, column='views')
+        assert database.get('pages', {'id': 3}) == {'id': 3, 'views': -1, 'likes': 8}
+        assert database.combiner.stats() == {'adds': 9, 'flushes': 2, 'records': 3, 'pending': 0}
+    
+        with database.transaction():
+            database.add('pages', {'id': 2}, 10, column='views')
+        database.add('pages', {'id__in': [1, 2]}, 1, column='likes')
+        database.add('pages', {'id': 2}, 1, column='likes')
+        assert len(database.combiner) == 1
+    assert database.get('pages', {'id': 2}) == {'id': 2, 'views': 11, 'likes': 2}
+
+def test_flush_failure_keeps_increments(tmp_path):
+    """
+    Test that increments of a failed flush are not lost.
+    
+    Verifies that:
+    - A rolled back flush keeps the table's increments buffered
+    - The next flush writes them merged with the increments added since
+    """
+    database = easedb.Database(f"sqlite:///{tmp_path / 'test_combine.db'}", combine_window=60)
+    with database:
+        database.add('pages', {'id': 1}, 2, column='views')
+        assert database.flush() == 0
+        assert len(database.combiner) == 1
+        
+        database.create_table('pages', {'id': 'INTEGER', 'views': 'INTEGER'})
+        database.set('pages', {'views': 0})
+        database.add('pages', {'id': 1}, 3, column='views')
+        assert database.flush() == 1
+        assert database.get('pages', {'id': 1})['views'] == 5
+        assert database.combiner.stats() == {'adds': 2, 'flushes': 2, 'records': 1, 'pending': 0}
+
+def test_flush_on_collect_and_exit(tmp_path):
+    """
+    Test that increments outside a session are written when the Database goes away.
+    
+    Verifies that:
+    - A lone increment within the window stays buffered without a session
+    - Dropping the last reference to the Database writes it
+    - The same finalizer runs at interpreter exit, an empty buffer opens no connection
+    """
+    url = f"sqlite:///{tmp_path / 'test_combine.db'}"
+    database = easedb.Database(url, combine_window=60)
+    database.create_table('pages', {'id': 'INTEGER', 'views': 'INTEGER'})
+    database.set('pages', {'views': 0})
+    
+    database.add('pages', {'id': 1}, 1, column='views')
+    assert database.get('pages', {'id': 1})['views'] == 0
+    del database
+    gc.collect()
+    reader = easedb.Database(url)
+    assert reader.get('pages', {'id': 1})['views'] == 1
+    
+    database = easedb.Database(url, combine_window=60)
+    database.add('pages', {'id': 1}, 2, column='views')
+    assert database._finalizer.atexit
+    database._finalizer()
+    assert reader.get('pages', {'id': 1})['views'] == 3
+    assert database.combiner.stats()['flushes'] == 1
+    
+    idle = easedb.Database(url, combine_window=60)
+    idle._finalizer()
+    assert idle.combiner.stats()['flushes'] == 0 and idle.driver.connection is None
+
+def test_import_file(file_db, tmp_path):
+    """
+    Test streaming CSV and JSON Lines imports.
+    
+    Verifies that:
+    - CSV rows are inserted in chunks with progress reports, optionally only some columns
+    - JSON Lines objects are imported, the format is taken from the extension
+    - Unknown formats, missing files and missing columns are rejected
+    """
+    csv_path = tmp_path / 'users.csv'
+    csv_path.write_text('name,age,city\nCarol,35,Pécs\n"Smith, Dan",41,Győr\nEve,22,Eger\n', encoding='utf-8')
+    reports = []
+    
+    assert file_db.import_file('users', str(csv_path), chunk_size=2, columns=['name', 'age'], 
+                               progress=lambda rows, rate: reports.append((rows, rate > 0))) == 3
+    assert reports == [(2, True), (3, True)]
+    assert file_db.get('users', {'name': 'Smith, Dan'}, columns=['age']) == {'age': 41}
+    
+    jsonl_path = tmp_path / 'users.jsonl'
+    jsonl_path.write_text('{"name": "Frank", "age": 50}\n\n{"name": "Grace"}\n', encoding='utf-8')
+    assert file_db.import_file('users', str(jsonl_path)) == 2
+    assert file_db.get_all('users', {'id__gt': 5}, columns=['name', 'age']) == [
+        {'name': 'Frank', 'age': 50}, {'name': 'Grace', 'age': None}]
+    
+    with pytest.raises(ValueError):
+        file_db.import_file('users', str(tmp_path / 'users.xml'))
+    with pytest.raises(FileNotFoundError):
+        file_db.import_file('users', str(tmp_path / 'missing.csv'))
+    with pytest.raises(ValueError):
+        file_db.import_file('users', str(csv_path), columns=['name', 'email'])
+
+def test_import_file_quoted_headers(file_db, tmp_path):
+    """
+    Test imports of files whose headers need quoting.
+    
+    Verifies that:
+    - CSV and JSON Lines headers with spaces and reserved words are imported
+    """
+    file_db.create_table('orders', {'id': 'INTEGER', 'first name': 'TEXT', 'order': 'INTEGER'})
+    csv_path = tmp_path / 'orders.csv'
+    csv_path.write_text('first name,order\nAlice,1\nBob,2\n', encoding='utf-8')
+    assert file_db.import_file('orders', str(csv_path)) == 2
+    
+    jsonl_path = tmp_path / 'orders.jsonl'
+    jsonl_path.write_text('{"first name": "Carol", "order": 3}\n', encoding='utf-8')
+    assert file_db.import_file('orders', str(jsonl_path)) == 1
+    assert file_db.get_all('orders', columns=['first name', 'order'], order_by='order') == [
+        {'first name': 'Alice', 'order': 1}, {'first name': 'Bob', 'order': 2}, 
+        {'first name': 'Carol', 'order': 3}]
+
+def test_import_file_nulls(file_db, tmp_path):
+    """
+    Test that CSV exports and imports round-trip NULLs.
+    
+    Verifies that:
+    - Empty CSV fields are imported as NULL in text and integer columns
+    - null= picks another NULL marker, None keeps empty fields as strings
+    """
+    file_db.set('users', {'name': None, 'age': None})
+    csv_path = tmp_path / 'users.csv'
+    assert file_db.export('users', str(csv_path)) == 3
+    file_db.create_table('copies', {'id': 'INTEGER', 'name': 'TEXT', 'age': 'INTEGER'})
+    assert file_db.import_file('copies', str(csv_path)) == 3
+    assert file_db.get_all('copies', order_by='id') == file_db.get_all('users', order_by='id')
+    assert file_db.execute('SELECT typeof(name) AS name, typeof(age) AS age FROM copies WHERE id = 3') == [
+        {'name': 'null', 'age': 'null'}]
+    
+    marked_path = tmp_path / 'marked.csv'
+    marked_path.write_text('id,name,age\n4,,NA\n', encoding='utf-8')
+    assert file_db.import_file('copies', str(marked_path), null='NA') == 1
+    assert file_db.get('copies', {'id': 4}) == {'id': 4, 'name': '', 'age': None}
+    assert file_db.import_file('copies', str(csv_path), columns=['name'], null=None) == 3
+    assert file_db.count('copies', {'name': ''}) == 2
+
+def test_export(file_db, tmp_path):
+    """
+    Test streaming exports of tables and queries.
+    
+    Verifies that:
+    - A table is written batch by batch to CSV with a header, and re-imports unchanged
+    - A SELECT statement with parameters is written to JSON Lines, an empty result to a header only
+    - Unknown formats and filters on SQL statements are rejected
+    """
+    file_db.set_many('users', [{'name': f'user{i}', 'age': None if i == 2 else i} for i in range(5)])
+    
+    csv_path = tmp_path / 'users.csv'
+    assert file_db.export('users', str(csv_path), batch_size=2, query={'id__gt': 2}) == 5
+    lines = csv_path.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == 'id,name,age' and lines[1] == '3,user0,0' and lines[3] == '5,user2,'
+    
+    jsonl_path = tmp_path / 'ages.jsonl'
+    assert file_db.export('SELECT name, age FROM users WHERE age >= ? ORDER BY age', str(jsonl_path), 
+                          params=(25,)) == 2
+    assert jsonl_path.read_text(encoding='utf-8') == ('{"name": "Bob", "age": 25}\n'
+                                                      '{"name": "Alice", "age": 30}\n')
+    
+    assert file_db.export('users', str(tmp_path / 'none.csv'), query={'age': 99}) == 0
+    assert (tmp_path / 'none.csv').read_text(encoding='utf-8').splitlines() == ['id,name,age']
+    
+    with pytest.raises(ValueError):
+        file_db.export('users', str(tmp_path / 'users.xml'))
+    with pytest.raises(ValueError):
+        file_db.export('SELECT * FROM users', str(jsonl_path), query={'id': 1})
+
+
+def test_export_parquet(file_db, tmp_path):
+    """
+    Test Parquet exports, which require pyarrow.
+    
+    Verifies that:
+    - Column types come from the batches where a column is not NULL
+    - A later batch with a wider type promotes the column, e.g. int64 to double
+    - An empty result still writes the columns, a failed export leaves no file
+    """
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+    file_db.set_many('users', [{'name': f'user{i}', 'age': None} for i in range(3)])
+    
+    path = tmp_path / 'users.parquet'
+    assert file_db.export('SELECT * FROM users ORDER BY age IS NULL DESC, id', str(path), batch_size=2) == 5
+    table = pyarrow_parquet.read_table(str(path))
+    assert table.column_names == ['id', 'name', 'age']
+    assert table.column('age').to_pylist() == [None, None, None, 30, 25]
+    
+    assert file_db.export('users', str(path), query={'id': 99}) == 0
+    assert pyarrow_parquet.read_table(str(path)).column_names == ['id', 'name', 'age']
+    
+    file_db.create_table('prices', {'id': 'INTEGER', 'price': 'NUMERIC'})
+    file_db.set_many('prices', [{'price': price} for price in (None, 1, 2, 1.5, 'n/a')])
+    assert file_db.export('prices', str(path), batch_size=1, query={'id__lt': 5}) == 4
+    table = pyarrow_parquet.read_table(str(path))
+    assert str(table.schema.field('price').type) == 'double'
+    assert table.column('price').to_pylist() == [None, 1.0, 2.0, 1.5]
+    
+    # A text value cannot be cast to double
+    with pytest.raises(pytest.importorskip('pyarrow').ArrowException):
+        file_db.export('prices', str(tmp_path / 'broken.parquet'), batch_size=1)
+    assert not (tmp_path / 'broken.parquet').exists()
+
+
+def test_fetch_columns(file_db):
+    """
+    Test columnar fetches into NumPy arrays and Arrow tables.
+    
+    Verifies that:
+    - Tables and SELECT statements become one typed array per column, across batches
+    - Arrow columns keep NULLs and take the type all non-NULL batches promote to
+    - Unknown formats are rejected
+    """
+    numpy = pytest.importorskip('numpy')
+    columns = file_db.fetch_columns('users', batch_size=1)
+    assert list(columns) == ['id', 'name', 'age']
+    assert columns['age'].dtype.kind == 'i' and columns['age'].tolist() == [30, 25]
+    assert columns['name'].tolist() == ['Alice', 'Bob']
+    
+    columns = file_db.fetch_columns('SELECT age * 1.5 AS scaled FROM users WHERE age > ?', params=(26,))
+    assert columns['scaled'].dtype == numpy.float64 and columns['scaled'].tolist() == [45.0]
+    assert file_db.fetch_columns('users', query={'id': 99})['age'].size == 0
+    
+    pytest.importorskip('pyarrow')
+    file_db.set('users', {'name': 'Carol', 'age': None})
+    table = file_db.fetch_columns('SELECT * FROM users ORDER BY age IS NULL DESC, id', 
+                                  format='arrow', batch_size=1)
+    assert table.column_names == ['id', 'name', 'age']
+    assert str(table.schema.field('age').type) == 'int64'
+    assert table.column('age').to_pylist() == [None, 30, 25]
+    
+    file_db.create_table('prices', {'id': 'INTEGER', 'price': 'NUMERIC'})
+    file_db.set_many('prices', [{'price': price} for price in (None, 1, 1.5, 2)])
+    table = file_db.fetch_columns('prices', format='arrow', batch_size=1)
+    assert str(table.schema.field('price').type) == 'double'
+    assert table.column('price').to_pylist() == [None, 1.0, 1.5, 2.0]
+    
+    with pytest.raises(ValueError):
+        file_db.fetch_columns('users', format='pandas')
+
+
+def test_lazy_backend_imports(tmp_path):
+    """
+    Test that backends are only imported on first use.
+    
+    Verifies that:
+    - import easedb loads neither mysql.connector, aiomysql nor aiosqlite
+    - A SQLite round trip with the synchronous facade still loads none of them
+    """
+    import subprocess
+    
+    script = (
+        "import sys\n"
+        "import easedb\n"
+        "backends = ('mysql.connector', 'aiomysql', 'aiosqlite')\n"
+        "assert not [name for name in backends if name in sys.modules], sys.modules.keys()\n"
+        f"db = easedb.Database({'sqlite:///' + str(tmp_path / 'lazy.db')!r})\n"
+        "db.create_table('users', {'id': 'INTEGER', 'name': 'TEXT'})\n"
+        "db.set('users', {'id': 1, 'name': 'Alice'})\n"
+        "assert db.get('users', {'id': 1})['name'] == 'Alice'\n"
+        "print([name for name in backends if name in sys.modules])\n"
+    )
+    source_root = os.path.dirname(os.path.dirname(easedb.__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [source_root, os.environ.get('PYTHONPATH')])))
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '[]'